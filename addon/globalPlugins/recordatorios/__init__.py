@@ -0,0 +1,619 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+
+from datetime import datetime
+import wx
+import addonHandler
+addonHandler.initTranslation()
+
+
+
+import ui
+import gui
+import globalPluginHandler
+import scriptHandler
+import config
+import globalVars
+from gui import settingsDialogs
+from .adapters import NVDANotifier, create_metrics_exporter, create_store, load_settings, sound_cache
+from .core import MISSED_REMINDERS_POLICIES, STORAGE_BACKENDS, ReminderManager, describe_metrics
+from .timeformat import format_time_remaining
+from .views import ActiveRemindersView
+# Variables "constantes" para evitar errores
+DELETE_REMINDER_MESSAGE = _("Selecciona el recordatorio que deseas eliminar:")
+DELETE_REMINDER_TITLE = _("Eliminar recordatorio")
+REMINDER_DELETED_MESSAGE = _("El recordatorio '{}' ha sido eliminado.")
+REMINDER_DELETED_TITLE = _("Recordatorio eliminado")
+
+# Nuevas variables "constantes" para reprogramar recordatorios
+RESCHEDULE_REMINDER_MESSAGE = _("Selecciona el recordatorio que deseas reprogramar:")
+RESCHEDULE_REMINDER_TITLE = _("Reprogramar recordatorio")
+REMINDER_RESCHEDULED_MESSAGE = _("El recordatorio '{}' ha sido reprogramado para el {date} a las {time}.")
+REMINDER_RESCHEDULED_TITLE = _("Recordatorio reprogramado")
+NO_REMINDERS_TO_RESCHEDULE_MESSAGE = _("No hay recordatorios para reprogramar.")
+
+# Nuevas variables "constantes" para la funcionalidad de tareas
+MANAGE_TASKS_MESSAGE = _("Selecciona el recordatorio cuyas tareas deseas gestionar:")
+MANAGE_TASKS_TITLE = _("Gestionar Tareas del Recordatorio")
+NO_REMINDERS_WITH_TASKS_MESSAGE = _("No hay recordatorios con tareas para gestionar.")
+UPDATE_TASKS_MESSAGE = _("Tareas actualizadas correctamente.")
+
+# Variables "constantes" para las operaciones sobre varios recordatorios a la vez
+SNOOZE_REMINDERS_MESSAGE = _("Selecciona los recordatorios que deseas posponer:")
+SNOOZE_REMINDERS_TITLE = _("Posponer recordatorios")
+NO_REMINDERS_TO_SNOOZE_MESSAGE = _("No hay recordatorios para posponer.")
+COMPLETE_TASKS_MESSAGE = _("Selecciona los recordatorios cuyas tareas deseas marcar como completadas:")
+COMPLETE_TASKS_TITLE = _("Completar tareas")
+NO_REMINDERS_WITH_PENDING_TASKS_MESSAGE = _("No hay recordatorios con tareas pendientes.")
+
+# Filtro de los diálogos para exportar e importar recordatorios.
+#Translators: Tipo de archivo en los diálogos para exportar e importar recordatorios.
+REMINDERS_FILE_WILDCARD = _("Recordatorios (*.json)|*.json")
+
+# Títulos de las ventanas de las páginas de la vista de recordatorios activos.
+ACTIVE_VIEW_TITLES = {
+	#Translators: título de la ventana para los recordatorios activos de hoy.
+	"today": _("Recordatorios activos: hoy"),
+	#Translators: título de la ventana para los recordatorios activos del resto de la semana.
+	"week": _("Recordatorios activos: esta semana"),
+	#Translators: título de la ventana para los recordatorios activos a partir de la semana próxima.
+	"later": _("Recordatorios activos: más adelante"),
+}
+
+# Especificación de la configuración del complemento.
+# Se registra al importar el módulo porque ReminderManager la consulta al crearse para elegir el almacén.
+config.conf.spec['remindersConfig'] = {
+	"numberOfTimesToNotifyReminder": "integer(default=1)",
+	"notificationInterval": "integer(default=10)",
+	"storageBackend": 'option("json", "binary", "sqlite", default="json")',
+	"missedRemindersPolicy": 'option("once", "summary", "skip", default="once")',
+	"exportMetrics": "boolean(default=False)"
+}
+
+# Valores que se ofrecen para el número de notificaciones y los segundos entre ellas,
+# tanto en el panel de configuración como en los avisos propios de cada recordatorio.
+NOTIFICATION_REPETITION_CHOICES = ["1", "2", "3", "4"]
+NOTIFICATION_INTERVAL_CHOICES = ["5", "10", "20", "40", "60"]
+
+
+def disableInSecureMode(decoratedCls):
+	if globalVars.appArgs.secure:
+		return globalPluginHandler.GlobalPlugin
+	return decoratedCls
+
+
+@disableInSecureMode
+class GlobalPlugin(globalPluginHandler.GlobalPlugin):
+	def __init__(self):
+		super().__init__()
+		self.active_view = ActiveRemindersView(format_time_remaining)
+		# La carga de los recordatorios y su verificación ocurren en segundo plano, sin retrasar el inicio de NVDA.
+		reminder_manager.start()
+
+		settingsDialogs.NVDASettingsDialog.categoryClasses.append(remindersConfigPanel)
+		# Cada perfil de configuración puede tener sus propios ajustes de notificación.
+		config.post_configProfileSwitch.register(self.on_config_profile_switch)
+		self.add_to_tools_menu()
+
+	def terminate(self, *args, **kwargs):
+		super().terminate(*args, **kwargs)
+		settingsDialogs.NVDASettingsDialog.categoryClasses.remove(remindersConfigPanel)
+		config.post_configProfileSwitch.unregister(self.on_config_profile_switch)
+		# Detenemos los hilos y escribimos en disco los cambios pendientes antes de salir.
+		reminder_manager.stop()
+
+	def on_config_profile_switch(self):
+		"""
+		Método que actualiza los ajustes del complemento cuando NVDA cambia de perfil de configuración.
+		"""
+		reminder_manager.reload_settings()
+
+	def add_to_tools_menu(self):
+		"""
+		Añade un submenú 'Recordatorios' con las siguientes opciones:
+		Añadir Recordatorio, Ver Recordatorios Activos y eliminar recordatorios
+		al menú de herramientas.
+		"""
+		
+		# Obtener el menú de herramientas.
+		toolsMenu = gui.mainFrame.sysTrayIcon.toolsMenu
+
+		# Crear el submenú de Recordatorios.
+		remindersSubMenu = wx.Menu()
+
+		# Crear los ítems del submenú.
+		#Translators: Etiqueta para el item de menú añadir recordatorio.
+		addReminderMenuItem = wx.MenuItem(remindersSubMenu, wx.ID_ANY, _("Añadir Recordatorio"))
+		# Submenú con las páginas de la vista de recordatorios activos.
+		viewRemindersSubMenu = wx.Menu()
+		#Translators: Etiquetas para los items del submenú ver recordatorios activos.
+		viewTodayMenuItem = viewRemindersSubMenu.Append(wx.ID_ANY, _("&Hoy"))
+		viewWeekMenuItem = viewRemindersSubMenu.Append(wx.ID_ANY, _("Esta &semana"))
+		viewLaterMenuItem = viewRemindersSubMenu.Append(wx.ID_ANY, _("Más &adelante"))
+		#Translators: Etiqueta para el item de menú eliminar recordatorio.
+		deleteReminderMenuItem = wx.MenuItem(remindersSubMenu, wx.ID_ANY, _("Eliminar Recordatorio"))
+		#Translators: Etiqueta para el item de menú reprogramar recordatorio.
+		rescheduleReminderMenuItem = wx.MenuItem(remindersSubMenu, wx.ID_ANY, _("Reprogramar Recordatorio"))
+		#Translators: Etiqueta para el item de menú gestionar tareas.
+		manageTasksMenuItem = wx.MenuItem(remindersSubMenu, wx.ID_ANY, _("Gestionar Tareas"))
+		#Translators: Etiqueta para el item de menú posponer recordatorios.
+		snoozeRemindersMenuItem = wx.MenuItem(remindersSubMenu, wx.ID_ANY, _("Posponer Recordatorios"))
+		#Translators: Etiqueta para el item de menú completar tareas.
+		completeTasksMenuItem = wx.MenuItem(remindersSubMenu, wx.ID_ANY, _("Completar Tareas"))
+		#Translators: Etiqueta para el item de menú exportar recordatorios.
+		exportRemindersMenuItem = wx.MenuItem(remindersSubMenu, wx.ID_ANY, _("Exportar Recordatorios..."))
+		#Translators: Etiqueta para el item de menú importar recordatorios.
+		importRemindersMenuItem = wx.MenuItem(remindersSubMenu, wx.ID_ANY, _("Importar Recordatorios..."))
+
+
+		# Añadir los ítems al submenú.
+		remindersSubMenu.Append(addReminderMenuItem)
+		#Translators: Etiqueta para el submenú ver recordatorios activos.
+		remindersSubMenu.AppendSubMenu(viewRemindersSubMenu, _("Ver Recordatorios Activos"))
+		remindersSubMenu.Append(deleteReminderMenuItem)
+		remindersSubMenu.Append(rescheduleReminderMenuItem)
+		remindersSubMenu.Append(manageTasksMenuItem)
+		remindersSubMenu.Append(snoozeRemindersMenuItem)
+		remindersSubMenu.Append(completeTasksMenuItem)
+		remindersSubMenu.Append(exportRemindersMenuItem)
+		remindersSubMenu.Append(importRemindersMenuItem)
+
+
+		# Añadir el submenú de Recordatorios al menú de herramientas.
+		#Translators: Nombre para el submenú.
+		toolsMenu.AppendSubMenu(remindersSubMenu, _("&Recordatorios"))
+
+		# Vincular los eventos de clic a los nuevos ítems.
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.open_reminder_window, addReminderMenuItem)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, lambda event: self.check_active_reminders(event, "today"), viewTodayMenuItem)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, lambda event: self.check_active_reminders(event, "week"), viewWeekMenuItem)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, lambda event: self.check_active_reminders(event, "later"), viewLaterMenuItem)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.delete_reminder, deleteReminderMenuItem)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.reschedule_reminder, rescheduleReminderMenuItem)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.manage_tasks, manageTasksMenuItem)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.snooze_reminders, snoozeRemindersMenuItem)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.complete_tasks, completeTasksMenuItem)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.export_reminders, exportRemindersMenuItem)
+		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.import_reminders, importRemindersMenuItem)
+
+
+	def open_reminder_window(self, event):
+		"""
+		Abre la ventana principal de recordatorios para añadir uno nuevo.
+		"""
+		# Las ventanas están en dialogs.py, que se carga la primera vez que se abre una.
+		from .dialogs import ReminderApp
+		if not hasattr(self, 'frame') or not self.frame:
+			self.frame = ReminderApp(None)
+		elif not self.frame.IsShown():
+			self.frame = ReminderApp(None)
+		self.frame.Show()
+
+	def format_time_remaining(self, future_datetime, now=None):
+		"""
+		Formatea el tiempo restante hasta una fecha y hora futuras de manera legible.
+		Se conserva por compatibilidad; el trabajo lo hace timeformat.format_time_remaining.
+		"""
+		return format_time_remaining(future_datetime, now)
+
+	def check_active_reminders(self, event, section="today"):
+		"""
+		Muestra una página de los recordatorios activos en una ventana, incluyendo el tiempo restante y las tareas.
+		Args:
+			section (str): La página a mostrar: today (hoy), week (resto de la semana) o later (más adelante).
+		"""
+		# Tomamos una sola instantánea de la lista; el planificador puede modificarla mientras tanto.
+		reminders = reminder_manager.reminders
+		if reminders:
+			reminders_html, counts = self.active_view.render(reminders, section, datetime.now())
+			if reminders_html is not None:
+				ui.browseableMessage(reminders_html, ACTIVE_VIEW_TITLES[section], isHtml=True)
+			else:
+				#Translators: Mensaje que indica que la página elegida de recordatorios activos está vacía, con el número de recordatorios de cada página.
+				ui.message(_("No hay recordatorios en esta página. Hoy: {today}. Esta semana: {week}. Más adelante: {later}.").format(**counts))
+		else:
+			#Translators: Mensaje que le indica al usuario que no hay recordatorios activos.
+			ui.message(_("No hay recordatorios activos."))
+
+	def delete_reminder(self, event):
+		"""
+		Permite eliminar un recordatorio activo a través de un diálogo de selección.
+		"""
+		from .dialogs import ReminderPickerDialog
+		reminders = reminder_manager.reminders
+		if reminders:
+			# La lista es virtual: abrirla no cuesta más con miles de recordatorios.
+			#Translators: Mensaje y título del diálogo para eliminar recordatorios.
+			dlg = ReminderPickerDialog(None, DELETE_REMINDER_TITLE, DELETE_REMINDER_MESSAGE, reminders, multiple=True)
+
+			if dlg.ShowModal() == wx.ID_OK:
+				try:
+					# Obtener el recordatorio seleccionado en la lista y eliminarlo por su identificador,
+					# así no importa si la lista cambió mientras el diálogo estaba abierto.
+					selected = dlg.get_selected_reminders()
+					removed_reminder = reminder_manager.delete_reminder(selected[0].id) if len(selected) == 1 else None
+					if len(selected) > 1:
+						# Varios recordatorios: una sola operación, una sola escritura y un solo mensaje.
+						removed = reminder_manager.bulk_delete([reminder.id for reminder in selected])
+						#Translators: Mensaje que indica cuántos recordatorios se eliminaron.
+						ui.message(ngettext("Se eliminó {} recordatorio.", "Se eliminaron {} recordatorios.", len(removed)).format(len(removed)))
+					elif removed_reminder is not None:
+						# Notificar al usuario que el recordatorio fue eliminado.
+						#Mensaje y título de ventana que indican al usuario que el recordatorio ha sido eliminado.
+						gui.messageBox(
+							REMINDER_DELETED_MESSAGE.format(removed_reminder.message),
+							REMINDER_DELETED_TITLE
+						)
+					else:
+						#Translators: Mensaje y título de ventana que le indican al usuario que el recordatorio seleccionado ya no existe.
+						gui.messageBox(
+							_("El recordatorio seleccionado ya no existe."), 
+							_("Error"), 
+							wx.ICON_ERROR
+						)
+				except Exception as e:
+					#Translators: mensaje y título de ventana que le indican al usuario que ha ocurrido un error al intentar eliminar el recordatorio.
+					gui.messageBox(
+						_("Ocurrió un error al intentar eliminar el recordatorio:\n\n{}").format(str(e)), 
+						_("Error"), 
+						wx.ICON_ERROR
+					)
+			dlg.Destroy()
+		else:
+			#Translators: Mensaje que le indica al usuario que no hay recordatorios para poder eliminar.
+			ui.message(_("No hay recordatorios para eliminar."))
+
+	def reschedule_reminder(self, event):
+		"""
+		Permite reprogramar un recordatorio activo a través de un diálogo de selección.
+		"""
+		from .dialogs import ReminderPickerDialog, RescheduleReminderDialog
+		reminders = reminder_manager.reminders
+		if reminders:
+			dlg = ReminderPickerDialog(None, RESCHEDULE_REMINDER_TITLE, RESCHEDULE_REMINDER_MESSAGE, reminders, multiple=True)
+
+			if dlg.ShowModal() == wx.ID_OK:
+				try:
+					selected = dlg.get_selected_reminders()
+					original_reminder = selected[0] if len(selected) == 1 else None
+					if len(selected) > 1:
+						self.reschedule_several(selected)
+					elif original_reminder is not None and reminder_manager.get_reminder(original_reminder.id) is original_reminder:
+						original_message = original_reminder.message
+
+						# Abrir una nueva ventana para obtener la nueva fecha y hora
+						reschedule_dlg = RescheduleReminderDialog(None, original_message)
+						if reschedule_dlg.ShowModal() == wx.ID_OK:
+							new_reminder_time = reschedule_dlg.get_reminder_time()
+
+							if new_reminder_time < datetime.now():
+								wx.MessageBox(_("La nueva fecha y hora seleccionadas están en el pasado. Por favor, selecciona una fecha y hora futura."), _("Error"), wx.ICON_ERROR)
+							else:
+								if reminder_manager.update_reminder(original_reminder.id, reminder_time=new_reminder_time):
+									gui.messageBox(
+										REMINDER_RESCHEDULED_MESSAGE.format(
+											original_message, 
+											date=new_reminder_time.strftime('%d/%m/%Y'), 
+											time=new_reminder_time.strftime('%H:%M')
+										),
+										REMINDER_RESCHEDULED_TITLE
+									)
+								else:
+									gui.messageBox(
+										_("Ocurrió un error al intentar reprogramar el recordatorio."), 
+										_("Error"), 
+										wx.ICON_ERROR
+									)
+						reschedule_dlg.Destroy()
+					else:
+						gui.messageBox(
+							_("El recordatorio seleccionado ya no existe."), 
+							_("Error"), 
+							wx.ICON_ERROR
+						)
+				except Exception as e:
+					gui.messageBox(
+						_("Ocurrió un error al intentar reprogramar el recordatorio:\n\n{}").format(str(e)), 
+						_("Error"), 
+						wx.ICON_ERROR
+					)
+			dlg.Destroy()
+		else:
+			ui.message(NO_REMINDERS_TO_RESCHEDULE_MESSAGE)
+
+	def reschedule_several(self, reminders):
+		"""
+		Reprograma varios recordatorios a la misma fecha y hora, con una sola operación.
+		Args:
+			reminders (list): Los recordatorios elegidos en el diálogo de selección.
+		"""
+		from .dialogs import RescheduleReminderDialog
+		#Translators: Título del diálogo para reprogramar varios recordatorios a la vez.
+		reschedule_dlg = RescheduleReminderDialog(None, ngettext("{} recordatorio", "{} recordatorios", len(reminders)).format(len(reminders)))
+		if reschedule_dlg.ShowModal() == wx.ID_OK:
+			new_reminder_time = reschedule_dlg.get_reminder_time()
+			if new_reminder_time < datetime.now():
+				wx.MessageBox(_("La nueva fecha y hora seleccionadas están en el pasado. Por favor, selecciona una fecha y hora futura."), _("Error"), wx.ICON_ERROR)
+			else:
+				updated = reminder_manager.bulk_update([reminder.id for reminder in reminders], reminder_time=new_reminder_time)
+				#Translators: Mensaje que indica cuántos recordatorios se reprogramaron y para cuándo.
+				ui.message(ngettext(
+					"Se reprogramó {count} recordatorio para el {date} a las {time}.",
+					"Se reprogramaron {count} recordatorios para el {date} a las {time}.",
+					len(updated)
+				).format(count=len(updated), date=new_reminder_time.strftime('%d/%m/%Y'), time=new_reminder_time.strftime('%H:%M')))
+		reschedule_dlg.Destroy()
+
+	def snooze_reminders(self, event):
+		"""
+		Permite posponer varios recordatorios a la vez los mismos minutos.
+		"""
+		from .dialogs import ReminderPickerDialog, SnoozeDialog
+		reminders = reminder_manager.reminders
+		if not reminders:
+			ui.message(NO_REMINDERS_TO_SNOOZE_MESSAGE)
+			return
+		dlg = ReminderPickerDialog(None, SNOOZE_REMINDERS_TITLE, SNOOZE_REMINDERS_MESSAGE, reminders, multiple=True)
+		if dlg.ShowModal() == wx.ID_OK and dlg.get_selected_reminders():
+			selected = dlg.get_selected_reminders()
+			snooze_dialog = SnoozeDialog(None)
+			if snooze_dialog.ShowModal() == wx.ID_OK:
+				minutes = snooze_dialog.get_minutes()
+				snoozed = reminder_manager.bulk_snooze([reminder.id for reminder in selected], minutes)
+				#Translators: Mensaje que indica cuántos recordatorios se pospusieron y por cuántos minutos.
+				ui.message(ngettext(
+					"Se pospuso {count} recordatorio por {minutes} minutos.",
+					"Se pospusieron {count} recordatorios por {minutes} minutos.",
+					len(snoozed)
+				).format(count=len(snoozed), minutes=minutes))
+			snooze_dialog.Destroy()
+		dlg.Destroy()
+
+	def complete_tasks(self, event):
+		"""
+		Permite marcar como completadas todas las tareas de uno o varios recordatorios a la vez.
+		"""
+		from .dialogs import ReminderPickerDialog
+		reminders = [reminder for reminder in reminder_manager.reminders if reminder.has_incomplete_tasks]
+		if not reminders:
+			ui.message(NO_REMINDERS_WITH_PENDING_TASKS_MESSAGE)
+			return
+		dlg = ReminderPickerDialog(None, COMPLETE_TASKS_TITLE, COMPLETE_TASKS_MESSAGE, reminders, multiple=True)
+		if dlg.ShowModal() == wx.ID_OK and dlg.get_selected_reminders():
+			updated = reminder_manager.bulk_complete_tasks([reminder.id for reminder in dlg.get_selected_reminders()])
+			#Translators: Mensaje que indica de cuántos recordatorios se completaron las tareas.
+			ui.message(ngettext(
+				"Se completaron las tareas de {} recordatorio.",
+				"Se completaron las tareas de {} recordatorios.",
+				len(updated)
+			).format(len(updated)))
+		dlg.Destroy()
+
+	def export_reminders(self, event):
+		"""
+		Guarda todos los recordatorios en un archivo JSON elegido por el usuario, para copiarlos a otro equipo.
+		"""
+		#Translators: Título del diálogo para elegir dónde exportar los recordatorios.
+		with wx.FileDialog(gui.mainFrame, _("Exportar recordatorios"), defaultFile="recordatorios.json", wildcard=REMINDERS_FILE_WILDCARD, style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as dialog:
+			if dialog.ShowModal() != wx.ID_OK:
+				return
+			path = dialog.GetPath()
+		try:
+			count = reminder_manager.export_reminders(path)
+		except OSError:
+			gui.messageBox(_("No se pudo guardar el archivo de recordatorios."), _("Error"), wx.ICON_ERROR)
+			return
+		#Translators: Mensaje que indica cuántos recordatorios se exportaron.
+		ui.message(ngettext("Se exportó {} recordatorio.", "Se exportaron {} recordatorios.", count).format(count))
+
+	def import_reminders(self, event):
+		"""
+		Añade los recordatorios de un archivo JSON exportado; se omiten los que ya existen con el mismo nombre.
+		"""
+		#Translators: Título del diálogo para elegir el archivo de recordatorios a importar.
+		with wx.FileDialog(gui.mainFrame, _("Importar recordatorios"), wildcard=REMINDERS_FILE_WILDCARD, style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as dialog:
+			if dialog.ShowModal() != wx.ID_OK:
+				return
+			path = dialog.GetPath()
+		try:
+			imported = reminder_manager.import_reminders(path)
+		except (OSError, ValueError):
+			gui.messageBox(_("El archivo no es una exportación de recordatorios válida."), _("Error"), wx.ICON_ERROR)
+			return
+		#Translators: Mensaje que indica cuántos recordatorios se importaron.
+		ui.message(ngettext("Se importó {} recordatorio.", "Se importaron {} recordatorios.", len(imported)).format(len(imported)))
+
+	def manage_tasks(self, event):
+		"""
+		Permite gestionar las tareas de un recordatorio activo.
+		"""
+		from .dialogs import ReminderPickerDialog, ManageTasksDialog
+		reminders_with_tasks = [reminder for reminder in reminder_manager.reminders if reminder.tasks]
+
+		if reminders_with_tasks:
+			dlg = ReminderPickerDialog(None, MANAGE_TASKS_TITLE, MANAGE_TASKS_MESSAGE, reminders_with_tasks)
+
+			if dlg.ShowModal() == wx.ID_OK and dlg.get_selected_reminders():
+				try:
+					selected_reminder = dlg.get_selected_reminders()[0]
+
+					manage_tasks_dlg = ManageTasksDialog(None, selected_reminder.message, selected_reminder.tasks)
+					if manage_tasks_dlg.ShowModal() == wx.ID_OK:
+						updated_tasks = manage_tasks_dlg.modified_tasks
+						if reminder_manager.update_reminder(selected_reminder.id, tasks=updated_tasks):
+							ui.message(UPDATE_TASKS_MESSAGE)
+						else:
+							gui.messageBox(_("Ocurrió un error al actualizar las tareas del recordatorio."), _("Error"), wx.ICON_ERROR)
+					manage_tasks_dlg.Destroy()
+				except Exception as e:
+					gui.messageBox(
+						_("Ocurrió un error al gestionar las tareas del recordatorio:\n\n{}").format(str(e)),
+						_("Error"),
+						wx.ICON_ERROR
+					)
+			dlg.Destroy()
+		else:
+			ui.message(NO_REMINDERS_WITH_TASKS_MESSAGE)
+
+	@scriptHandler.script(
+		#Translators: Descripción para el gesto que lanza la ventana de recordatorios.
+		description=_("Abrir la ventana de recordatorios"),
+		#Translators: Nombre de la categoría.
+		category=_("Recordatorios"),
+		gesture=None
+	)
+	def script_open_reminder_window(self, gesture):
+		self.open_reminder_window(None)
+
+	@scriptHandler.script(
+		#Translators: Descripción del gesto para ver recordatorios activos.
+		description=_("Verificar recordatorios activos"),
+		#Translators: Nombre de la categoría.
+		category=_("Recordatorios"),
+		gesture=None
+	)
+	
+	def script_check_active_reminders(self, gesture):
+		self.check_active_reminders(None)
+
+	@scriptHandler.script(
+		#Translators: Descripción del gesto para ver los recordatorios activos del resto de la semana.
+		description=_("Verificar recordatorios activos de esta semana"),
+		#Translators: Nombre de la categoría.
+		category=_("Recordatorios"),
+		gesture=None
+	)
+	def script_check_week_reminders(self, gesture):
+		self.check_active_reminders(None, "week")
+
+	@scriptHandler.script(
+		#Translators: Descripción del gesto para ver los recordatorios activos a partir de la semana próxima.
+		description=_("Verificar recordatorios activos de más adelante"),
+		#Translators: Nombre de la categoría.
+		category=_("Recordatorios"),
+		gesture=None
+	)
+	def script_check_later_reminders(self, gesture):
+		self.check_active_reminders(None, "later")
+
+	@scriptHandler.script(
+		#Translators: Descripción del gesto que lanza la ventana para eliminar recordatorios.
+		description=_("Lanza el diálogo para eliminar recordatorios"),
+		#Translators: Nombre de la categoría.
+		category=_("Recordatorios"),
+		gesture=None
+	)
+	def script_open_delete_dialog(self, gesture):
+		wx.CallAfter(self.delete_reminder, None)
+
+	@scriptHandler.script(
+		#Translators: Descripción del gesto que lanza el diálogo para reprogramar recordatorios.
+		description=_("Lanza el diálogo para reprogramar recordatorios"),
+		#Translators: Nombre de la categoría.
+		category=_("Recordatorios"),
+		gesture=None
+	)
+	def script_open_reschedule_dialog(self, gesture):
+		wx.CallAfter(self.reschedule_reminder, None)
+
+	@scriptHandler.script(
+		#Translators: Descripción del gesto que lanza el diálogo para gestionar tareas de recordatorios.
+		description=_("Lanza el diálogo para gestionar tareas de recordatorios"),
+		#Translators: Nombre de la categoría.
+		category=_("Recordatorios"),
+		gesture=None
+	)
+	def script_open_manage_tasks_dialog(self, gesture):
+		wx.CallAfter(self.manage_tasks, None)
+
+	@scriptHandler.script(
+		#Translators: Descripción del gesto que lanza el diálogo para posponer varios recordatorios.
+		description=_("Lanza el diálogo para posponer recordatorios"),
+		#Translators: Nombre de la categoría.
+		category=_("Recordatorios"),
+		gesture=None
+	)
+	def script_open_snooze_dialog(self, gesture):
+		wx.CallAfter(self.snooze_reminders, None)
+
+	@scriptHandler.script(
+		#Translators: Descripción del gesto que lanza el diálogo para completar las tareas de varios recordatorios.
+		description=_("Lanza el diálogo para completar las tareas de varios recordatorios"),
+		#Translators: Nombre de la categoría.
+		category=_("Recordatorios"),
+		gesture=None
+	)
+	def script_open_complete_tasks_dialog(self, gesture):
+		wx.CallAfter(self.complete_tasks, None)
+
+	@scriptHandler.script(
+		#Translators: Descripción del gesto que anuncia un resumen de las estadísticas de rendimiento del complemento.
+		description=_("Anuncia un resumen de las estadísticas de rendimiento de los recordatorios"),
+		#Translators: Nombre de la categoría.
+		category=_("Recordatorios"),
+		gesture=None
+	)
+	def script_speak_metrics(self, gesture):
+		ui.message(describe_metrics(reminder_manager.metrics))
+
+
+def show_incomplete_task_dialog(reminder):
+	"""
+	Pregunta qué hacer con un recordatorio que llegó con tareas pendientes. Se llama desde el hilo principal.
+	"""
+	from .dialogs import show_incomplete_task_dialog
+	show_incomplete_task_dialog(reminder_manager, reminder)
+
+
+# Construirlo no lee el disco ni inicia hilos; GlobalPlugin lo inicia con start.
+reminder_manager = ReminderManager(
+	NVDANotifier(sound_cache),
+	create_store,
+	load_settings,
+	on_incomplete_tasks=lambda reminder: wx.CallAfter(show_incomplete_task_dialog, reminder),
+	metrics_exporter_factory=create_metrics_exporter
+)
+
+
+class remindersConfigPanel(settingsDialogs.SettingsPanel):
+	#Translators: Título de la ventana para la configuración del complemento.
+	title=_("Configuración de recordatorios")
+	def makeSettings(self, sizer):
+		helper = gui.guiHelper.BoxSizerHelper(self, sizer=sizer)
+		#Translators: Etiqueta que le indica al usuario que debe seleccionar un número para las notificaciones que llegarán.
+		self.numberOfTimesToNotifyReminder_label = helper.addItem(wx.StaticText(self, label=_("Selecciona el número de notificaciones que llegarán para el recordatorio.")))
+		self.numberOfTimesToNotifyReminder = helper.addItem(wx.ComboBox(self, choices=NOTIFICATION_REPETITION_CHOICES, style=wx.CB_READONLY))
+		self.numberOfTimesToNotifyReminder.SetStringSelection(str(config.conf["remindersConfig"]["numberOfTimesToNotifyReminder"]))
+		#Translators: Etiqueta que solicita al usuario seleccionar (en segundos) el tiempo entre las notificaciones.
+		self.notificationInterval_label = helper.addItem(wx.StaticText(self, label=_("Selecciona el intervalo de tiempo para las notificaciones (en segundos).")))
+		self.notificationInterval = helper.addItem(wx.ComboBox(self, choices=NOTIFICATION_INTERVAL_CHOICES, style=wx.CB_READONLY))
+		self.notificationInterval.SetStringSelection(str(config.conf["remindersConfig"]["notificationInterval"]))
+		#Translators: Etiqueta para elegir dónde se guardan los recordatorios.
+		self.storageBackend_label = helper.addItem(wx.StaticText(self, label=_("Almacenamiento de los recordatorios (requiere reiniciar NVDA):")))
+		#Translators: Opciones de almacenamiento: archivo JSON, archivo binario compacto o base de datos SQLite.
+		self.storageBackend = helper.addItem(wx.Choice(self, choices=[_("Archivo JSON"), _("Archivo binario compacto"), _("Base de datos SQLite")]))
+		self.storageBackend.SetSelection(STORAGE_BACKENDS.index(config.conf["remindersConfig"]["storageBackend"]))
+		#Translators: Etiqueta para elegir qué hacer con los avisos de un recordatorio recurrente que se perdieron con el equipo apagado o suspendido.
+		self.missedRemindersPolicy_label = helper.addItem(wx.StaticText(self, label=_("Avisos perdidos de recordatorios recurrentes:")))
+		#Translators: Opciones para los avisos perdidos: avisar una vez, avisar con un resumen o no avisar.
+		self.missedRemindersPolicy = helper.addItem(wx.Choice(self, choices=[
+			_("Avisar una sola vez"),
+			_("Avisar una vez e indicar cuántos avisos se perdieron"),
+			_("No avisar")
+		]))
+		self.missedRemindersPolicy.SetSelection(MISSED_REMINDERS_POLICIES.index(config.conf["remindersConfig"]["missedRemindersPolicy"]))
+		#Translators: Casilla para guardar las estadísticas de rendimiento en un archivo CSV en la carpeta de configuración de NVDA.
+		self.exportMetrics = helper.addItem(wx.CheckBox(self, label=_("&Guardar las estadísticas de rendimiento en un archivo CSV")))
+		self.exportMetrics.SetValue(config.conf["remindersConfig"]["exportMetrics"])
+
+	def onSave(self):
+		config.conf["remindersConfig"]["numberOfTimesToNotifyReminder"] = int(self.numberOfTimesToNotifyReminder.GetStringSelection())
+		config.conf["remindersConfig"]["notificationInterval"] = int(self.notificationInterval.GetStringSelection())
+		config.conf["remindersConfig"]["storageBackend"] = STORAGE_BACKENDS[self.storageBackend.GetSelection()]
+		config.conf["remindersConfig"]["missedRemindersPolicy"] = MISSED_REMINDERS_POLICIES[self.missedRemindersPolicy.GetSelection()]
+		config.conf["remindersConfig"]["exportMetrics"] = self.exportMetrics.GetValue()
+		# Actualizamos la instantánea de ajustes que usan el planificador y el despachador.
+		reminder_manager.reload_settings()
@@ -0,0 +1,134 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Piezas del gestor de recordatorios que hablan con NVDA: los avisos por voz y sonido,
+los ajustes de la configuración, y el almacén y las estadísticas en la carpeta de configuración del usuario.
+"""
+
+import os
+import threading
+
+import config
+import globalVars
+import nvwave
+import tones
+import ui
+from nvwave import playWaveFile
+from .core import NotificationDispatcher
+from .metrics import CsvExporter
+from .models import storage_key
+from .settings import ReminderSettings
+from .sounds import SoundCache
+from .storage import open_store
+
+
+# Sonidos personalizados ya leídos del disco, compartidos por los avisos y la ventana para añadir recordatorios.
+sound_cache = SoundCache()
+
+
+def _sound_output_device():
+	"""
+	Devuelve el dispositivo de salida de audio de NVDA; la opción cambió de sección entre versiones.
+	"""
+	try:
+		return config.conf["audio"]["outputDevice"]
+	except KeyError:
+		return config.conf["speech"]["outputDevice"]
+
+
+def play_sound_asset(asset):
+	"""
+	Reproduce en segundo plano un sonido ya cargado en memoria, como playWaveFile pero sin leer el disco.
+	Args:
+		asset (SoundAsset): El sonido obtenido de sound_cache.
+	"""
+	def play():
+		try:
+			player = nvwave.WavePlayer(
+				channels=asset.channels,
+				samplesPerSec=asset.sample_rate,
+				bitsPerSample=asset.sample_width * 8,
+				outputDevice=_sound_output_device(),
+				wantDucking=False
+			)
+		except Exception:
+			# Si no se puede abrir el dispositivo así, dejamos que NVDA lo reproduzca desde el archivo.
+			playWaveFile(asset.path)
+			return
+		try:
+			player.feed(asset.frames)
+			player.idle()
+		finally:
+			player.close()
+	threading.Thread(target=play, daemon=True).start()
+
+
+class NVDANotifier(NotificationDispatcher):
+	"""
+	Notificador que anuncia los recordatorios con la voz de NVDA y los sonidos personalizados.
+	"""
+
+	def __init__(self, sounds):
+		"""
+		Args:
+			sounds (SoundCache): Caché de la que se toman los sonidos personalizados.
+		"""
+		super().__init__()
+		self.sounds = sounds
+
+	def message(self, text):
+		"""
+		Anuncia un mensaje breve con NVDA.
+		"""
+		ui.message(text)
+
+	def preload(self, sound_files):
+		"""
+		Lee en segundo plano los sonidos indicados.
+		"""
+		self.sounds.preload(sound_files)
+
+	def _announce(self, message, sound_file):
+		"""
+		Anuncia el mensaje y reproduce el sonido de la notificación.
+		"""
+		ui.message(message)
+		# El sonido sale de la caché; solo se lee del disco si aún no se había cargado.
+		asset = self.sounds.get(sound_file) if sound_file else None
+		if asset is not None:
+			# Reproducir el sonido personalizado usando nvwave
+			play_sound_asset(asset)
+			# Una vez iniciado el sonido, comprobamos si el archivo cambió para la próxima vez.
+			self.sounds.refresh(sound_file)
+		# Si el sonido no existe o el usuario no seleccionó alguno, entonces reproduce un beep desde el módulo tones de NVDA.
+		else:
+			# Reproducir sonido para la notificación
+			tones.beep(440, 500)
+
+
+def load_settings():
+	"""
+	Lee los ajustes del complemento del perfil de configuración activo.
+	"""
+	return ReminderSettings.from_config(config.conf["remindersConfig"])
+
+
+def create_store(settings):
+	"""
+	Crea el almacén elegido en la configuración, en la carpeta de configuración de NVDA.
+	"""
+	return open_store(
+		globalVars.appArgs.configPath,
+		lambda item: storage_key(item[0]),
+		settings.storage_backend
+	)
+
+
+def create_metrics_exporter():
+	"""
+	Crea el exportador de las estadísticas de rendimiento, en la carpeta de configuración de NVDA.
+	"""
+	return CsvExporter(os.path.join(globalVars.appArgs.configPath, "recordatorios_metricas.csv"))
@@ -0,0 +1,1236 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Núcleo del complemento: el gestor de recordatorios, su planificador y el despachador de notificaciones.
+No depende de NVDA ni de wx: los avisos, el reloj, el almacén y los ajustes se reciben desde fuera.
+adapters.py contiene las implementaciones para NVDA y doubles.py otras en memoria para pruebas y mediciones.
+Las ventanas están en dialogs.py y solo se cargan la primera vez que se abren.
+"""
+
+import functools
+import gc
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+try:
+	import addonHandler
+	addonHandler.initTranslation()
+except ImportError:
+	# Fuera de NVDA (pruebas y mediciones) los textos se quedan sin traducir.
+	from gettext import gettext as _, ngettext
+
+from .metrics import FIRE_LAG, LOAD, NOTIFY, PERSIST, QUEUE_DEPTH, TICK, Metrics
+from .models import SHARED_FIELDS, Reminder, Task, shared_text, storage_key
+from .recurrence import MONTHLY, add_months, legacy_key, parse_rule, rule_for
+from .timeformat import format_time_remaining
+from .storage import DEFAULT_SAVE_DELAY, PersistenceWorker, export_json, import_json
+from .timerwheel import TimerWheel
+
+# Textos de las notificaciones de tareas
+TASK_COMPLETED_STATUS = _("[Completada]")
+TASK_PENDING_STATUS = _("[Pendiente]")
+ALL_TASKS_COMPLETED_MESSAGE = _("Todas las tareas del recordatorio '{}' han sido completadas.")
+INCOMPLETE_TASKS_MESSAGE = _("El recordatorio '{}' tiene tareas incompletas. Por favor, revísalas.")
+
+# Tiempo máximo (en segundos) que el planificador duerme antes de volver a consultar el reloj.
+# Protege contra cambios en la hora del sistema o la suspensión del equipo.
+MAX_SCHEDULER_WAIT = 60
+
+# Valores de recurrencia que se guardan, en el mismo orden que en la lista de la ventana principal.
+RECURRENCE_KEYS = ("diario", "semanal", "mensual", "laborables", "Personalizado")
+RECURRENCE_LABELS = (_("diario"), _("semanal"), _("mensual"), _("laborables (lunes a viernes)"), _("Personalizado"))
+# Las versiones anteriores guardaban el texto traducido de la lista; así se recupera el valor original.
+RECURRENCE_KEYS_BY_LABEL = dict(zip(RECURRENCE_LABELS, RECURRENCE_KEYS))
+
+
+def describe_recurrence(recurrence):
+	"""
+	Devuelve el nombre, traducido, de la recurrencia de un recordatorio.
+	"""
+	recurrence = RECURRENCE_KEYS_BY_LABEL.get(recurrence, recurrence)
+	if recurrence not in RECURRENCE_KEYS:
+		# Una regla equivalente a un valor de la lista, como la mensual con el día fijado, se describe como él.
+		try:
+			recurrence = legacy_key(parse_rule(recurrence)) or recurrence
+		except ValueError:
+			pass
+	if recurrence in RECURRENCE_KEYS[:-1]:
+		return RECURRENCE_LABELS[RECURRENCE_KEYS.index(recurrence)]
+	# Intervalo en minutos o regla escrita a mano.
+	return _("personalizado")
+
+
+def format_reminder_date(reminder_time, today):
+	"""
+	Devuelve la fecha y la hora de un recordatorio tal como se muestran en las listas de selección.
+	Args:
+		reminder_time (datetime): La hora del recordatorio.
+		today (date): La fecha de hoy, calculada una sola vez por quien muestra la lista.
+	"""
+	if reminder_time.date() == today:
+		#Translators: Fecha de un recordatorio que llega hoy, en las listas de selección.
+		return _("hoy a las {}").format(reminder_time.strftime('%H:%M'))
+	#Translators: Fecha de un recordatorio que llega otro día, en las listas de selección.
+	return _("el {date} a las {time}").format(date=reminder_time.strftime('%d/%m/%Y'), time=reminder_time.strftime('%H:%M'))
+
+
+def recurrence_rule(reminder):
+	"""
+	Devuelve la regla de recurrencia (ver recurrence.py) de un recordatorio, o None si no se repite.
+	"""
+	return rule_for(RECURRENCE_KEYS_BY_LABEL.get(reminder.recurrence, reminder.recurrence), reminder.custom_interval)
+
+
+# Los recordatorios que se repiten cada SHORT_INTERVAL_MAX minutos o menos (medicación, postura, pomodoro...)
+# se programan en una rueda de temporizadores, se anuncian juntos si vencen a la vez y su nueva hora no se escribe en cada aviso.
+SHORT_INTERVAL_MAX = 60
+
+
+def is_short_interval(reminder):
+	"""
+	Indica si un recordatorio se repite con un intervalo personalizado corto (ver SHORT_INTERVAL_MAX).
+	"""
+	return bool(reminder.custom_interval) and int(reminder.custom_interval) <= SHORT_INTERVAL_MAX
+
+
+# Campos de un recordatorio que se pueden cambiar con ReminderManager.update_reminder.
+UPDATABLE_FIELDS = frozenset(("reminder_time", "recurrence", "sound_file", "custom_interval", "tasks"))
+
+# Valores posibles de storageBackend, en el mismo orden que en el panel de configuración.
+STORAGE_BACKENDS = ("json", "binary", "sqlite")
+
+# Valores posibles de missedRemindersPolicy, en el mismo orden que en el panel de configuración.
+# once: avisar una sola vez; summary: avisar una vez indicando cuántos avisos se perdieron; skip: no avisar.
+MISSED_REMINDERS_POLICIES = ("once", "summary", "skip")
+#Translators: Se anuncia cuando los recordatorios guardados no se pueden leer; {} es el error.
+LOAD_ERROR_MESSAGE = _("No se pudieron cargar los recordatorios ({}). Para no sobrescribir los guardados, no se guardará ningún cambio hasta que se corrija el archivo y se reinicie NVDA.")
+
+
+def _format_seconds(seconds):
+	"""
+	Devuelve una duración breve en milisegundos o segundos, según su tamaño.
+	"""
+	if seconds < 1:
+		#Translators: Duración en milisegundos, en el resumen de las estadísticas de rendimiento.
+		return _("{:g} ms").format(round(seconds * 1000, 2))
+	#Translators: Duración en segundos, en el resumen de las estadísticas de rendimiento.
+	return _("{:g} s").format(round(seconds, 2))
+
+
+def describe_metrics(metrics):
+	"""
+	Devuelve un resumen, para anunciarlo, de las estadísticas de rendimiento del gestor de recordatorios.
+	Args:
+		metrics (Metrics): Las estadísticas del gestor.
+	"""
+	parts = []
+	timings = (
+		#Translators: Nombre de la medida del retraso de los avisos, en el resumen de las estadísticas.
+		(FIRE_LAG, _("Retraso de los avisos")),
+		#Translators: Nombre de la medida de la duración de cada ciclo del planificador.
+		(TICK, _("Ciclo del planificador")),
+		#Translators: Nombre de la medida del tiempo que el planificador pasa entregando un aviso.
+		(NOTIFY, _("Entrega de avisos")),
+		#Translators: Nombre de la medida de la duración de las escrituras en disco.
+		(PERSIST, _("Guardado")),
+		#Translators: Nombre de la medida de la duración de la carga inicial de los recordatorios.
+		(LOAD, _("Carga inicial")),
+	)
+	for name, label in timings:
+		histogram = metrics.histogram(name)
+		if histogram is None:
+			continue
+		#Translators: Cuántas veces se tomó una medida, en el resumen de las estadísticas de rendimiento.
+		count = ngettext("{} medida", "{} medidas", histogram.count).format(histogram.count)
+		#Translators: Resumen de una medida de tiempo: cuántas veces se midió, la media, el percentil 95 y el máximo.
+		parts.append(_("{label}: {count}, media {mean}, p95 {p95}, máximo {maximum}.").format(
+			label=label,
+			count=count,
+			mean=_format_seconds(histogram.mean),
+			p95=_format_seconds(histogram.percentile(0.95)),
+			maximum=_format_seconds(histogram.maximum)
+		))
+	histogram = metrics.histogram(QUEUE_DEPTH)
+	if histogram is not None:
+		#Translators: Resumen de cuántos recordatorios había programados en cada ciclo del planificador.
+		parts.append(_("Recordatorios en cola: media {mean:g}, máximo {maximum}.").format(mean=round(histogram.mean, 1), maximum=histogram.maximum))
+	if not parts:
+		#Translators: Se anuncia cuando aún no hay estadísticas de rendimiento.
+		return _("Todavía no hay estadísticas de rendimiento.")
+	return " ".join(parts)
+
+
+@contextmanager
+def _gc_paused():
+	"""
+	Pausa el recolector de ciclos mientras se crean muchos objetos seguidos, como al cargar los recordatorios.
+	Cada pocos cientos de objetos nuevos el recolector se activa y recorre los ya creados, lo que con decenas de miles
+	de recordatorios llega a ocupar la mitad de la carga; los recordatorios no forman ciclos, así que no hay nada que recoger.
+	"""
+	enabled = gc.isenabled()
+	gc.disable()
+	try:
+		yield
+	finally:
+		if enabled:
+			gc.enable()
+
+
+class Clock:
+	"""
+	Reloj del gestor de recordatorios: la hora del sistema.
+	doubles.FakeClock lo sustituye para avanzar el tiempo a mano en pruebas y mediciones.
+	"""
+
+	def now(self):
+		"""
+		Devuelve la hora actual.
+		"""
+		return datetime.now()
+
+
+class Notifier:
+	"""
+	Interfaz con la que el gestor de recordatorios se comunica con el usuario.
+	adapters.NVDANotifier habla con NVDA y doubles.RecordingNotifier solo guarda los avisos.
+	"""
+
+	def start(self):
+		"""
+		Prepara el notificador. Se llama una vez, desde el hilo del gestor, antes de cargar los recordatorios.
+		"""
+
+	def message(self, text):
+		"""
+		Comunica un mensaje breve, como la confirmación al añadir un recordatorio.
+		"""
+		raise NotImplementedError
+
+	def notify(self, text, sound_file=None, repetitions=1, interval=0):
+		"""
+		Programa los avisos de un recordatorio que ha llegado.
+		Args:
+			text (str): El texto que se anunciará.
+			sound_file (str): Ruta al sonido personalizado, si se seleccionó.
+			repetitions (int): Número de veces que se anunciará.
+			interval (int): Segundos entre repeticiones.
+		"""
+		raise NotImplementedError
+
+	def preload(self, sound_files):
+		"""
+		Prepara los sonidos indicados para que el aviso no tenga que esperar al disco.
+		"""
+
+	def stop(self):
+		"""
+		Descarta los avisos pendientes y libera los recursos del notificador.
+		"""
+
+
+class NotificationDispatcher(Notifier):
+	"""
+	Notificador que anuncia los avisos en su propio hilo.
+	Cada repetición de una notificación se programa como un evento con su hora,
+	de modo que varios recordatorios vencidos a la vez se anuncian uno tras otro
+	sin esperar a que terminen las repeticiones de los anteriores.
+	Las subclases indican cómo se anuncia cada aviso en _announce.
+	"""
+
+	def __init__(self):
+		# Cola de eventos ordenada por hora (time.monotonic). Cada evento es (hora, secuencia, mensaje, sonido).
+		self._events = []
+		# Contador para conservar el orden de llegada entre eventos con la misma hora.
+		self._counter = itertools.count()
+		self._condition = threading.Condition()
+		self.running = True
+		self._thread = None
+
+	def start(self):
+		"""
+		Inicia el hilo del despachador.
+		"""
+		if self._thread is None:
+			self._thread = threading.Thread(target=self._run, daemon=True)
+			self._thread.start()
+
+	def notify(self, message, sound_file=None, repetitions=1, interval=0):
+		"""
+		Programa los avisos de una notificación.
+		Args:
+			message (str): El texto que se anunciará.
+			sound_file (str): Ruta al sonido personalizado, si se seleccionó.
+			repetitions (int): Número de veces que se anunciará la notificación.
+			interval (int): Segundos entre repeticiones.
+		"""
+		now = time.monotonic()
+		with self._condition:
+			for i in range(max(repetitions, 1)):
+				heapq.heappush(self._events, (now + i * interval, next(self._counter), message, sound_file))
+			self._condition.notify()
+
+	def _run(self):
+		"""
+		Bucle del hilo: espera al siguiente evento vencido y lo anuncia.
+		"""
+		while True:
+			with self._condition:
+				while self.running:
+					if not self._events:
+						self._condition.wait()
+						continue
+					delay = self._events[0][0] - time.monotonic()
+					if delay > 0:
+						self._condition.wait(delay)
+						continue
+					break
+				if not self.running:
+					return
+				event = heapq.heappop(self._events)
+			self._announce(event[2], event[3])
+
+	def _announce(self, message, sound_file):
+		"""
+		Anuncia el mensaje y reproduce el sonido de la notificación. Se ejecuta en el hilo del despachador.
+		"""
+		raise NotImplementedError
+
+	def stop(self):
+		"""
+		Detiene el hilo del despachador descartando los avisos pendientes.
+		"""
+		with self._condition:
+			self.running = False
+			self._events = []
+			self._condition.notify_all()
+
+
+def requires_loaded(method):
+	"""
+	Decorador para los métodos públicos de ReminderManager que usan los recordatorios.
+	Como se cargan en segundo plano, el método espera a que termine la carga antes de ejecutarse.
+	"""
+	@functools.wraps(method)
+	def wrapper(self, *args, **kwargs):
+		self.loaded.wait()
+		return method(self, *args, **kwargs)
+	return wrapper
+
+
+def requires_store(failure_result=None):
+	"""
+	Decorador para los métodos públicos de ReminderManager que modifican los recordatorios.
+	Además de esperar a la carga, si esta falló el método no hace nada: se avisa del error y se devuelve failure_result,
+	para que ningún cambio llegue a escribirse encima de los recordatorios que no se pudieron leer.
+	"""
+	def decorator(method):
+		@functools.wraps(method)
+		def wrapper(self, *args, **kwargs):
+			self.loaded.wait()
+			if self.load_error is not None:
+				self.notifier.message(LOAD_ERROR_MESSAGE.format(self.load_error))
+				return failure_result
+			return method(self, *args, **kwargs)
+		return wrapper
+	return decorator
+
+
+class ReminderManager:
+	"""
+	Clase que maneja los recordatorios y su verificación en segundo plano.
+	"""
+	
+	def __init__(self, notifier, store_factory, settings_provider, clock=None, save_delay=DEFAULT_SAVE_DELAY, on_incomplete_tasks=None, metrics_exporter_factory=None):
+		"""
+		Args:
+			notifier (Notifier): Con quien se comunican los avisos y las confirmaciones.
+			store_factory (callable): Recibe los ajustes y devuelve el almacén (JournalStore, SQLiteStore o uno compatible).
+				Se llama al iniciar, en el hilo del gestor.
+			settings_provider (callable): Devuelve los ajustes actuales (ReminderSettings).
+			clock (Clock): Reloj con el que se decide qué recordatorios han vencido. Por defecto, el del sistema.
+			save_delay (float): Segundos durante los que se agrupan los cambios antes de escribirlos en disco.
+			on_incomplete_tasks (callable): Se llama, desde el hilo del planificador, con cada recordatorio no recurrente
+				que llega con tareas pendientes, ya retirado de la lista. Si no se indica, se elimina sin preguntar.
+			metrics_exporter_factory (callable): Devuelve el exportador (metrics.CsvExporter) que se usa
+				mientras esté activada la opción de guardar las estadísticas. Si no se indica, nunca se exportan.
+		"""
+		self.notifier = notifier
+		self.store_factory = store_factory
+		self.settings_provider = settings_provider
+		self.clock = clock if clock is not None else Clock()
+		self.on_incomplete_tasks = on_incomplete_tasks
+		self.metrics_exporter_factory = metrics_exporter_factory
+		# Estadísticas de rendimiento: retraso de los avisos, duración de los ciclos, del guardado y de la carga.
+		self.metrics = Metrics()
+		# Recordatorios indexados por su identificador estable, en el orden en que se añadieron.
+		self._reminders = {}
+		# Cerrojo que protege los recordatorios y sus índices. Es reentrante porque el planificador lo comparte.
+		self._lock = threading.RLock()
+		# Siguiente identificador libre para un recordatorio nuevo.
+		self._next_id = 1
+		# Índice de los recordatorios por nombre normalizado (casefold), para detectar duplicados y buscar en O(1).
+		self._names = {}
+		# Variable booleana para controlar si el hilo de verificación sigue corriendo
+		self.running = True
+		# Ajustes ya convertidos. Se sustituyen enteros al guardar el panel o cambiar de perfil, así se leen sin cerrojo.
+		self.settings = settings_provider()
+		self.save_delay = save_delay
+		# Almacén en disco: JSON con diario de cambios o SQLite, según la configuración. Se abre al iniciar.
+		self.store = None
+		# Hilo que agrupa los cambios y los escribe en disco fuera del hilo que los produce (a menudo el de la interfaz).
+		self.persistence = None
+		# Montículo (heap) con los recordatorios pendientes, ordenado por su hora de disparo.
+		# Cada entrada es [hora, secuencia, recordatorio]; el recordatorio se sustituye por None al cancelarla.
+		self._heap = []
+		# Entradas vigentes del montículo, indexadas por el identificador del recordatorio.
+		self._heap_entries = {}
+		# Contador para desempatar entradas con la misma hora sin comparar los recordatorios.
+		self._heap_counter = itertools.count()
+		# Rueda de temporizadores con los recordatorios de intervalo corto; el resto va al montículo.
+		self._wheel = TimerWheel(self.clock.now())
+		# Identificadores de los recordatorios de intervalo corto cuya nueva hora aún no se escribió en el almacén.
+		self._unsaved_fires = set()
+		# Condición que permite dormir hasta el siguiente vencimiento y despertar antes si cambia la cabeza del montículo.
+		# Usa el mismo cerrojo que los recordatorios, así el montículo nunca queda desincronizado con ellos.
+		self._condition = threading.Condition(self._lock)
+		# Se activa cuando los recordatorios ya están cargados; los métodos públicos lo esperan.
+		self.loaded = threading.Event()
+		# Error con el que falló la apertura del almacén o la carga, o None. Si falló, no se modifica ni se guarda nada.
+		self.load_error = None
+		# Hilo de verificación de los recordatorios, creado por start.
+		self._thread = None
+
+	def start(self):
+		"""
+		Inicia el gestor en segundo plano: abre el almacén, carga los recordatorios y empieza a atenderlos.
+		Vuelve enseguida para no retrasar el inicio de NVDA.
+		"""
+		if self._thread is not None:
+			return
+		self._thread = threading.Thread(target=self._run, daemon=True)
+		self._thread.start()
+
+	def _run(self):
+		"""
+		Cuerpo del hilo de verificación. El primer vencimiento se atiende solo cuando el almacén ya está listo.
+		"""
+		self.open()
+		if self.load_error is not None:
+			# Sin recordatorios cargados no hay nada que atender.
+			return
+		# Leemos en segundo plano los sonidos personalizados, para que los avisos no esperen al disco.
+		self.notifier.preload([reminder.sound_file for reminder in self.reminders])
+		self.check_reminders()
+
+	def open(self):
+		"""
+		Abre el almacén y carga los recordatorios en el hilo actual, sin empezar a atenderlos.
+		start lo hace en segundo plano; las pruebas y mediciones pueden llamarlo directamente y usar fire_due.
+		Si el almacén no se puede abrir o leer (por ejemplo, un archivo dañado), el error queda en load_error,
+		se avisa al usuario y el gestor se queda sin recordatorios y sin escribir nada, para no perder los guardados.
+		"""
+		self.notifier.start()
+		self._update_metrics_exporter()
+		try:
+			self.store = self.store_factory(self.settings)
+			# Cargamos los recordatorios
+			with self.metrics.timer(LOAD):
+				self.load_reminders()
+			self.persistence = PersistenceWorker(
+				self.store,
+				self._serialize_all,
+				delay=self.save_delay,
+				on_write=functools.partial(self.metrics.record, PERSIST)
+			)
+		except Exception as error:
+			self.load_error = error
+			with self._lock:
+				self._reminders = {}
+				self._names = {}
+				self._rebuild_schedule()
+			self.notifier.message(LOAD_ERROR_MESSAGE.format(error))
+		finally:
+			# Aunque la carga falle, no dejamos bloqueados a quienes esperan.
+			self.loaded.set()
+
+	@requires_store()
+	def add_reminder(self, message, reminder_time, recurrence=None, sound_file=None, custom_interval=None, tasks=None, repetitions=None, notification_interval=None):
+		"""
+		Método que añade un recordatorio, verificando si no existe otro con el mismo nombre
+		Args:
+			message (str): El mensaje del recordatorio.
+			reminder_time (datetime): La hora en la que llegará el recordatorio.
+			recurrence (str): La frecuencia del recordatorio. diario, semanal, mensual, si aplica.
+			sound_file (str): ruta con el sonido para el recordatorio
+			custom_interval (int): Tiempo personalizado para la notificación del recordatorio
+			tasks (list): Lista de objetos Task con las tareas del recordatorio.
+			repetitions (int): Veces que se anuncia este recordatorio; None para usar la configuración.
+			notification_interval (int): Segundos entre sus anuncios; None para usar la configuración.
+		Returns:
+			Reminder: El recordatorio añadido, o None si ya existía otro con el mismo nombre.
+		"""
+		if tasks is None:
+			tasks = []
+	
+		with self._lock:
+			# Verificamos si ya existe un recordatorio con el mismo nombre, sin distinguir mayúsculas
+			if self._normalize_name(message) in self._names:
+				reminder = None
+			else:
+				# en caso contrario, se añade el recordatorio
+				reminder = Reminder(
+					self._new_id(), message, reminder_time, recurrence, sound_file, custom_interval, tasks,
+					repetitions, notification_interval
+				)
+				self._append_reminder(reminder)
+		if reminder is None:
+			self.notifier.message(_("Ya existe un recordatorio con el nombre '{}'").format(message))
+			return None
+		self.notifier.preload([sound_file])
+	
+		# Verificar si el recordatorio es para hoy o para una fecha futura
+		now = self.clock.now()
+		if reminder_time.date() == now.date():
+			# Si es para hoy, mostramos solo la hora
+			translated_message_reminder = _("Recordatorio agregado para {time}")
+			confirmation = translated_message_reminder.format(time=reminder_time.strftime('%H:%M'))
+		else:
+			# Si es para una fecha futura, mostramos fecha y hora
+			translated_message_reminder = _("Recordatorio agregado para el {date} a las {time}")
+			confirmation = translated_message_reminder.format(
+				date=reminder_time.strftime('%d/%m/%Y'),
+				time=reminder_time.strftime('%H:%M')
+			)
+		# Añadimos el tiempo que falta, por ejemplo "en 2 horas, 5 minutos".
+		self.notifier.message("{}, {}".format(confirmation, format_time_remaining(reminder_time, now)))
+		return reminder
+
+	def check_reminders(self):
+		"""
+		Método que atiende los recordatorios en segundo plano.
+		El hilo duerme hasta la hora del recordatorio más próximo y solo despierta antes
+		si se añade, modifica o elimina un recordatorio que cambie la cabeza del montículo.
+		"""
+		while self.running:
+			self._fire_batch(self._wait_for_due_reminders())
+
+	def _fire_batch(self, due_reminders):
+		"""
+		Atiende los recordatorios vencidos a la vez y registra la duración del ciclo y el tamaño de la cola.
+		"""
+		if not due_reminders:
+			return
+		start = time.perf_counter()
+		# Los vencidos ya salieron del montículo y de la rueda; se cuentan para medir la cola tal como estaba al despertar.
+		self.metrics.record(QUEUE_DEPTH, len(self._heap_entries) + len(self._wheel) + len(due_reminders))
+		# Los recordatorios de intervalo corto sin tareas que vencen a la vez se anuncian en un solo aviso.
+		group = []
+		others = []
+		for reminder in due_reminders:
+			(group if is_short_interval(reminder) and not reminder.tasks else others).append(reminder)
+		if len(group) > 1:
+			self._fire_group(group)
+			due_reminders = others
+		for reminder in due_reminders:
+			self.fire_reminder(reminder)
+		self.metrics.record(TICK, time.perf_counter() - start)
+
+	def _wait_for_due_reminders(self):
+		"""
+		Bloquea el hilo hasta que haya recordatorios vencidos y los retira del montículo.
+		Returns:
+			list: Los recordatorios cuya hora ya llegó, en orden de disparo. Vacía si se detuvo el hilo.
+		"""
+		with self._condition:
+			while self.running:
+				# Descartamos las entradas canceladas que hayan quedado en la cabeza.
+				while self._heap and self._heap[0][2] is None:
+					heapq.heappop(self._heap)
+				next_time = self._next_due_locked()
+				if next_time is None:
+					# No hay nada programado: dormimos hasta que se añada un recordatorio.
+					self._condition.wait()
+					continue
+				now = self.clock.now()
+				delay = (next_time - now).total_seconds()
+				if delay > 0:
+					self._condition.wait(min(delay, MAX_SCHEDULER_WAIT))
+					continue
+				return self._pop_due_locked(now)
+		return []
+
+	def _next_due_locked(self):
+		"""
+		Devuelve la hora del próximo vencimiento, entre el montículo y la rueda, o None si no hay nada programado.
+		Debe llamarse con el cerrojo tomado y sin entradas canceladas en la cabeza del montículo.
+		"""
+		wheel_time = self._wheel.next_due()
+		if not self._heap:
+			return wheel_time
+		if wheel_time is None:
+			return self._heap[0][0]
+		return min(self._heap[0][0], wheel_time)
+
+	def _pop_due_locked(self, now):
+		"""
+		Retira del montículo y de la rueda los recordatorios cuya hora ya llegó. Debe llamarse con el cerrojo tomado.
+		Returns:
+			list: Los recordatorios vencidos, en orden de disparo.
+		"""
+		due_reminders = []
+		while self._heap and self._heap[0][0] <= now:
+			reminder = heapq.heappop(self._heap)[2]
+			if reminder is not None:
+				del self._heap_entries[reminder.id]
+				due_reminders.append(reminder)
+		wheel_due = self._wheel.pop_due(now)
+		if wheel_due:
+			# Las dos listas ya están ordenadas; sorted las mezcla en tiempo lineal.
+			due_reminders = sorted(due_reminders + wheel_due, key=lambda reminder: reminder.reminder_time)
+		return due_reminders
+
+	@requires_loaded
+	def fire_due(self, now=None):
+		"""
+		Atiende en el hilo actual los recordatorios vencidos, sin esperar al hilo de verificación.
+		Sirve para avanzar el planificador con un reloj simulado (doubles.FakeClock) en pruebas y mediciones.
+		Args:
+			now (datetime): Hora con la que se decide qué ha vencido. Por defecto, la del reloj del gestor.
+		Returns:
+			list: Los recordatorios atendidos.
+		"""
+		with self._condition:
+			due_reminders = self._pop_due_locked(now if now is not None else self.clock.now())
+		self._fire_batch(due_reminders)
+		return due_reminders
+
+	def fire_reminder(self, reminder):
+		"""
+		Notifica un recordatorio vencido y lo reprograma o elimina según su recurrencia.
+		Args:
+			reminder (Reminder): El recordatorio retirado del montículo.
+		"""
+		with self._lock:
+			if self._reminders.get(reminder.id) is not reminder:
+				# El recordatorio fue eliminado mientras se esperaba.
+				return
+			# Retraso real del aviso, antes de que la recurrencia cambie la hora programada.
+			lag = (self.clock.now() - reminder.reminder_time).total_seconds()
+			self._fire_locked(reminder)
+		self.metrics.record(FIRE_LAG, lag)
+
+	def _fire_group(self, reminders):
+		"""
+		Anuncia en un solo aviso varios recordatorios de intervalo corto que vencieron a la vez y los reprograma.
+		Las apariciones perdidas se tratan según la política, como en fire_reminder: con skip se omiten del aviso
+		y con summary se incluye cuántas se perdieron de cada uno.
+		Args:
+			reminders (list): Los recordatorios, ya retirados de la rueda, en orden de disparo.
+		"""
+		lags = []
+		with self._lock:
+			now = self.clock.now()
+			announced = []
+			for reminder in reminders:
+				if self._reminders.get(reminder.id) is not reminder:
+					# El recordatorio fue eliminado mientras se esperaba.
+					continue
+				lags.append((now - reminder.reminder_time).total_seconds())
+				changes, missed = self._catch_up(reminder, now)
+				policy = self.settings.missed_policy
+				if not missed or policy == "once":
+					announced.append((reminder, 0))
+				elif policy == "summary":
+					announced.append((reminder, missed))
+				if changes["reminder_time"] is None:
+					# La serie no tiene más apariciones; estos recordatorios no tienen tareas, así que se retiran sin más.
+					self._remove_reminder(reminder)
+				else:
+					self._apply_changes(reminder, persist=False, **changes)
+			if len(announced) == 1:
+				self._notify_reminder(*announced[0])
+			elif announced:
+				self._notify_group(announced)
+		for lag in lags:
+			self.metrics.record(FIRE_LAG, lag)
+
+	def _fire_locked(self, reminder):
+		"""
+		Parte de fire_reminder que se ejecuta con el cerrojo tomado.
+		"""
+		if not reminder.is_recurrent:
+			# Notificar al usuario
+			self._notify_reminder(reminder)
+		else:
+			# Saltamos de una vez a la siguiente aparición futura, aunque se hayan perdido varias
+			# (equipo suspendido o NVDA cerrado), en lugar de avanzar un periodo por cada aviso.
+			changes, missed = self._catch_up(reminder, self.clock.now())
+			policy = self.settings.missed_policy
+			if not missed or policy == "once":
+				self._notify_reminder(reminder)
+			elif policy == "summary":
+				self._notify_reminder(reminder, missed)
+			# Con la política skip no se avisa de las apariciones perdidas.
+
+			if changes["reminder_time"] is not None:
+				# Actualizar la hora del recordatorio en su lugar, con un único guardado.
+				# La de los de intervalo corto se deduce de la hora guardada y el intervalo, así que se escribe más tarde.
+				self._apply_changes(reminder, persist=not is_short_interval(reminder), **changes)
+				return
+			# La serie no tiene más apariciones: se retira como un recordatorio sin recurrencia.
+		if reminder.has_incomplete_tasks:
+			# Tiene tareas incompletas, mostrar diálogo a través del hilo principal.
+			# Primero, eliminamos el recordatorio de la lista para evitar que se vuelva a activar.
+			self._remove_reminder(reminder)
+			# Luego, avisamos a la interfaz para que pregunte qué hacer con él.
+			if self.on_incomplete_tasks is not None:
+				self.on_incomplete_tasks(reminder)
+		else:
+			# No tiene tareas incompletas o no tiene tareas, se elimina.
+			self._remove_reminder(reminder)
+
+	def _catch_up(self, reminder, now):
+		"""
+		Método que calcula la siguiente aparición futura de un recordatorio recurrente.
+		El motor de recurrencia salta directamente al ciclo de la hora actual, así que cuesta
+		lo mismo tras un minuto que tras meses de retraso.
+		Args:
+			reminder (Reminder): El recordatorio que ha llegado.
+			now (datetime): La hora actual.
+		Returns:
+			tuple: Los cambios a aplicar al recordatorio y cuántas apariciones se perdieron antes de la que se anuncia.
+				La nueva hora es None si la serie ya no tiene más apariciones.
+		"""
+		rule = recurrence_rule(reminder)
+		if rule.freq == MONTHLY and rule.month_day is None and rule.nth is None and reminder.reminder_time.day > 28:
+			rule = rule.with_month_day(reminder.reminder_time.day)
+		series = rule.series(reminder.reminder_time)
+		now = max(now, reminder.reminder_time)
+		try:
+			next_time = series.next_after(now)
+			# La aparición de reminder_time es la que se anuncia; las posteriores que ya pasaron se perdieron.
+			missed = series.count_between(reminder.reminder_time, now)
+		except (ValueError, OverflowError):
+			# Una regla que no se puede calcular (fechas fuera del rango de datetime) no debe detener el hilo
+			# de verificación, que atiende a todos los recordatorios: la serie se da por terminada.
+			return {"reminder_time": None}, 0
+		changes = {"reminder_time": next_time}
+		if next_time is not None and rule.count is not None:
+			# La serie empieza siempre en la hora actual del recordatorio: COUNT guarda las apariciones que quedan.
+			changes["recurrence"] = rule.with_count(rule.count - 1 - missed).to_text()
+		elif next_time is not None and rule.month_day is not None and legacy_key(rule) == "mensual":
+			# Un recordatorio mensual del 29 al 31 que cae en un mes más corto guarda el día en la regla, para volver a él
+			# en el mes siguiente; al volver se guarda otra vez "mensual", que es lo que se muestra en todo momento.
+			recurrence = "mensual" if next_time.day == rule.month_day else rule.to_text()
+			if recurrence != reminder.recurrence:
+				changes["recurrence"] = recurrence
+		return changes, missed
+
+	def _schedule(self, reminder):
+		"""
+		Añade un recordatorio a la rueda, si es de intervalo corto y cabe en ella, o al montículo,
+		y despierta al hilo si pasa a ser el más próximo.
+		"""
+		with self._condition:
+			if is_short_interval(reminder) and self._wheel.add(reminder.id, reminder.reminder_time, reminder):
+				# La rueda no sabe sin recorrerse si es el más próximo; al hilo le basta con recalcular la espera.
+				self._condition.notify()
+				return
+			entry = [reminder.reminder_time, next(self._heap_counter), reminder]
+			self._heap_entries[reminder.id] = entry
+			heapq.heappush(self._heap, entry)
+			if self._heap[0] is entry:
+				self._condition.notify()
+
+	def _unschedule(self, reminder):
+		"""
+		Cancela la programación de un recordatorio: lo quita de la rueda o anula su entrada del montículo sin reordenarlo.
+		"""
+		with self._condition:
+			if self._wheel.remove(reminder.id):
+				return
+			entry = self._heap_entries.pop(reminder.id, None)
+			if entry is None:
+				return
+			entry[2] = None
+			if self._heap[0] is entry:
+				self._condition.notify()
+
+	def _rebuild_schedule(self):
+		"""
+		Reconstruye la rueda y el montículo completos a partir de la lista de recordatorios.
+		"""
+		with self._condition:
+			self._wheel = TimerWheel(self.clock.now())
+			pending = [
+				reminder for reminder in self._reminders.values()
+				if not (is_short_interval(reminder) and self._wheel.add(reminder.id, reminder.reminder_time, reminder))
+			]
+			self._heap = [[reminder.reminder_time, next(self._heap_counter), reminder] for reminder in pending]
+			heapq.heapify(self._heap)
+			self._heap_entries = {entry[2].id: entry for entry in self._heap}
+			self._condition.notify()
+
+	def _new_id(self):
+		"""
+		Reserva un identificador para un recordatorio nuevo. Debe llamarse con el cerrojo tomado.
+		"""
+		reminder_id = self._next_id
+		self._next_id += 1
+		return reminder_id
+
+	def _append_reminder(self, reminder):
+		"""
+		Añade un recordatorio, lo programa y lo registra en el almacén. Debe llamarse con el cerrojo tomado.
+		"""
+		self._reminders[reminder.id] = reminder
+		self._names[self._normalize_name(reminder.message)] = reminder
+		reminder.revision += 1
+		self._schedule(reminder)
+		self._persist_put(reminder)
+
+	def _apply_changes(self, reminder, persist=True, **changes):
+		"""
+		Modifica campos de un recordatorio en su lugar, actualiza su programación y lo registra en el almacén.
+		Debe llamarse con el cerrojo tomado.
+		Args:
+			reminder (Reminder): El recordatorio a modificar.
+			persist (bool): False para no escribirlo ahora; se escribe con su siguiente cambio o al cerrar (ver stop).
+			changes: Los campos a cambiar y sus nuevos valores.
+		"""
+		reschedule = "reminder_time" in changes
+		if reschedule:
+			self._unschedule(reminder)
+		for field, value in changes.items():
+			setattr(reminder, field, shared_text(value) if field in SHARED_FIELDS else value)
+		reminder.revision += 1
+		if reschedule:
+			self._schedule(reminder)
+		if persist:
+			self._persist_put(reminder)
+		else:
+			self._unsaved_fires.add(reminder.id)
+
+	def _remove_reminder(self, reminder):
+		"""
+		Quita un recordatorio, cancela su programación y registra la eliminación. Debe llamarse con el cerrojo tomado.
+		"""
+		del self._reminders[reminder.id]
+		self._unschedule(reminder)
+		self._forget_name(reminder)
+		self._unsaved_fires.discard(reminder.id)
+		self.persistence.delete(storage_key(reminder.message))
+
+	def _persist_put(self, reminder):
+		"""
+		Programa la escritura del recordatorio en el diario; el hilo de persistencia compacta cuando hace falta.
+		"""
+		self._unsaved_fires.discard(reminder.id)
+		self.persistence.put(storage_key(reminder.message), reminder.to_record())
+
+	def _serialize_all(self):
+		"""
+		Devuelve todos los recordatorios serializados, para escribir la instantánea.
+		"""
+		with self._lock:
+			return [reminder.to_record() for reminder in self._reminders.values()]
+
+	@staticmethod
+	def _normalize_name(name):
+		"""
+		Normaliza un nombre para compararlo sin distinguir mayúsculas (también fuera de ASCII).
+		"""
+		return name.casefold()
+
+	def _forget_name(self, reminder):
+		"""
+		Quita un recordatorio del índice de nombres, si es el que está registrado con su nombre.
+		"""
+		key = self._normalize_name(reminder.message)
+		if self._names.get(key) is reminder:
+			del self._names[key]
+
+	@requires_loaded
+	def find_reminder(self, name):
+		"""
+		Busca un recordatorio por su nombre sin distinguir mayúsculas.
+		Args:
+			name (str): El nombre (mensaje) del recordatorio.
+		Returns:
+			Reminder: El recordatorio encontrado, o None si no existe.
+		"""
+		with self._lock:
+			return self._names.get(self._normalize_name(name))
+
+	@property
+	@requires_loaded
+	def reminders(self):
+		"""
+		Copia de la lista de recordatorios, en el orden en que se añadieron.
+		Es una instantánea: los cambios posteriores no la modifican.
+		"""
+		with self._lock:
+			return list(self._reminders.values())
+
+	@requires_loaded
+	def get_reminder(self, reminder_id):
+		"""
+		Devuelve el recordatorio con el identificador indicado, o None si ya no existe.
+		"""
+		with self._lock:
+			return self._reminders.get(reminder_id)
+
+	@requires_store()
+	def delete_reminder(self, reminder_id):
+		"""
+		Elimina un recordatorio y registra el cambio en el almacén.
+		Args:
+			reminder_id (int): El identificador del recordatorio a eliminar.
+		Returns:
+			Reminder: El recordatorio eliminado, o None si ya no existía.
+		"""
+		with self._lock:
+			reminder = self._reminders.get(reminder_id)
+			if reminder is not None:
+				self._remove_reminder(reminder)
+			return reminder
+
+	@requires_store(False)
+	def restore_reminder(self, reminder):
+		"""
+		Vuelve a añadir un recordatorio retirado, conservando su identificador.
+		Args:
+			reminder (Reminder): El recordatorio a restaurar.
+		Returns:
+			bool: False si mientras tanto se añadió otro recordatorio con el mismo nombre.
+		"""
+		with self._lock:
+			if self._normalize_name(reminder.message) in self._names:
+				return False
+			self._append_reminder(reminder)
+			return True
+
+	def restore_or_warn(self, reminder):
+		"""
+		Restaura un recordatorio retirado y avisa si ya no se puede porque su nombre está en uso.
+		"""
+		if not self.restore_reminder(reminder) and self.load_error is None:
+			self.notifier.message(_("Ya existe un recordatorio con el nombre '{}'").format(reminder.message))
+
+	def add_month(self, date, months=1):
+		"""
+		Método que añade uno o varios meses a la fecha proporcionada.
+		Este método maneja la transición de meses y años correctamente. Si se pasa de
+		diciembre, se continúa en enero del año siguiente. Se utiliza el método 
+		replace de datetime para devolver una nueva fecha con el mes y el año 
+		actualizados.
+		Args:
+			date (datetime): La fecha a la que se le añadirán los meses.
+			months (int): Número de meses a añadir.
+		Returns:
+			datetime: Una nueva fecha con los meses añadidos. Si el día no existe en el mes
+			resultante (por ejemplo, el 31 de febrero) se usa el último día de ese mes.
+			"""
+
+		return add_months(date, months)
+
+	def reload_settings(self):
+		"""
+		Vuelve a leer los ajustes de la configuración de NVDA, tras guardar el panel o cambiar de perfil.
+		La instantánea se sustituye de una vez, así que los hilos que la leen nunca ven un estado a medias.
+		"""
+		self.settings = self.settings_provider()
+		if self.loaded.is_set():
+			self._update_metrics_exporter()
+
+	def _update_metrics_exporter(self):
+		"""
+		Activa o desactiva la exportación de las estadísticas según los ajustes actuales.
+		"""
+		if self.settings.export_metrics and self.metrics_exporter_factory is not None:
+			if self.metrics.exporter is None:
+				self.metrics.set_exporter(self.metrics_exporter_factory())
+		else:
+			self.metrics.set_exporter(None)
+
+	def _notify_reminder(self, reminder, missed=0):
+		"""
+		Notifica un recordatorio con sus propias repeticiones e intervalo, o con los de la configuración.
+		"""
+		repetitions, interval = self.settings.notification_for(reminder)
+		self.notify(reminder.message, reminder.sound_file, reminder.tasks, missed, repetitions, interval)
+
+	def _notify_group(self, announced):
+		"""
+		Notifica en un solo aviso varios recordatorios que vencieron a la vez.
+		Se usan las repeticiones y el intervalo del primero y el primer sonido personalizado que haya.
+		Args:
+			announced (list): Pares (recordatorio, apariciones perdidas); si hay alguna se incluye un resumen.
+		"""
+		reminders = [reminder for reminder, missed in announced]
+		repetitions, interval = self.settings.notification_for(reminders[0])
+		sound_file = next((reminder.sound_file for reminder in reminders if reminder.sound_file), None)
+		#Translators: Aviso de varios recordatorios de intervalo corto que llegan a la vez; {} es la lista de sus nombres.
+		notification_message = _("Recordatorios: {}").format(", ".join(reminder.message for reminder in reminders))
+		for reminder, missed in announced:
+			if missed:
+				#Translators: Resumen de avisos perdidos dentro del aviso de varios recordatorios; {count} es el número de avisos y {name} el recordatorio.
+				notification_message += "\n" + ngettext(
+					"Se perdió {count} aviso de {name} mientras el equipo estaba apagado o suspendido.",
+					"Se perdieron {count} avisos de {name} mientras el equipo estaba apagado o suspendido.",
+					missed
+				).format(count=missed, name=reminder.message)
+		with self.metrics.timer(NOTIFY):
+			self.notifier.notify(notification_message, sound_file, repetitions, interval)
+
+	def notify(self, message, sound_file=None, tasks=None, missed=0, repetitions=None, interval=None):
+		"""
+		Método que envía la notificación cuando llega la hora del recordatorio.
+		Construye el mensaje una sola vez y delega los avisos y sus repeticiones al despachador.
+		Args:
+			message (str): el mensaje que se mostrará al usuario
+			sound_file (str): Ruta al sonido personalizado, si se seleccionó
+			tasks (list): Lista de objetos Task con las tareas del recordatorio.
+			missed (int): Número de apariciones perdidas antes de esta; si hay alguna se incluye un resumen.
+			repetitions (int): Veces que se anuncia; None para usar la configuración.
+			interval (int): Segundos entre anuncios; None para usar la configuración.
+		"""
+		if tasks is None:
+			tasks = []
+
+		# Los ajustes ya están convertidos en la instantánea; basta con leerla una vez.
+		settings = self.settings
+		num_times = repetitions if repetitions is not None else settings.repetitions
+		if interval is None:
+			interval = settings.interval
+
+		all_tasks_completed = True
+		if tasks:
+			all_tasks_completed = all(task.completed for task in tasks)
+
+		notification_message = _("Recordatorio: {}").format(message)
+		if tasks:
+			tasks_str = "\n" + _("Tareas:") + "\n" + "\n".join([
+				f"- {TASK_COMPLETED_STATUS if task.completed else TASK_PENDING_STATUS} {task.description}"
+				for task in tasks
+			])
+			notification_message += tasks_str
+			if not all_tasks_completed:
+				notification_message += "\n" + INCOMPLETE_TASKS_MESSAGE.format(message)
+			else:
+				notification_message += "\n" + ALL_TASKS_COMPLETED_MESSAGE.format(message)
+		if missed:
+			#Translators: Resumen de los avisos perdidos de un recordatorio recurrente; {} es el número de avisos.
+			notification_message += "\n" + ngettext(
+				"Se perdió {} aviso de este recordatorio mientras el equipo estaba apagado o suspendido.",
+				"Se perdieron {} avisos de este recordatorio mientras el equipo estaba apagado o suspendido.",
+				missed
+			).format(missed)
+
+		# Las repeticiones se programan en el despachador, así el planificador nunca se bloquea esperando entre avisos.
+		with self.metrics.timer(NOTIFY):
+			self.notifier.notify(notification_message, sound_file, num_times, interval)
+
+	def stop(self):
+		"""
+		Método que detiene el hilo de  verificación de los recordatorios
+		"""
+		if self._thread is None and not self.loaded.is_set():
+			# No se llegó a abrir (por ejemplo, en modo seguro), así que no hay nada que detener ni guardar.
+			return
+		self.loaded.wait()
+		# Se cambia el estado de running a False para detener la verificación
+		with self._condition:
+			self.running = False
+			# Despertamos al hilo para que termine sin esperar al siguiente vencimiento.
+			self._condition.notify_all()
+		self.notifier.stop()
+		if self.load_error is None:
+			# Guardamos la hora de los recordatorios de intervalo corto, que no se escribe en cada aviso.
+			with self._lock, self.persistence.batch():
+				for reminder_id in list(self._unsaved_fires):
+					self._persist_put(self._reminders[reminder_id])
+			# Escribimos lo pendiente y dejamos todo en la instantánea para que el próximo inicio no tenga que reaplicar el diario.
+			self.persistence.stop()
+			if self.store.journal_records:
+				self.save_reminders()
+		# Si la carga falló no se escribe nada: el archivo que no se pudo leer queda tal cual para poder recuperarlo.
+		if self.store is not None:
+			self.store.close()
+		# Escribimos las estadísticas que queden pendientes.
+		self.metrics.set_exporter(None)
+
+	@requires_store()
+	def save_reminders(self):
+		"""
+		Método para guardar todos los recordatorios en el archivo .json.
+		Compacta el almacén de forma síncrona: escribe una instantánea completa y vacía el diario.
+		Los cambios individuales no necesitan llamarlo, ya que se anexan al diario en segundo plano.
+		"""
+		self.persistence.compact()
+
+	@requires_loaded
+	def export_reminders(self, path):
+		"""
+		Exporta todos los recordatorios a un archivo JSON, sea cual sea el almacén en uso.
+		Returns:
+			int: El número de recordatorios exportados.
+		"""
+		items = self._serialize_all()
+		export_json(items, path)
+		return len(items)
+
+	@requires_store(())
+	def import_reminders(self, path):
+		"""
+		Añade los recordatorios de un archivo JSON exportado, con una única escritura en el almacén.
+		Los que tienen el nombre de uno existente o un formato inesperado se omiten.
+		Returns:
+			list: Los recordatorios añadidos.
+		Raises:
+			OSError, ValueError: Si el archivo no se puede leer o no es una exportación válida.
+		"""
+		items = import_json(path)
+		reminders = []
+		for item in items:
+			try:
+				reminder = Reminder.from_record(item)
+			except (TypeError, ValueError, KeyError):
+				reminder = None
+			if reminder is not None:
+				reminders.append(reminder)
+		with self._lock, self.persistence.batch():
+			imported = []
+			for reminder in reminders:
+				if self._normalize_name(reminder.message) in self._names:
+					continue
+				# Los identificadores del archivo pertenecen a otra instalación; se asignan nuevos.
+				reminder.id = self._new_id()
+				self._append_reminder(reminder)
+				imported.append(reminder)
+			return imported
+
+	def load_reminders(self):
+		"""
+		Método para cargar los recordatorios desde el archivo json y el diario de cambios.
+		"""
+		with _gc_paused():
+			# El almacén lee la instantánea y reaplica el diario; si no existen devuelve una lista vacía.
+			reminders_data = self.store.load()
+			# Convertimos los datos cargados en objetos Reminder, aceptando también los formatos de versiones anteriores.
+			reminders = []
+			for item in reminders_data:
+				reminder = Reminder.from_record(item)
+				if reminder is None:
+					continue # Saltar entradas con formato inesperado
+				reminders.append(reminder)
+			with self._lock:
+				# Los recordatorios guardados por versiones anteriores no traen identificador; les asignamos uno nuevo.
+				self._next_id = max((reminder.id for reminder in reminders if reminder.id is not None), default=0) + 1
+				for reminder in reminders:
+					if reminder.id is None:
+						reminder.id = self._new_id()
+				self._reminders = {reminder.id: reminder for reminder in reminders}
+				self._names = {self._normalize_name(reminder.message): reminder for reminder in reminders}
+				# Programamos todos los recordatorios cargados de una sola vez.
+				self._rebuild_schedule()
+
+	@requires_store(False)
+	def update_reminder(self, reminder_id, **changes):
+		"""
+		Actualiza en su lugar un recordatorio existente. Solo cambian los campos indicados; el mensaje no cambia.
+		Args:
+			reminder_id (int): El identificador del recordatorio a actualizar.
+			changes: Los nuevos valores de reminder_time, recurrence, sound_file, custom_interval o tasks.
+		Returns:
+			bool: True si se actualizó, False si el recordatorio ya no existe.
+		"""
+		unknown_fields = set(changes) - UPDATABLE_FIELDS
+		if unknown_fields:
+			raise TypeError("Campos no modificables: {}".format(", ".join(sorted(unknown_fields))))
+		if changes.get("sound_file"):
+			self.notifier.preload([changes["sound_file"]])
+		with self._lock:
+			reminder = self._reminders.get(reminder_id)
+			if reminder is None:
+				return False
+			self._apply_changes(reminder, **changes)
+			return True
+
+	@requires_store(())
+	def bulk_delete(self, reminder_ids):
+		"""
+		Elimina varios recordatorios en una sola operación, con una única escritura en el almacén.
+		Args:
+			reminder_ids (iterable): Los identificadores de los recordatorios a eliminar.
+		Returns:
+			list: Los recordatorios eliminados; los que ya no existían se omiten.
+		"""
+		with self._lock, self.persistence.batch():
+			removed = []
+			for reminder_id in reminder_ids:
+				reminder = self._reminders.get(reminder_id)
+				if reminder is not None:
+					self._remove_reminder(reminder)
+					removed.append(reminder)
+			return removed
+
+	@requires_store(())
+	def bulk_update(self, reminder_ids, **changes):
+		"""
+		Aplica los mismos cambios a varios recordatorios en una sola operación, con una única escritura.
+		Args:
+			reminder_ids (iterable): Los identificadores de los recordatorios a actualizar.
+			changes: Los nuevos valores, como en update_reminder.
+		Returns:
+			list: Los recordatorios actualizados; los que ya no existían se omiten.
+		"""
+		unknown_fields = set(changes) - UPDATABLE_FIELDS
+		if unknown_fields:
+			raise TypeError("Campos no modificables: {}".format(", ".join(sorted(unknown_fields))))
+		if changes.get("sound_file"):
+			self.notifier.preload([changes["sound_file"]])
+		with self._lock, self.persistence.batch():
+			updated = []
+			for reminder_id in reminder_ids:
+				reminder = self._reminders.get(reminder_id)
+				if reminder is not None:
+					# Cada recordatorio recibe su propia copia de las tareas.
+					reminder_changes = dict(changes)
+					if "tasks" in reminder_changes:
+						reminder_changes["tasks"] = [task.copy() for task in changes["tasks"]]
+					self._apply_changes(reminder, **reminder_changes)
+					updated.append(reminder)
+			return updated
+
+	@requires_store(())
+	def bulk_snooze(self, reminder_ids, minutes):
+		"""
+		Pospone varios recordatorios los minutos indicados a partir de ahora, con una única escritura.
+		Returns:
+			list: Los recordatorios pospuestos.
+		"""
+		return self.bulk_update(reminder_ids, reminder_time=self.clock.now() + timedelta(minutes=minutes))
+
+	@requires_store(())
+	def bulk_complete_tasks(self, reminder_ids):
+		"""
+		Marca como completadas todas las tareas de varios recordatorios, con una única escritura.
+		Returns:
+			list: Los recordatorios actualizados.
+		"""
+		with self._lock, self.persistence.batch():
+			updated = []
+			for reminder_id in reminder_ids:
+				reminder = self._reminders.get(reminder_id)
+				if reminder is not None:
+					self._apply_changes(reminder, tasks=[Task(task.description, True) for task in reminder.tasks])
+					updated.append(reminder)
+			return updated
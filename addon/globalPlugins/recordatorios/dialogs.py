@@ -0,0 +1,1008 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Ventanas y diálogos del complemento.
+Importan wx.adv y definen muchas clases, así que este módulo no se carga con NVDA
+sino la primera vez que se abre una ventana.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import wx
+import wx.adv
+import addonHandler
+addonHandler.initTranslation()
+
+import gui
+import globalVars
+import ui
+from . import (
+	NOTIFICATION_INTERVAL_CHOICES, NOTIFICATION_REPETITION_CHOICES, REMINDER_DELETED_MESSAGE, reminder_manager
+)
+from .adapters import play_sound_asset, sound_cache
+from .core import RECURRENCE_KEYS, RECURRENCE_LABELS, format_reminder_date
+from .models import Task
+from .sounds import SoundLibraryIndex
+from .timeformat import format_time_remaining
+
+# Etiqueta del campo de tareas en la ventana para añadir recordatorios.
+TASK_REMINDER_LABEL = _("&Tareas (una por línea):")
+
+# IDs para el diálogo de tareas incompletas
+ID_DELETE = wx.NewIdRef()
+ID_REVIEW_SNOOZE = wx.NewIdRef()
+ID_SNOOZE = wx.NewIdRef()
+
+# Índice de los archivos de las carpetas de sonidos, para no recorrerlas cada vez que se abre la ventana.
+sound_library = SoundLibraryIndex(os.path.join(globalVars.appArgs.configPath, "indice_sonidos.json"))
+
+
+class ReminderApp(wx.Frame):
+	"""
+	Clase que contiene la interfaz para añadir un nuevo recordatorio.
+	Hereda de wx.frame.
+	"""
+	
+	def __init__(self, *args, **kw):
+		super(ReminderApp, self).__init__(*args, **kw)
+		# Configuramos el título de la ventana y el tamaño de la misma
+		self.SetTitle(_("Añadir recordatorio"))
+		self.SetSize((400, 550)) # Aumentar el tamaño para el campo de tareas
+		# Variables para el sonido personalizado
+		self.sound_folder = None
+		self.selected_sound = None
+		self.include_subfolders = False
+		
+		# Creamos el panel que contendrá los elementos de la interfaz
+		self.panel = wx.Panel(self)
+		# Llamado al método para crear la interfaz.
+		self.create_interface()
+		# Configuración de los atajos con accelerators
+		self.setup_accelerators()
+		self.reminder_manager = reminder_manager
+		# evento para salir de la interfaz.
+		self.Bind(wx.EVT_CLOSE, self.close)
+		# Inicializar DatePickerCtrl con la fecha actual
+		today = wx.DateTime.Now()
+		self.date_picker.SetValue(today)
+
+
+		# Cargar la configuración de sonidos
+		self.load_sound_config()
+
+	def save_sound_config(self):
+		"""
+		Guarda la carpeta de sonidos y el archivo seleccionado en el JSON.
+		"""
+		config_path = os.path.join(globalVars.appArgs.configPath, "sonidos_recordatorios.json")
+		with open(config_path, 'w') as file:
+			config_data = {
+				"sound_folder": self.sound_folder,
+				"selected_sound": self.selected_sound,
+				"include_subfolders": self.include_subfolders
+			}
+			json.dump(config_data, file)
+
+	def load_sound_config(self):
+		"""
+		Carga la configuración de sonidos (carpeta y archivo) desde el JSON.
+		"""
+		config_path = os.path.join(globalVars.appArgs.configPath, "sonidos_recordatorios.json")
+		if os.path.exists(config_path):
+			with open(config_path, 'r') as file:
+				config_data = json.load(file)
+				self.sound_folder = config_data.get("sound_folder")
+				self.selected_sound = config_data.get("selected_sound")
+				self.include_subfolders = bool(config_data.get("include_subfolders", False))
+				self.subfolders_check.SetValue(self.include_subfolders)
+				# Si ya hay una carpeta, la recorremos en segundo plano; el sonido guardado se selecciona al terminar.
+				if self.sound_folder and os.path.exists(self.sound_folder):
+					self.load_sounds_from_folder()
+				else:
+					self.sound_folder = None
+					self.selected_sound = None
+					self.save_sound_config()
+
+	def create_interface(self):
+		"""
+		Método que contiene todos los elementos para la interfaz.
+		"""
+		# Creamos el sizer, vertical.
+		sizer = wx.BoxSizer(wx.VERTICAL)
+		# Etiqueta y cuadro para el mensaje del recordatorio
+		#Translators: Etiqueta que indica al usuario que escriba el mensaje para el recordatorio, mensaje a ser mostrado en la notificación.
+		message_label = wx.StaticText(self.panel, label=_("&Mensaje del Recordatorio:"))
+		sizer.Add(message_label, 0, wx.ALL | wx.EXPAND, 5)
+
+		self.message_field = wx.TextCtrl(self.panel)
+		sizer.Add(self.message_field, 0, wx.ALL | wx.EXPAND, 5)
+
+		# Campo para tareas (checklist)
+		tasks_label = wx.StaticText(self.panel, label=TASK_REMINDER_LABEL)
+		sizer.Add(tasks_label, 0, wx.ALL | wx.EXPAND, 5)
+		self.tasks_field = wx.TextCtrl(self.panel, style=wx.TE_MULTILINE | wx.TE_DONTWRAP)
+		sizer.Add(self.tasks_field, 1, wx.ALL | wx.EXPAND, 5) # Usar 1 para que ocupe espacio vertical
+
+		# Nueva casilla para seleccionar si usar fecha específica
+		#Translators: Casilla que pregunta al usuario si desea usar una fecha específica
+		self.specific_date_check = wx.CheckBox(self.panel, label=_("&Usar fecha específica"))
+		sizer.Add(self.specific_date_check, 0, wx.ALL | wx.EXPAND, 5)
+		self.specific_date_check.Bind(wx.EVT_CHECKBOX, self.toggle_specific_date)
+
+		# Contenedor para selector de fecha
+		#Translators: Etiqueta para el selector de fecha específica
+		self.date_label = wx.StaticText(self.panel, label=_("Selecciona una fecha, utilizando flechas izquierda/derecha para moverse entre día, mes y año, y flechas arriba para modificar los valores:"))
+		sizer.Add(self.date_label, 0, wx.ALL | wx.EXPAND, 5)
+		# Ocultada por defecto
+		self.date_label.Hide()
+	
+		# Usar DatePickerCtrl para seleccionar fecha
+		self.date_picker = wx.adv.DatePickerCtrl(self.panel, style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
+		sizer.Add(self.date_picker, 0, wx.ALL | wx.EXPAND, 5)
+		# Ocultado por defecto
+		self.date_picker.Hide()
+		self.date_picker.Bind(wx.EVT_KEY_DOWN, self.on_date_key)
+		self.date_picker.Bind(wx.adv.EVT_DATE_CHANGED, self.on_date_changed)
+		# Mantener el seguimiento del componente actualmente seleccionado (día, mes, año)
+		self.current_date_component = "día"  # Valores posibles: "día", "mes", "año"
+		# Mantener la fecha anterior para detectar cambios
+		self.previous_date = self.date_picker.GetValue()
+		# Etiqueta y ComboBox para seleccionar la hora del recordatorio.
+		#Translators: Etiqueta para indicar al usuario la selección de la hora, entre 00-23
+		hours_label = wx.StaticText(self.panel, label=_("&Hora (formato 24h):"))
+		sizer.Add(hours_label, 0, wx.ALL | wx.EXPAND, 5)
+		self.hours_field = wx.ComboBox(self.panel, choices=[str(i).zfill(2) for i in range(24)], style=wx.CB_DROPDOWN)
+		sizer.Add(self.hours_field, 0, wx.ALL | wx.EXPAND, 5)
+		#self.hours_field.SetSelection(0)
+
+		# Etiqueta y ComboBox para la selección de los minutos
+		#Translators: Etiqueta para indicar al usuario que seleccione un minuto, entre 00-59
+		minutes_label = wx.StaticText(self.panel, label=_("&Minutos:"))
+		sizer.Add(minutes_label, 0, wx.ALL | wx.EXPAND, 5)
+		self.minutes_field = wx.ComboBox(self.panel, choices=[str(i).zfill(2) for i in range(60)], style=wx.CB_DROPDOWN)
+		sizer.Add(self.minutes_field, 0, wx.ALL | wx.EXPAND, 5)
+		#self.minutes_field.SetSelection(0)
+
+		# Etiqueta y casilla de verificación preguntando si el recordatorio será recurrente.
+		#Translators: Casilla que pregunta al usuario si el recordatorio será recurrente.
+		self.recurrence_check = wx.CheckBox(self.panel, label=_("&Recordatorio recurrente"))
+		sizer.Add(self.recurrence_check, 0, wx.ALL | wx.EXPAND, 5)
+		self.recurrence_check.Bind(wx.EVT_CHECKBOX, self.toggle_recurrence)
+
+		# Etiqueta y ComboBox para seleccionar la recurrencia
+		#Translators: Etiqueta que solicita al usuario seleccionar la recurrencia del recordatorio.
+		self.recurrence_label = wx.StaticText(self.panel, label=_("Selecciona la frecuencia con la que llegará el recordatorio."))
+		sizer.Add(self.recurrence_label, 0, wx.ALL | wx.EXPAND, 5)
+		# Ocultada por defecto
+		self.recurrence_label.Hide()
+		#Translators: Cuadro convinado con las opciones para la recurrencia del recordatorio.
+		self.recurrence_choice = wx.ComboBox(self.panel, choices=list(RECURRENCE_LABELS), style=wx.CB_READONLY)
+		sizer.Add(self.recurrence_choice, 0, wx.ALL | wx.EXPAND, 5)
+		# Seleccionamos por defecto diario como recurrencia.
+		self.recurrence_choice.SetSelection(0)
+		self.recurrence_choice.Bind(wx.EVT_COMBOBOX, self.on_recurrence_selection)
+		# Ocultamos el ComboBox por defecto.
+		self.recurrence_choice.Hide()
+		#Translators: Etiqueta que pregunta al usuario el intervalo para la recurrencia.
+		self.custom_interval_label = wx.StaticText(self.panel, label=_("Intervalo de recurrencia personalizada (en minutos):"))
+		sizer.Add(self.custom_interval_label, 0, wx.ALL | wx.EXPAND, 5)
+		self.custom_interval_label.Hide()
+		self.custom_interval_field = wx.TextCtrl(self.panel)
+		sizer.Add(self.custom_interval_field, 0, wx.ALL | wx.EXPAND, 5)
+		self.custom_interval_field.Hide()
+
+		# Checkbox para habilitar sonido personalizado
+		#Translators: Etiqueta que pregunta al usuario si desea utilizar un sonido personalizado para el recordatorio.
+		self.custom_sound_check = wx.CheckBox(self.panel, label=_("&Usar sonido personalizado"))
+		sizer.Add(self.custom_sound_check, 0, wx.ALL | wx.EXPAND, 5)
+		# enlasar evento a la casilla.
+		self.custom_sound_check.Bind(wx.EVT_CHECKBOX, self.toggle_custom_sound)
+		# Etiqueta y comboBox para mostrar los sonidos en la carpeta seleccionada
+		#Translators: Etiqueta que solicita al usuario seleccionar un sonido cargado en la lista.
+		self.select_sound_label = wx.StaticText(self.panel, label=_("Selecciona un sonido de la lista."))
+		sizer.Add(self.select_sound_label, 0, wx.ALL | wx.EXPAND, 5)
+		# Se oculta por defecto.
+		self.select_sound_label.Hide()
+		self.sound_choice = wx.ComboBox(self.panel, choices=[], style= wx.CB_READONLY)
+		sizer.Add(self.sound_choice, 0, wx.ALL | wx.EXPAND, 5)
+		self.sound_choice.Hide()
+		# Casilla para incluir también los sonidos de las subcarpetas.
+		#Translators: Casilla que permite buscar los sonidos también dentro de las subcarpetas de la carpeta de sonidos.
+		self.subfolders_check = wx.CheckBox(self.panel, label=_("Incluir &subcarpetas"))
+		sizer.Add(self.subfolders_check, 0, wx.ALL | wx.EXPAND, 5)
+		self.subfolders_check.Bind(wx.EVT_CHECKBOX, self.on_toggle_subfolders)
+		self.subfolders_check.Hide()
+
+		# Botón para reproducir el sonido seleccionado.
+		#Translators: Botón para reproducir el sonido personalizado. se le indica al usuario que utilice la convinación ctrl+p como atajo de teclado.
+		self.play_button = wx.Button(self.panel, label=_("Reproducir  ctrl+p"))
+		sizer.Add(self.play_button, 0, wx.ALL | wx.CENTER, 5)
+		self.play_button.Bind(wx.EVT_BUTTON, self.on_play_sound)
+		# Ocultado por defecto.
+		self.play_button.Hide()
+
+		# Botón para seleccionar carpeta de sonidos
+		#Translators: Botón para cargar una carpeta de sonidos. Se le indica al usuario que presione ctrl+f como atajo de teclado.
+		self.select_folder_btn = wx.Button(self.panel, label=_("Seleccionar carpeta de sonidos  ctrl+f"))
+		sizer.Add(self.select_folder_btn, 0, wx.ALL | wx.CENTER, 5)
+		self.select_folder_btn.Bind(wx.EVT_BUTTON, self.on_select_folder)
+		# Se oculta por defecto.
+		self.select_folder_btn.Hide()
+
+		# Casilla para que este recordatorio tenga sus propias repeticiones e intervalo entre avisos.
+		#Translators: Casilla que permite indicar, solo para este recordatorio, cuántas veces se avisa y cada cuánto.
+		self.custom_notification_check = wx.CheckBox(self.panel, label=_("Personalizar los a&visos de este recordatorio"))
+		sizer.Add(self.custom_notification_check, 0, wx.ALL | wx.EXPAND, 5)
+		self.custom_notification_check.Bind(wx.EVT_CHECKBOX, self.toggle_custom_notification)
+		#Translators: Etiqueta para elegir cuántas veces se anuncia este recordatorio.
+		self.repetitions_label = wx.StaticText(self.panel, label=_("Número de notificaciones para este recordatorio:"))
+		sizer.Add(self.repetitions_label, 0, wx.ALL | wx.EXPAND, 5)
+		self.repetitions_choice = wx.ComboBox(self.panel, choices=NOTIFICATION_REPETITION_CHOICES, style=wx.CB_READONLY)
+		sizer.Add(self.repetitions_choice, 0, wx.ALL | wx.EXPAND, 5)
+		#Translators: Etiqueta para elegir los segundos entre las notificaciones de este recordatorio.
+		self.notification_interval_label = wx.StaticText(self.panel, label=_("Intervalo entre notificaciones (en segundos):"))
+		sizer.Add(self.notification_interval_label, 0, wx.ALL | wx.EXPAND, 5)
+		self.notification_interval_choice = wx.ComboBox(self.panel, choices=NOTIFICATION_INTERVAL_CHOICES, style=wx.CB_READONLY)
+		sizer.Add(self.notification_interval_choice, 0, wx.ALL | wx.EXPAND, 5)
+		# Ocultos por defecto.
+		for control in self.custom_notification_controls:
+			control.Hide()
+
+		# Botón para agregar el recordatorio.
+		#Translators: Botón para guardar el recordatorio.
+		add_button = wx.Button(self.panel, label=_("&Agregar Recordatorio"))
+		sizer.Add(add_button, 0, wx.ALL | wx.CENTER, 5)
+		add_button.Bind(wx.EVT_BUTTON, self.add_reminder)       
+		
+		# Botón de donación.
+		#Translators: Botón que le indica al usuario que puede realizar una donación.
+		donate_button = wx.Button(self.panel, label=_("&Donar al desarrollador del complemento"))
+		sizer.Add(donate_button, 0, wx.ALL | wx.CENTER, 5)
+		donate_button.Bind(wx.EVT_BUTTON, self.donate)
+		# Botón para cancelar y cerrar la interfaz.
+		#Translators: Este botón cancela y cierra la interfaz de recordatorios.
+		cancel_button = wx.Button(self.panel, label=_("Salir  ctrl+q"))
+		sizer.Add(cancel_button, 0, wx.ALL | wx.CENTER, 5)
+		cancel_button.Bind(wx.EVT_BUTTON, self.close)
+
+		self.panel.SetSizer(sizer)
+
+	def toggle_specific_date(self, event):
+		"""
+		Método que alterna la visibilidad del selector de fecha en función de si está marcada la casilla.
+		"""
+		if self.specific_date_check.IsChecked():
+			self.date_picker.Show()
+			self.date_label.Show()
+		else:
+			self.date_picker.Hide()
+			self.date_label.Hide()
+		self.panel.Layout()
+
+	def toggle_recurrence(self, event):
+		"""
+		Método que alterna la casilla recurrence para mostrar contenido en base a si está marcada o no.
+		"""
+		# Verificamos si la casilla de verificación está marcada.
+		if self.recurrence_check.IsChecked():
+			# Si es así, mostramos los elementos self.recurrence_choice y self.recurrence_label
+			self.recurrence_choice.Show()
+			self.recurrence_label.Show()
+		else:
+			# en caso contrario, solo los mantenemos ocultos.
+			self.recurrence_choice.Hide()
+			self.recurrence_label.Hide()
+		# Actualizamos la interfaz.
+		self.panel.Layout()
+
+	def on_date_key(self, event):
+		"""
+		Maneja eventos de teclado en el selector de fecha para proporcionar retroalimentación verbal.
+		"""
+		key_code = event.GetKeyCode()
+		date = self.date_picker.GetValue()
+		
+		# Detectar navegación entre día, mes y año (izquierda/derecha)
+		if key_code == wx.WXK_LEFT:
+			# Mover a la izquierda (por ejemplo, de mes a día)
+			if self.current_date_component == "mes":
+				self.current_date_component = "día"
+				ui.message(_("Día: {}").format(date.GetDay()))
+			elif self.current_date_component == "año":
+				self.current_date_component = "mes"
+				ui.message(_("Mes: {}").format(date.GetMonth() + 1))
+		
+		elif key_code == wx.WXK_RIGHT:
+			# Mover a la derecha (por ejemplo, de día a mes)
+			if self.current_date_component == "día":
+				self.current_date_component = "mes"
+				ui.message(_("Mes: {}").format(date.GetMonth() + 1))
+			elif self.current_date_component == "mes":
+				self.current_date_component = "año"
+				ui.message(_("Año: {}").format(date.GetYear()))
+		
+		# Detectar cambios de valor (arriba/abajo) - el cambio real se manejará en on_date_changed
+		elif key_code in (wx.WXK_UP, wx.WXK_DOWN):
+			# Guardar la fecha actual para compararla después del evento
+			self.previous_date = date
+		
+		# Procesar el evento normalmente
+		event.Skip()
+
+	def on_date_changed(self, event):
+		"""
+		Se llama cuando cambia la fecha, ya sea por teclado o por selección directa.
+		Proporciona retroalimentación verbal sobre el cambio.
+		"""
+		# Obtener la nueva fecha
+		new_date = self.date_picker.GetValue()
+		old_date = self.previous_date
+	
+		# Comprobar qué componente ha cambiado
+		if new_date.GetDay() != old_date.GetDay():
+			ui.message(_("Día: {}").format(new_date.GetDay()))
+			self.current_date_component = "día"
+		elif new_date.GetMonth() != old_date.GetMonth():
+			ui.message(_("Mes: {}").format(new_date.GetMonth() + 1))
+			self.current_date_component = "mes"
+		elif new_date.GetYear() != old_date.GetYear():
+			ui.message(_("Año: {}").format(new_date.GetYear()))
+			self.current_date_component = "año"
+		
+		# Actualizar la fecha anterior
+		self.previous_date = new_date
+		
+		# Procesar el evento normalmente
+		event.Skip()
+
+	def on_recurrence_selection(self, event):
+		selection = self.recurrence_choice.GetStringSelection()
+		if selection == _("Personalizado"):
+			self.custom_interval_field.Show()
+			self.custom_interval_label.Show()
+		else:
+			self.custom_interval_field.Hide()
+			self.custom_interval_label.Hide()
+		self.panel.Layout()
+
+	def toggle_custom_sound(self, event):
+		"""
+		al igual que el método anterior, alterna entre mostrar contenido si la casilla está marcada o no.
+		"""
+		# Si la casilla está marcada
+		if self.custom_sound_check.IsChecked():
+			"""
+			Semuestran los siguientes elementos
+			self.select_folder_btn,
+			self.play_button,
+			self.sound_choice,
+			self.subfolders_check,
+			y self.select_sound_label
+			"""
+			
+			self.select_folder_btn.Show()
+			self.play_button.Show()
+			self.sound_choice.Show()
+			self.subfolders_check.Show()
+			self.select_sound_label.Show()
+		else:
+			# En caso contrario, se mantienen ocultos los elementos.
+			self.select_folder_btn.Hide()
+			self.play_button.Hide()
+			self.sound_choice.Hide()
+			self.subfolders_check.Hide()
+			self.select_sound_label.Hide()
+		# Actualizamos la interfaz
+		self.panel.Layout()
+
+	@property
+	def custom_notification_controls(self):
+		"""
+		Controles que se muestran al marcar la casilla de avisos personalizados.
+		"""
+		return (self.repetitions_label, self.repetitions_choice, self.notification_interval_label, self.notification_interval_choice)
+
+	def toggle_custom_notification(self, event):
+		"""
+		Método que muestra u oculta las opciones de avisos propios del recordatorio.
+		Al mostrarlas, se parte de los valores de la configuración general.
+		"""
+		show = self.custom_notification_check.IsChecked()
+		if show:
+			settings = self.reminder_manager.settings
+			self.repetitions_choice.SetStringSelection(str(settings.repetitions))
+			self.notification_interval_choice.SetStringSelection(str(settings.interval))
+		for control in self.custom_notification_controls:
+			control.Show(show)
+		self.panel.Layout()
+
+	def on_select_folder(self, event):
+		"""
+		Método que permite la selección de la carpeta para los sonidos.
+		"""
+		if self.custom_sound_check.IsChecked():
+			# Iniciamos el diálogo de selección de carpeta.
+			#Translators: Mensaje que solicita al usuario seleccionar la carpeta de sonidos desde el explorador.
+			with wx.DirDialog(self, _("Seleccione la carpeta de sonidos"), style=wx.DD_DEFAULT_STYLE) as dialog:
+				# Mostramos el diálogo y verificamos si el usuario presionó OK
+				if dialog.ShowModal() == wx.ID_OK:
+					# Obtenemos la carpeta seleccionada y la almacenamos en self.sound_folder
+					self.sound_folder = dialog.GetPath()
+					# llamamos a los métodos para cargar los archivos desde la carpeta y para guardar la selección en el archivo json.
+					self.load_sounds_from_folder()
+					self.save_sound_config()
+		else:
+			#Translators: Mensaje que indica al usuario que la casilla de sonido personalizado no está marcada.
+			ui.message(_("La casilla para el sonido personalizado no está marcada."))
+
+
+	def on_toggle_subfolders(self, event):
+		"""
+		Método que vuelve a cargar la lista de sonidos al marcar o desmarcar la casilla de subcarpetas.
+		"""
+		self.include_subfolders = self.subfolders_check.IsChecked()
+		self.save_sound_config()
+		self.load_sounds_from_folder()
+
+	def load_sounds_from_folder(self):
+		"""
+		Cargar los archivos de sonido de la carpeta seleccionada en el ComboBox.
+		La carpeta se recorre en un hilo en segundo plano (o se lee del índice si no cambió),
+		así la ventana no se bloquea aunque la carpeta tenga miles de archivos.
+		"""
+		# Si sound_folder tiene contenido.
+		if self.sound_folder:
+			sound_library.scan_async(
+				self.sound_folder,
+				self.include_subfolders,
+				lambda folder, recursive, sounds: wx.CallAfter(self.on_sounds_loaded, folder, recursive, sounds)
+			)
+
+	def on_sounds_loaded(self, folder, recursive, sounds):
+		"""
+		Método que recibe, en el hilo principal, los sonidos encontrados en la carpeta y los muestra en el ComboBox.
+		Args:
+			folder (str): La carpeta recorrida.
+			recursive (bool): Si se incluyeron las subcarpetas.
+			sounds (list): Las rutas de los archivos .wav, relativas a la carpeta.
+		"""
+		# La ventana pudo cerrarse, o la carpeta cambiar, mientras se recorría.
+		if not self or folder != self.sound_folder or recursive != self.include_subfolders:
+			return
+		# Añadimos los archivos obtenidos al ComboBox
+		self.sound_choice.SetItems(sounds)
+		#Si la lista sounds tiene contenido
+		if sounds:
+			# Seleccionamos el sonido guardado si sigue en la carpeta, o el primero en caso contrario.
+			paths = [os.path.join(folder, sound) for sound in sounds]
+			if self.selected_sound in paths:
+				self.sound_choice.SetSelection(paths.index(self.selected_sound))
+			else:
+				self.sound_choice.SetSelection(0)
+				# Guardar el primer sonido seleccionado
+				self.selected_sound = os.path.join(folder, sounds[0])
+				self.save_sound_config()
+
+	def on_play_sound(self, event):
+		"""
+		Método que reproduce el sonido seleccionado por el usuario en el cuadro convinado
+		"""
+		if self.custom_sound_check.IsChecked():
+			# Declaramos la variable sound y le asignamos el valor obtenido de self.sound_choice
+			sound = self.sound_choice.GetValue()
+			# Construímos la ruta completa al archivo.
+			sound_path = os.path.join(self.sound_folder, sound)
+			# Cargamos y validamos el sonido en la caché, así al llegar el recordatorio ya está en memoria.
+			asset = sound_cache.get(sound_path)
+			if asset is not None:
+				play_sound_asset(asset)
+			else:
+				#Translators: Mensaje que indica que el sonido elegido no existe o no es un archivo WAV válido.
+				ui.message(_("El sonido seleccionado no existe o no es un archivo WAV válido."))
+		else:
+			#Translators: Mensaje que indica al usuario que la casilla para el sonido personalizado no está marcada.
+			ui.message(_("La casilla para el sonido personalizado no está marcada."))
+
+	def add_reminder(self, event):
+		"""
+		Método para añadir el recordatorio.
+		"""
+		# obtenemos los datos ingresados por el usuario.
+		custom_interval = None
+		if self.custom_interval_field.GetValue():
+			try:
+				custom_interval = int(self.custom_interval_field.GetValue().strip())
+				if custom_interval <= 0:
+					raise ValueError
+			except ValueError:
+				#Translators: Mensaje de error que indica que el número para el intervalo debe de ser positivo, y número entero.
+				wx.MessageBox(_("El intervalo personalizado debe ser un número entero positivo."), _("Error"), wx.ICON_ERROR)
+				self.custom_interval_field.SetFocus()
+				return
+			
+		message = self.message_field.GetValue()
+		hours = self.hours_field.GetValue().strip()
+		minutes = self.minutes_field.GetValue().strip()
+		
+		# Procesar las tareas del campo de texto
+		tasks_text = self.tasks_field.GetValue().strip()
+		tasks = []
+		if tasks_text:
+			for line in tasks_text.splitlines():
+				task_description = line.strip()
+				if task_description:
+					tasks.append(Task(task_description))
+
+		if not message or not hours or not minutes:
+			# Mandamos un mensaje de error.
+			#Translators: Mensaje de error notificando que los campos no pueden quedar sin contenido.
+			wx.MessageBox(_("parece que alguno de los campos está sin contenido. Mensaje, horas y minutos son obligatorios. Por favor, verifica y vuelve a intentar."), _("Error"), wx.ICON_ERROR)
+			# enfocamos el cuadro de mensaje y retornamos.
+			self.message_field.SetFocus()
+			return
+
+		# Validamos que las horas y minutos sean números válidos
+		try:
+			hours = int(hours)
+			minutes = int(minutes)
+		except ValueError:
+			#Translators: Mensaje de error que indica que las horas y minutos deben de ser números enteros válidos.
+			wx.MessageBox(_("Las horas y minutos deben de ser números enteros válidos."), _("Error"), wx.ICON_ERROR)
+			# Enfocamos el cuadro de horas y retornamos.
+			self.hours_field.SetFocus()
+			return
+		# Validar si horas y minutos están dentro del rango.
+		if hours < 0 or hours > 23 or minutes < 0 or minutes > 59:
+			#Translators: Mensaje de error indicando al usuario que las horas y minutos ingresados están fuera del rango.
+			wx.MessageBox(_("Rango no válido. Las horas deben de estar entre 00 y 23, y los minutos entre 00 y 59."), _("Error"), wx.ICON_ERROR)
+			self.hours_field.SetFocus()
+			return
+
+		now = datetime.now()
+	
+		if self.specific_date_check.IsChecked():
+			# Obtener la fecha del DatePickerCtrl y convertirla a datetime
+			selected_date = self.date_picker.GetValue()
+			py_date = selected_date.GetYear(), selected_date.GetMonth() + 1, selected_date.GetDay()
+			reminder_time = datetime(py_date[0], py_date[1], py_date[2], hour=hours, minute=minutes, second=0, microsecond=0)
+		
+			# Validar que la fecha no sea en el pasado
+			if reminder_time < now:
+				#Translators: Mensaje de error indicando que la fecha seleccionada está en el pasado
+				wx.MessageBox(_("La fecha y hora seleccionadas están en el pasado. Por favor, selecciona una fecha y hora futura."), _("Error"), wx.ICON_ERROR)
+				return
+		else:
+			reminder_time = now.replace(hour=hours, minute=minutes, second=0, microsecond=0)
+			if reminder_time < now:
+				reminder_time += timedelta(days=1)
+		
+		# Guardamos el valor sin traducir para que el recordatorio funcione aunque cambie el idioma de NVDA.
+		recurrence = RECURRENCE_KEYS[self.recurrence_choice.GetSelection()] if self.recurrence_check.IsChecked() else None
+		# Si se selecciona un sonido personalizado, se guarda el archivo seleccionado
+		if self.custom_sound_check.IsChecked() and self.sound_choice.GetValue():
+			self.selected_sound = os.path.join(self.sound_folder, self.sound_choice.GetValue())
+		else:
+			self.selected_sound = None
+		# Repeticiones e intervalo propios del recordatorio, si se personalizaron.
+		repetitions = notification_interval = None
+		if self.custom_notification_check.IsChecked():
+			if self.repetitions_choice.GetValue():
+				repetitions = int(self.repetitions_choice.GetValue())
+			if self.notification_interval_choice.GetValue():
+				notification_interval = int(self.notification_interval_choice.GetValue())
+		self.reminder_manager.add_reminder(
+			message, reminder_time, recurrence, self.selected_sound, custom_interval, tasks,
+			repetitions, notification_interval
+		)
+
+		self.message_field.Clear()
+		self.tasks_field.Clear() # Limpiar el campo de tareas
+		self.hours_field.SetSelection(-1)
+		self.minutes_field.SetSelection(-1)
+		self.recurrence_check.SetValue(False)
+		self.specific_date_check.SetValue(False)
+		self.toggle_specific_date(None)
+		self.recurrence_choice.Hide()
+		self.custom_notification_check.SetValue(False)
+		self.toggle_custom_notification(None)
+	#agregar atajos de teclado
+	def setup_accelerators(self):
+		#creamos identificadores para los atajos
+		load_folder = wx.NewIdRef()
+		play_file = wx.NewIdRef()
+		close_window = wx.NewIdRef()
+		close_window_esc = wx.NewIdRef()
+		# Enlasar a eventos
+		self.Bind(wx.EVT_MENU, self.on_select_folder, id=load_folder)
+		self.Bind(wx.EVT_MENU, self.on_play_sound, id=play_file)
+		self.Bind(wx.EVT_MENU, self.close, id=close_window)
+		self.Bind(wx.EVT_MENU, self.close, id=close_window_esc)
+		# Creamos los atajos
+		accel_tbl = wx.AcceleratorTable([
+			(wx.ACCEL_CTRL, ord("F"), load_folder),
+			(wx.ACCEL_CTRL, ord("P"), play_file),
+			(wx.ACCEL_CTRL, ord("Q"), close_window),
+			(wx.ACCEL_NORMAL, wx.WXK_ESCAPE, close_window_esc)
+		])
+		self.SetAcceleratorTable(accel_tbl)
+
+	def donate(self, event):
+		"""
+		Método para abrir el navegador al enlace de paypal
+		"""
+		
+		wx.LaunchDefaultBrowser("https://paypal.me/paymentToMl")
+
+	def close(self, event):
+		self.Destroy()
+
+
+class RescheduleReminderDialog(wx.Dialog):
+	"""
+	Diálogo para seleccionar la nueva fecha y hora de un recordatorio.
+	"""
+	def __init__(self, parent, message):
+		super(RescheduleReminderDialog, self).__init__(parent, title=_("Reprogramar: {}").format(message))
+		self.panel = wx.Panel(self)
+		self.create_interface()
+		self.SetSize((350, 300))
+
+	def create_interface(self):
+		sizer = wx.BoxSizer(wx.VERTICAL)
+
+		message_label = wx.StaticText(self.panel, label=_("Selecciona la nueva fecha y hora para el recordatorio:"))
+		sizer.Add(message_label, 0, wx.ALL | wx.EXPAND, 5)
+
+		# Selector de fecha
+		self.date_picker = wx.adv.DatePickerCtrl(self.panel, style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
+		sizer.Add(self.date_picker, 0, wx.ALL | wx.EXPAND, 5)
+		today = wx.DateTime.Now()
+		self.date_picker.SetValue(today)
+
+		# Selector de horas
+		hours_label = wx.StaticText(self.panel, label=_("Nueva Hora (formato 24h):"))
+		sizer.Add(hours_label, 0, wx.ALL | wx.EXPAND, 5)
+		self.hours_field = wx.ComboBox(self.panel, choices=[str(i).zfill(2) for i in range(24)], style=wx.CB_DROPDOWN)
+		sizer.Add(self.hours_field, 0, wx.ALL | wx.EXPAND, 5)
+		self.hours_field.SetSelection(datetime.now().hour) # Pre-seleccionar la hora actual
+
+		# Selector de minutos
+		minutes_label = wx.StaticText(self.panel, label=_("Nuevos Minutos:"))
+		sizer.Add(minutes_label, 0, wx.ALL | wx.EXPAND, 5)
+		self.minutes_field = wx.ComboBox(self.panel, choices=[str(i).zfill(2) for i in range(60)], style=wx.CB_DROPDOWN)
+		sizer.Add(self.minutes_field, 0, wx.ALL | wx.EXPAND, 5)
+		self.minutes_field.SetSelection(datetime.now().minute) # Pre-seleccionar los minutos actuales
+
+		# Botones de OK y Cancelar
+		btn_sizer = wx.StdDialogButtonSizer()
+		ok_button = wx.Button(self.panel, wx.ID_OK, _("Aceptar"))
+		cancel_button = wx.Button(self.panel, wx.ID_CANCEL, _("Cancelar"))
+		btn_sizer.AddButton(ok_button)
+		btn_sizer.AddButton(cancel_button)
+		btn_sizer.Realize()
+		sizer.Add(btn_sizer, 0, wx.ALL | wx.CENTER, 5)
+
+		self.panel.SetSizer(sizer)
+
+	def get_reminder_time(self):
+		"""
+		Devuelve la fecha y hora elegidas en el diálogo.
+		"""
+		new_date_wx = self.date_picker.GetValue()
+		return datetime(
+			new_date_wx.GetYear(), 
+			new_date_wx.GetMonth() + 1, 
+			new_date_wx.GetDay(), 
+			hour=int(self.hours_field.GetValue().strip()), 
+			minute=int(self.minutes_field.GetValue().strip()), 
+			second=0, 
+			microsecond=0
+		)
+
+
+class ManageTasksDialog(wx.Dialog):
+	"""
+	Diálogo para gestionar las tareas de un recordatorio.
+	Permite marcar/desmarcar tareas como completadas.
+	"""
+	def __init__(self, parent, reminder_message, tasks):
+		super(ManageTasksDialog, self).__init__(parent, title=_("Gestionar Tareas: {}").format(reminder_message))
+		self.original_tasks = tasks
+		self.modified_tasks = [task.copy() for task in tasks] # Copia para no modificar la original directamente
+		self.checkboxes = []
+		self.panel = wx.Panel(self)
+		self.create_interface()
+		self.SetSize((450, 400)) # Ajustar tamaño del diálogo
+
+	def create_interface(self):
+		sizer = wx.BoxSizer(wx.VERTICAL)
+
+		if not self.modified_tasks:
+			no_tasks_label = wx.StaticText(self.panel, label=_("Este recordatorio no tiene tareas."))
+			sizer.Add(no_tasks_label, 0, wx.ALL | wx.EXPAND, 5)
+		else:
+			for i, task in enumerate(self.modified_tasks):
+				checkbox = wx.CheckBox(self.panel, label=task.description)
+				checkbox.SetValue(task.completed)
+				checkbox.Bind(wx.EVT_CHECKBOX, self.on_task_checkbox_toggle)
+				self.checkboxes.append(checkbox)
+				sizer.Add(checkbox, 0, wx.ALL | wx.EXPAND, 5)
+
+		btn_sizer = wx.StdDialogButtonSizer()
+		ok_button = wx.Button(self.panel, wx.ID_OK, _("Aceptar"))
+		cancel_button = wx.Button(self.panel, wx.ID_CANCEL, _("Cancelar"))
+		btn_sizer.AddButton(ok_button)
+		btn_sizer.AddButton(cancel_button)
+		btn_sizer.Realize()
+		sizer.Add(btn_sizer, 0, wx.ALL | wx.CENTER, 5)
+
+		self.panel.SetSizer(sizer)
+
+	def on_task_checkbox_toggle(self, event):
+		checkbox = event.GetEventObject()
+		index = self.checkboxes.index(checkbox)
+		self.modified_tasks[index].completed = checkbox.GetValue()
+		event.Skip()
+
+class SnoozeDialog(wx.Dialog):
+	"""Diálogo para obtener el tiempo para posponer en minutos."""
+	def __init__(self, parent):
+		super(SnoozeDialog, self).__init__(parent, title=_("Posponer recordatorio"))
+		self.panel = wx.Panel(self)
+		self.minutes = 10 # Valor por defecto
+		self.create_interface()
+		self.SetSize((300, 150))
+		self.minutes_spin.SetFocus()
+
+	def create_interface(self):
+		sizer = wx.BoxSizer(wx.VERTICAL)
+		# Translators: Label asking the user for how many minutes to snooze the reminder.
+		label = wx.StaticText(self.panel, label=_("Posponer por (minutos):"))
+		sizer.Add(label, 0, wx.ALL | wx.EXPAND, 10)
+
+		self.minutes_spin = wx.SpinCtrl(self.panel, value="10", min=1, max=1440) # Max 24 horas
+		sizer.Add(self.minutes_spin, 0, wx.ALL | wx.EXPAND, 10)
+
+		btn_sizer = wx.StdDialogButtonSizer()
+		ok_button = wx.Button(self.panel, wx.ID_OK, _("Aceptar"))
+		cancel_button = wx.Button(self.panel, wx.ID_CANCEL, _("Cancelar"))
+		btn_sizer.AddButton(ok_button)
+		btn_sizer.AddButton(cancel_button)
+		btn_sizer.Realize()
+		sizer.Add(btn_sizer, 1, wx.ALL | wx.CENTER, 10)
+
+		self.panel.SetSizer(sizer)
+
+		ok_button.Bind(wx.EVT_BUTTON, self.on_ok)
+
+	def on_ok(self, event):
+		self.minutes = self.minutes_spin.GetValue()
+		self.EndModal(wx.ID_OK)
+
+	def get_minutes(self):
+		return self.minutes
+
+class IncompleteTaskDialog(wx.Dialog):
+	"""Diálogo que se muestra cuando un recordatorio con tareas incompletas llega a su hora."""
+	def __init__(self, parent, message):
+		# Translators: Title for the dialog about a reminder with pending tasks.
+		super(IncompleteTaskDialog, self).__init__(parent, title=_("Tareas pendientes"))
+		self.panel = wx.Panel(self)
+		self.create_interface(message)
+		self.SetSize((450, 200))
+
+	def create_interface(self, message):
+		sizer = wx.BoxSizer(wx.VERTICAL)
+		# Translators: Message in the dialog explaining that the reminder has pending tasks and asking what to do.
+		label = wx.StaticText(self.panel, label=_("El recordatorio '{}' tiene tareas pendientes. ¿Qué deseas hacer?").format(message))
+		sizer.Add(label, 0, wx.ALL | wx.EXPAND, 10)
+
+		button_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+		# Translators: Button to delete the reminder anyway.
+		delete_button = wx.Button(self.panel, ID_DELETE, _("Eliminar de todos modos"))
+		# Translators: Button to review tasks, which also snoozes the reminder for 10 minutes.
+		review_button = wx.Button(self.panel, ID_REVIEW_SNOOZE, _("Revisar tareas (posponer 10 min)"))
+		# Translators: Button to open another dialog to choose a custom snooze time.
+		snooze_button = wx.Button(self.panel, ID_SNOOZE, _("Posponer..."))
+
+		button_sizer.Add(delete_button, 0, wx.ALL, 5)
+		button_sizer.Add(review_button, 0, wx.ALL, 5)
+		button_sizer.Add(snooze_button, 0, wx.ALL, 5)
+
+		sizer.Add(button_sizer, 0, wx.CENTER)
+		self.panel.SetSizer(sizer)
+
+		delete_button.Bind(wx.EVT_BUTTON, lambda evt: self.EndModal(ID_DELETE))
+		review_button.Bind(wx.EVT_BUTTON, lambda evt: self.EndModal(ID_REVIEW_SNOOZE))
+		snooze_button.Bind(wx.EVT_BUTTON, lambda evt: self.EndModal(ID_SNOOZE))
+
+def show_incomplete_task_dialog(manager, reminder):
+	"""
+	Muestra un diálogo para manejar un recordatorio no recurrente con tareas incompletas.
+	Debe llamarse desde el hilo principal usando wx.CallAfter.
+	Args:
+		manager (ReminderManager): El gestor al que se devuelve el recordatorio si se pospone.
+		reminder (Reminder): El recordatorio, ya retirado de la lista.
+	"""
+	dialog = IncompleteTaskDialog(gui.mainFrame, reminder.message)
+	result = dialog.ShowModal()
+	dialog.Destroy()
+
+	if result == ID_DELETE:
+		# El recordatorio ya fue eliminado de la lista, solo notificamos.
+		ui.message(REMINDER_DELETED_MESSAGE.format(reminder.message))
+
+	elif result == ID_REVIEW_SNOOZE:
+		# Posponer 10 minutos y notificar.
+		snooze_minutes = 10
+		reminder.reminder_time = datetime.now() + timedelta(minutes=snooze_minutes)
+		# Re-agregar el recordatorio.
+		manager.restore_or_warn(reminder)
+		# Translators: Confirmation that the reminder was snoozed and suggestion to manage tasks from the menu.
+		ui.message(_("Recordatorio pospuesto por {} minutos. Puedes gestionar las tareas desde el menú Herramientas.").format(snooze_minutes))
+
+	elif result == ID_SNOOZE:
+		# Preguntar por un tiempo personalizado para posponer.
+		snooze_dialog = SnoozeDialog(gui.mainFrame)
+		if snooze_dialog.ShowModal() == wx.ID_OK:
+			snooze_minutes = snooze_dialog.get_minutes()
+			reminder.reminder_time = datetime.now() + timedelta(minutes=snooze_minutes)
+			# Re-agregar el recordatorio
+			manager.restore_or_warn(reminder)
+			# Translators: Confirmation message that the reminder has been snoozed for a custom amount of time.
+			ui.message(_("Recordatorio pospuesto por {} minutos.").format(snooze_minutes))
+		else:
+			# El usuario canceló, re-agregamos el recordatorio para no perderlo.
+			manager.restore_or_warn(reminder)
+			# Translators: Message indicating that the snooze action was cancelled.
+			ui.message(_("Acción de posponer cancelada. El recordatorio no fue modificado."))
+		snooze_dialog.Destroy()
+	
+	else: # El diálogo fue cerrado o cancelado
+		# Re-agregar el recordatorio para no perderlo.
+		manager.restore_or_warn(reminder)
+
+
+class ReminderListCtrl(wx.ListCtrl):
+	"""
+	Lista virtual de recordatorios. Las filas se formatean solo cuando la lista las pide para
+	mostrarlas, así que el tiempo de apertura no depende del número de recordatorios.
+	"""
+	def __init__(self, parent, reminders, multiple=False):
+		"""
+		Args:
+			parent (wx.Window): La ventana que contiene la lista.
+			reminders (list): Instantánea de los recordatorios a mostrar.
+			multiple (bool): Si se permite seleccionar varios recordatorios a la vez.
+		"""
+		style = wx.LC_REPORT | wx.LC_VIRTUAL
+		if not multiple:
+			style |= wx.LC_SINGLE_SEL
+		super(ReminderListCtrl, self).__init__(parent, style=style)
+		#Translators: Columnas de la lista de recordatorios.
+		self.InsertColumn(0, _("Recordatorio"), width=300)
+		self.InsertColumn(1, _("Fecha"), width=200)
+		self.InsertColumn(2, _("Tiempo restante"), width=200)
+		self.reminders = reminders
+		# Índices (en reminders) de las filas visibles con el filtro actual.
+		self.visible = range(len(reminders))
+		self.filter_text = ""
+		# Nombres en minúsculas para filtrar; se calculan la primera vez que se escribe en el filtro.
+		self._folded_names = None
+		# Una sola hora actual para todas las filas, calculada al abrir la lista.
+		self._now = datetime.now()
+		self._today = self._now.date()
+		self.SetItemCount(len(self.visible))
+
+	def OnGetItemText(self, item, column):
+		"""
+		Método que wx llama para obtener el texto de una celda visible.
+		"""
+		reminder = self.reminders[self.visible[item]]
+		if column == 0:
+			return reminder.message
+		if column == 1:
+			return format_reminder_date(reminder.reminder_time, self._today)
+		return format_time_remaining(reminder.reminder_time, self._now)
+
+	def set_filter(self, text):
+		"""
+		Método que muestra solo los recordatorios cuyo nombre contiene el texto indicado.
+		Mientras el usuario sigue escribiendo se filtra solo lo que ya estaba visible.
+		"""
+		text = text.strip().casefold()
+		if text == self.filter_text:
+			return
+		if self._folded_names is None:
+			self._folded_names = [reminder.message.casefold() for reminder in self.reminders]
+		if not text:
+			self.visible = range(len(self.reminders))
+		else:
+			candidates = self.visible if text.startswith(self.filter_text) else range(len(self.reminders))
+			self.visible = [index for index in candidates if text in self._folded_names[index]]
+		self.filter_text = text
+		# Quitamos la selección anterior: los números de fila ya no corresponden a los mismos recordatorios.
+		self.SetItemState(-1, 0, wx.LIST_STATE_SELECTED)
+		self.SetItemCount(len(self.visible))
+		if self.visible:
+			self.Select(0)
+			self.Focus(0)
+		self.Refresh()
+
+	def get_selected_reminders(self):
+		"""
+		Devuelve los recordatorios seleccionados, en el orden de la lista.
+		"""
+		selected = []
+		item = self.GetFirstSelected()
+		while item != -1:
+			selected.append(self.reminders[self.visible[item]])
+			item = self.GetNextSelected(item)
+		return selected
+
+
+class ReminderPickerDialog(wx.Dialog):
+	"""
+	Diálogo común para elegir uno o varios recordatorios, con un campo para filtrarlos por nombre.
+	Lo usan los diálogos de eliminar, reprogramar y gestionar tareas.
+	"""
+	def __init__(self, parent, title, message, reminders, multiple=False):
+		"""
+		Args:
+			parent (wx.Window): Ventana padre, o None.
+			title (str): Título del diálogo.
+			message (str): Texto que se muestra sobre la lista.
+			reminders (list): Instantánea de los recordatorios a mostrar.
+			multiple (bool): Si se permite seleccionar varios recordatorios a la vez.
+		"""
+		super(ReminderPickerDialog, self).__init__(parent, title=title)
+		self.panel = wx.Panel(self)
+		self.create_interface(message, reminders, multiple)
+		self.SetSize((550, 450))
+		self.reminder_list.SetFocus()
+
+	def create_interface(self, message, reminders, multiple):
+		sizer = wx.BoxSizer(wx.VERTICAL)
+
+		message_label = wx.StaticText(self.panel, label=message)
+		sizer.Add(message_label, 0, wx.ALL | wx.EXPAND, 5)
+		self.reminder_list = ReminderListCtrl(self.panel, reminders, multiple)
+		sizer.Add(self.reminder_list, 1, wx.ALL | wx.EXPAND, 5)
+		if reminders:
+			self.reminder_list.Select(0)
+			self.reminder_list.Focus(0)
+		# Con Intro sobre un elemento se acepta el diálogo, igual que en los diálogos de selección de wx.
+		self.reminder_list.Bind(wx.EVT_LIST_ITEM_ACTIVATED, lambda evt: self.EndModal(wx.ID_OK))
+
+		#Translators: Etiqueta del campo para filtrar la lista de recordatorios por nombre.
+		filter_label = wx.StaticText(self.panel, label=_("&Filtrar por nombre:"))
+		sizer.Add(filter_label, 0, wx.ALL | wx.EXPAND, 5)
+		self.filter_field = wx.TextCtrl(self.panel)
+		sizer.Add(self.filter_field, 0, wx.ALL | wx.EXPAND, 5)
+		self.filter_field.Bind(wx.EVT_TEXT, self.on_filter)
+
+		btn_sizer = wx.StdDialogButtonSizer()
+		ok_button = wx.Button(self.panel, wx.ID_OK, _("Aceptar"))
+		cancel_button = wx.Button(self.panel, wx.ID_CANCEL, _("Cancelar"))
+		btn_sizer.AddButton(ok_button)
+		btn_sizer.AddButton(cancel_button)
+		btn_sizer.Realize()
+		sizer.Add(btn_sizer, 0, wx.ALL | wx.CENTER, 5)
+
+		self.panel.SetSizer(sizer)
+
+	def on_filter(self, event):
+		self.reminder_list.set_filter(self.filter_field.GetValue())
+		event.Skip()
+
+	def get_selected_reminders(self):
+		"""
+		Devuelve los recordatorios seleccionados en la lista.
+		"""
+		return self.reminder_list.get_selected_reminders()
@@ -0,0 +1,128 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Sustitutos en memoria del reloj, el notificador y el almacén del gestor de recordatorios.
+Permiten ejecutar el planificador fuera de NVDA (en pruebas y mediciones) con un reloj que avanza a mano:
+
+	clock = FakeClock(datetime(2024, 1, 1, 8, 0))
+	manager = ReminderManager(RecordingNotifier(), MemoryStore.factory(), ReminderSettings, clock)
+	manager.open()
+	clock.advance(minutes=5)
+	manager.fire_due()
+
+Este módulo no depende de NVDA.
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+from .core import Notifier
+from .models import storage_key
+
+
+class FakeClock:
+	"""
+	Reloj que solo avanza cuando se le pide.
+	"""
+
+	def __init__(self, start=None):
+		"""
+		Args:
+			start (datetime): Hora inicial. Por defecto, la actual.
+		"""
+		self.current = start if start is not None else datetime.now()
+
+	def now(self):
+		"""
+		Devuelve la hora simulada.
+		"""
+		return self.current
+
+	def advance(self, **delta):
+		"""
+		Adelanta el reloj; recibe los mismos argumentos que timedelta.
+		Returns:
+			datetime: La nueva hora.
+		"""
+		self.current += timedelta(**delta)
+		return self.current
+
+
+class RecordingNotifier(Notifier):
+	"""
+	Notificador que guarda los mensajes y avisos en listas en lugar de anunciarlos.
+	"""
+
+	def __init__(self):
+		# Mensajes breves, como las confirmaciones.
+		self.messages = []
+		# Avisos de recordatorios: (texto, sonido, repeticiones, intervalo).
+		self.notifications = []
+
+	def message(self, text):
+		self.messages.append(text)
+
+	def notify(self, text, sound_file=None, repetitions=1, interval=0):
+		self.notifications.append((text, sound_file, repetitions, interval))
+
+
+class MemoryStore:
+	"""
+	Almacén en memoria con la misma interfaz que JournalStore y SQLiteStore.
+	"""
+
+	def __init__(self, items=None, key=None):
+		"""
+		Args:
+			items (list): Elementos con los que empieza el almacén, como los devolvería load.
+			key (callable): Devuelve la clave de un elemento; por defecto, la de los recordatorios.
+		"""
+		self.key = key if key is not None else (lambda item: storage_key(item[0]))
+		self._items = {self.key(item): item for item in items or ()}
+		# Sin diario: nunca hay nada que compactar.
+		self.journal_records = 0
+		self._lock = threading.Lock()
+
+	@classmethod
+	def factory(cls, items=None):
+		"""
+		Devuelve una función para el argumento store_factory de ReminderManager.
+		"""
+		return lambda settings: cls(items)
+
+	@property
+	def needs_compaction(self):
+		return False
+
+	def load(self):
+		with self._lock:
+			return list(self._items.values())
+
+	def put(self, key, item):
+		with self._lock:
+			self._items[key] = item
+
+	def delete(self, key):
+		with self._lock:
+			self._items.pop(key, None)
+
+	def append(self, records):
+		"""
+		Aplica varios registros en el formato ["put", clave, elemento] o ["del", clave].
+		"""
+		with self._lock:
+			for record in records:
+				if record[0] == "put":
+					self._items[record[1]] = record[2]
+				else:
+					self._items.pop(record[1], None)
+
+	def compact(self, items):
+		with self._lock:
+			self._items = {self.key(item): item for item in items}
+
+	def close(self):
+		pass
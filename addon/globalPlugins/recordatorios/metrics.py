@@ -0,0 +1,261 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Estadísticas de rendimiento del gestor de recordatorios: cuánto se retrasan los avisos,
+cuánto tardan el guardado, cada ciclo del planificador y la carga inicial, y cuántos recordatorios hay en cola.
+Cada medida se acumula en un histograma de tamaño fijo, así que registrar cuesta lo mismo aunque NVDA lleve
+semanas abierto. Opcionalmente, cada valor se anexa a un archivo CSV rotativo para analizarlo después.
+Este módulo no depende de NVDA para poder usarse y probarse por separado.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+
+# Nombres de las medidas.
+FIRE_LAG = "fire_lag" # Segundos entre la hora programada de un recordatorio y su aviso.
+PERSIST = "persist" # Segundos que tarda cada escritura en el almacén.
+TICK = "tick" # Segundos que tarda el planificador en atender los recordatorios vencidos a la vez.
+NOTIFY = "notify" # Segundos que el planificador pasa entregando un aviso al notificador.
+QUEUE_DEPTH = "queue_depth" # Recordatorios programados en cada ciclo del planificador.
+LOAD = "load" # Segundos que tarda la carga inicial de los recordatorios.
+
+# Límites superiores de los intervalos de los histogramas de tiempos, en segundos.
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+# Límites superiores de los intervalos del histograma de la cola.
+DEPTH_BUCKETS = (0, 1, 2, 5, 10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000)
+BUCKETS = {QUEUE_DEPTH: DEPTH_BUCKETS}
+
+# Tamaño máximo del archivo CSV antes de rotarlo, y cuántos archivos anteriores se conservan.
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_BACKUPS = 3
+# Segundos entre escrituras del archivo CSV.
+DEFAULT_FLUSH_INTERVAL = 5
+
+
+class Histogram:
+	"""
+	Histograma con intervalos fijos: cuenta los valores de cada intervalo y guarda el total y el máximo.
+	"""
+
+	__slots__ = ("bounds", "counts", "count", "total", "maximum")
+
+	def __init__(self, bounds=TIME_BUCKETS):
+		"""
+		Args:
+			bounds (tuple): Límites superiores de los intervalos, en orden creciente.
+				Los valores mayores que el último van a un intervalo adicional.
+		"""
+		self.bounds = bounds
+		self.counts = [0] * (len(bounds) + 1)
+		self.count = 0
+		self.total = 0
+		self.maximum = None
+
+	def record(self, value):
+		"""
+		Añade un valor al histograma.
+		"""
+		self.counts[bisect_left(self.bounds, value)] += 1
+		self.count += 1
+		self.total += value
+		if self.maximum is None or value > self.maximum:
+			self.maximum = value
+
+	@property
+	def mean(self):
+		"""
+		Media de los valores, o None si no hay ninguno.
+		"""
+		return self.total / self.count if self.count else None
+
+	def percentile(self, fraction):
+		"""
+		Estima el percentil indicado con el límite superior de su intervalo.
+		Args:
+			fraction (float): El percentil como fracción, por ejemplo 0.95.
+		Returns:
+			float: El valor estimado, nunca mayor que el máximo; None si no hay valores.
+		"""
+		if not self.count:
+			return None
+		target = fraction * self.count
+		seen = 0
+		for index, count in enumerate(self.counts):
+			seen += count
+			if seen >= target:
+				break
+		if index < len(self.bounds):
+			return min(self.bounds[index], self.maximum)
+		return self.maximum
+
+	def copy(self):
+		"""
+		Devuelve una copia independiente del histograma.
+		"""
+		histogram = Histogram(self.bounds)
+		histogram.counts = list(self.counts)
+		histogram.count = self.count
+		histogram.total = self.total
+		histogram.maximum = self.maximum
+		return histogram
+
+
+class Metrics:
+	"""
+	Conjunto de histogramas del gestor de recordatorios, uno por medida.
+	Se puede registrar desde cualquier hilo.
+	"""
+
+	def __init__(self, exporter=None):
+		"""
+		Args:
+			exporter (CsvExporter): Si se indica, además recibe cada valor registrado.
+		"""
+		self._histograms = {}
+		self._lock = threading.Lock()
+		self.exporter = exporter
+
+	def record(self, name, value):
+		"""
+		Registra un valor de la medida indicada.
+		"""
+		with self._lock:
+			histogram = self._histograms.get(name)
+			if histogram is None:
+				histogram = self._histograms[name] = Histogram(BUCKETS.get(name, TIME_BUCKETS))
+			histogram.record(value)
+		exporter = self.exporter
+		if exporter is not None:
+			exporter.record(name, value)
+
+	@contextmanager
+	def timer(self, name):
+		"""
+		Registra los segundos que tarda el bloque with en la medida indicada.
+		"""
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.record(name, time.perf_counter() - start)
+
+	def histogram(self, name):
+		"""
+		Devuelve una copia del histograma de la medida indicada, o None si aún no tiene valores.
+		"""
+		with self._lock:
+			histogram = self._histograms.get(name)
+			return histogram.copy() if histogram is not None else None
+
+	def reset(self):
+		"""
+		Descarta todos los valores registrados.
+		"""
+		with self._lock:
+			self._histograms = {}
+
+	def set_exporter(self, exporter):
+		"""
+		Sustituye el exportador, cerrando el anterior. None desactiva la exportación.
+		"""
+		previous, self.exporter = self.exporter, exporter
+		if previous is not None and previous is not exporter:
+			previous.close()
+
+
+class CsvExporter:
+	"""
+	Anexa cada valor registrado a un archivo CSV (hora, medida, valor) que rota al alcanzar max_bytes.
+	Los valores se acumulan en memoria y un hilo propio los escribe cada flush_interval segundos,
+	de modo que registrar nunca espera al disco, aunque se haga con el cerrojo del planificador tomado.
+	"""
+
+	def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, backups=DEFAULT_BACKUPS, flush_interval=DEFAULT_FLUSH_INTERVAL):
+		"""
+		Args:
+			path (str): Ruta del archivo CSV. Los anteriores se guardan como path.1, path.2, etc.
+			max_bytes (int): Tamaño a partir del cual se rota el archivo.
+			backups (int): Número de archivos anteriores que se conservan.
+			flush_interval (float): Segundos entre escrituras.
+		"""
+		self.path = path
+		self.max_bytes = max_bytes
+		self.backups = backups
+		self.flush_interval = flush_interval
+		self._rows = []
+		self._condition = threading.Condition()
+		# Impide que el hilo y close escriban a la vez.
+		self._write_lock = threading.Lock()
+		self.running = True
+		worker_thread = threading.Thread(target=self._run, daemon=True)
+		worker_thread.start()
+
+	def record(self, name, value):
+		"""
+		Programa la escritura de un valor.
+		"""
+		row = "{},{},{:.6f}\n".format(datetime.now().isoformat(" ", "milliseconds"), name, value)
+		with self._condition:
+			self._rows.append(row)
+
+	def _run(self):
+		"""
+		Bucle del hilo: escribe lo acumulado cada flush_interval segundos hasta que se cierra.
+		"""
+		while True:
+			with self._condition:
+				self._condition.wait(self.flush_interval)
+				if not self.running:
+					return
+			self.flush()
+
+	def flush(self):
+		"""
+		Escribe en el archivo los valores acumulados, rotándolo antes si ya es demasiado grande.
+		"""
+		with self._write_lock:
+			with self._condition:
+				rows, self._rows = self._rows, []
+			if not rows:
+				return
+			try:
+				if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+					self._rotate()
+				is_new = not os.path.exists(self.path)
+				with open(self.path, "a", encoding="utf-8") as file:
+					if is_new:
+						file.write("time,metric,value\n")
+					file.writelines(rows)
+			except OSError:
+				# Las estadísticas no deben interrumpir el complemento; se pierde este lote.
+				pass
+
+	def _rotate(self):
+		"""
+		Desplaza los archivos anteriores (path.1 pasa a path.2, etc.) y deja libre la ruta principal.
+		Debe llamarse con el cerrojo de escritura tomado.
+		"""
+		for index in range(self.backups - 1, 0, -1):
+			source = "{}.{}".format(self.path, index)
+			if os.path.exists(source):
+				os.replace(source, "{}.{}".format(self.path, index + 1))
+		if self.backups:
+			os.replace(self.path, self.path + ".1")
+		else:
+			os.remove(self.path)
+
+	def close(self):
+		"""
+		Detiene el hilo y escribe lo que quede pendiente.
+		"""
+		with self._condition:
+			self.running = False
+			self._condition.notify_all()
+		self.flush()
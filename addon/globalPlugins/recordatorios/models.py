@@ -0,0 +1,184 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Tipos de datos de los recordatorios y sus tareas.
+Este módulo no depende de NVDA para poder usarse y probarse por separado.
+"""
+
+import sys
+from datetime import datetime
+
+# Formato con el que se guarda la hora de los recordatorios.
+TIME_FORMAT = '%Y-%m-%d %H:%M'
+# Campos cuyo valor suele repetirse entre muchos recordatorios y se comparte con shared_text.
+SHARED_FIELDS = frozenset(("recurrence", "sound_file"))
+
+
+def parse_time(time_str):
+	"""
+	Convierte la hora guardada ("AAAA-MM-DD HH:MM") en datetime.
+	datetime.fromisoformat está implementado en C y es mucho más rápido que strptime,
+	lo que se nota al cargar muchos recordatorios; strptime queda para cualquier valor que no sea ISO.
+	La instantánea binaria (snapshot.py) ya guarda la hora como fecha, y en ese caso se devuelve tal cual.
+	"""
+	if isinstance(time_str, datetime):
+		return time_str
+	try:
+		return datetime.fromisoformat(time_str)
+	except ValueError:
+		return datetime.strptime(time_str, TIME_FORMAT)
+
+
+def shared_text(value):
+	"""
+	Devuelve la copia compartida (sys.intern) de un texto que se repite entre recordatorios, como la ruta
+	del sonido o la recurrencia. Al cargar, cada recordatorio trae su propia copia del texto; así todos los
+	que usan el mismo valor apuntan a un único objeto. None y el texto vacío se devuelven tal cual.
+	"""
+	return sys.intern(value) if value else value
+
+
+def storage_key(message):
+	"""
+	Devuelve la clave con la que se guarda un recordatorio en el almacén: su nombre en minúsculas, que es único.
+	"""
+	return message.lower()
+
+
+class Task:
+	"""
+	Una tarea de la lista de un recordatorio.
+	"""
+
+	__slots__ = ("description", "completed")
+
+	def __init__(self, description, completed=False):
+		self.description = description
+		self.completed = completed
+
+	def copy(self):
+		"""
+		Devuelve una copia independiente de la tarea.
+		"""
+		return Task(self.description, self.completed)
+
+	def to_record(self):
+		"""
+		Convierte la tarea en el diccionario que se guarda en JSON.
+		"""
+		return {'description': self.description, 'completed': self.completed}
+
+	@classmethod
+	def from_record(cls, record):
+		"""
+		Crea una tarea a partir del diccionario guardado en JSON.
+		"""
+		return cls(record['description'], bool(record['completed']))
+
+
+class Reminder:
+	"""
+	Un recordatorio. Sus campos se modifican en su lugar; el identificador no cambia nunca,
+	por lo que sirve para referirse al recordatorio sin depender de su posición en la lista.
+	"""
+
+	__slots__ = ("id", "message", "reminder_time", "recurrence", "sound_file", "custom_interval", "tasks", "repetitions", "notification_interval", "revision")
+
+	def __init__(self, reminder_id, message, reminder_time, recurrence=None, sound_file=None, custom_interval=None, tasks=None, repetitions=None, notification_interval=None):
+		"""
+		Args:
+			reminder_id (int): Identificador estable del recordatorio.
+			message (str): El mensaje del recordatorio.
+			reminder_time (datetime): La hora en la que llegará el recordatorio.
+			recurrence (str): La frecuencia del recordatorio. diario, semanal, mensual, si aplica.
+			sound_file (str): Ruta con el sonido para el recordatorio.
+			custom_interval (int): Intervalo personalizado de recurrencia, en minutos.
+			tasks (list): Lista de objetos Task.
+			repetitions (int): Veces que se anuncia este recordatorio; None para usar la configuración general.
+			notification_interval (int): Segundos entre sus anuncios; None para usar la configuración general.
+		"""
+		self.id = reminder_id
+		self.message = message
+		self.reminder_time = reminder_time
+		self.recurrence = shared_text(recurrence)
+		self.sound_file = shared_text(sound_file)
+		self.custom_interval = custom_interval
+		self.tasks = tasks if tasks is not None else []
+		self.repetitions = repetitions
+		self.notification_interval = notification_interval
+		# Contador de cambios en memoria (no se guarda): permite saber si hay que volver a mostrar el recordatorio.
+		self.revision = 0
+
+	@property
+	def is_recurrent(self):
+		"""
+		Indica si el recordatorio se repite.
+		"""
+		return bool(self.recurrence or self.custom_interval)
+
+	@property
+	def has_incomplete_tasks(self):
+		"""
+		Indica si alguna de las tareas del recordatorio sigue pendiente.
+		"""
+		return any(not task.completed for task in self.tasks)
+
+	def to_record(self):
+		"""
+		Convierte el recordatorio en la lista que se guarda en JSON:
+		(mensaje, hora, recurrencia, sonido, intervalo, tareas, identificador), más las repeticiones
+		y el intervalo entre avisos si el recordatorio tiene valores propios.
+		Las versiones anteriores del complemento solo leen los formatos de 5 y 6 elementos y descartan estos,
+		así que no se admite volver a una versión anterior conservando los recordatorios.
+		"""
+		record = (
+			self.message,
+			self.reminder_time.isoformat(' ', 'minutes'),
+			self.recurrence,
+			self.sound_file,
+			self.custom_interval,
+			[task.to_record() for task in self.tasks],
+			self.id
+		)
+		if self.repetitions is None and self.notification_interval is None:
+			return record
+		return record + (self.repetitions, self.notification_interval)
+
+	@classmethod
+	def from_record(cls, record, reminder_id=None):
+		"""
+		Crea un recordatorio a partir de la lista guardada en JSON.
+		Acepta el formato antiguo de 5 elementos (sin tareas), el de 6 (con tareas), el de 7 (con identificador)
+		y el de 9 (con repeticiones e intervalo entre avisos propios).
+		Args:
+			record (list): Los datos guardados.
+			reminder_id (int): Identificador a usar si los datos no traen uno.
+		Returns:
+			Reminder: El recordatorio, o None si los datos tienen un formato inesperado.
+		"""
+		repetitions = notification_interval = None
+		if len(record) == 5: # Formato antiguo sin tareas
+			message, time_str, recurrence, sound_file, custom_interval = record
+			tasks = []
+		elif len(record) == 6: # Formato con tareas
+			message, time_str, recurrence, sound_file, custom_interval, tasks = record
+		elif len(record) == 7: # Formato actual con identificador
+			message, time_str, recurrence, sound_file, custom_interval, tasks, reminder_id = record
+		elif len(record) == 9: # Formato con avisos propios del recordatorio
+			message, time_str, recurrence, sound_file, custom_interval, tasks, reminder_id, repetitions, notification_interval = record
+		else:
+			return None
+		return cls(
+			reminder_id,
+			message,
+			parse_time(time_str),
+			recurrence,
+			sound_file,
+			custom_interval,
+			[Task.from_record(task) for task in tasks],
+			repetitions,
+			notification_interval
+		)
@@ -0,0 +1,379 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Motor de recurrencia de los recordatorios, inspirado en las reglas RRULE.
+Una regla se escribe como texto, por ejemplo "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE",
+"FREQ=MONTHLY;BYDAY=-1FR" o "FREQ=DAILY;COUNT=5", y los valores antiguos ("diario", "semanal", "mensual" y el
+intervalo personalizado en minutos) se traducen a reglas equivalentes.
+Este módulo no depende de NVDA para poder usarse y probarse por separado.
+"""
+
+import calendar
+import itertools
+from datetime import datetime, timedelta
+from functools import lru_cache
+from math import gcd
+
+MINUTELY = "MINUTELY"
+DAILY = "DAILY"
+WEEKLY = "WEEKLY"
+MONTHLY = "MONTHLY"
+FREQUENCIES = (MINUTELY, DAILY, WEEKLY, MONTHLY)
+
+# Códigos de los días de la semana, en el orden de datetime.weekday().
+WEEKDAY_CODES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+# Formato de las fechas (las excluidas y la de UNTIL) dentro del texto de la regla.
+EXDATE_FORMAT = "%Y%m%dT%H%M"
+
+# Valores de recurrencia guardados por las versiones anteriores y sus reglas equivalentes.
+LEGACY_RULES = {
+	"diario": "FREQ=DAILY",
+	"semanal": "FREQ=WEEKLY",
+	"mensual": "FREQ=MONTHLY",
+	"laborables": "FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR",
+}
+LEGACY_KEYS = {text: key for key, text in LEGACY_RULES.items()}
+
+
+class RecurrenceRule:
+	"""
+	Una regla de recurrencia ya analizada. Es inmutable, así que la misma instancia se comparte
+	entre todos los recordatorios que usan el mismo texto.
+	"""
+
+	__slots__ = ("freq", "interval", "weekdays", "month_day", "nth", "exdates", "count", "until", "_step", "_period", "_horizon")
+
+	def __init__(self, freq, interval=1, weekdays=None, month_day=None, nth=None, exdates=(), count=None, until=None):
+		"""
+		Args:
+			freq (str): MINUTELY, DAILY, WEEKLY o MONTHLY.
+			interval (int): Cada cuántos minutos, días, semanas o meses se repite.
+			weekdays (tuple): Días de la semana permitidos (0 es lunes), o None para no filtrar.
+			month_day (int): Día del mes para MONTHLY; si el mes es más corto se usa su último día.
+			nth (tuple): (n, día de la semana) para MONTHLY: el enésimo día de la semana del mes; n = -1 es el último.
+			exdates (iterable): Fechas (con precisión de minutos) en las que no hay aparición.
+			count (int): Número de apariciones de la serie, contando la inicial, o None para no limitarlo.
+			until (datetime): Última fecha en la que puede haber una aparición, incluida, o None.
+		"""
+		if freq not in FREQUENCIES:
+			raise ValueError("Frecuencia desconocida: {}".format(freq))
+		if interval < 1:
+			raise ValueError("El intervalo debe ser mayor que cero")
+		if weekdays is not None and (not weekdays or freq not in (DAILY, WEEKLY)):
+			raise ValueError("BYDAY sin ordinal solo se admite con DAILY o WEEKLY")
+		if (month_day is not None or nth is not None) and freq != MONTHLY:
+			raise ValueError("BYMONTHDAY y BYDAY con ordinal solo se admiten con MONTHLY")
+		if month_day is not None and not 1 <= month_day <= 31:
+			raise ValueError("Día del mes fuera de rango: {}".format(month_day))
+		if nth is not None and not (1 <= nth[0] <= 5 or nth[0] == -1):
+			raise ValueError("Ordinal fuera de rango: {}".format(nth[0]))
+		if count is not None and count < 1:
+			raise ValueError("COUNT debe ser mayor que cero")
+		if count is not None and until is not None:
+			raise ValueError("COUNT y UNTIL no se pueden combinar")
+		self.freq = freq
+		self.interval = interval
+		self.weekdays = tuple(sorted(set(weekdays))) if weekdays is not None else None
+		self.month_day = month_day
+		self.nth = nth
+		self.exdates = frozenset(exdates)
+		self.count = count
+		self.until = until
+		# Longitud de cada ciclo y cuántos ciclos tarda en repetirse el patrón de apariciones.
+		if freq == MINUTELY:
+			self._step = timedelta(minutes=interval)
+		elif freq == DAILY:
+			self._step = timedelta(days=interval)
+		elif freq == WEEKLY:
+			self._step = timedelta(weeks=interval)
+		else:
+			self._step = None
+		if freq == DAILY and self.weekdays is not None:
+			self._period = 7 // gcd(interval, 7)
+		else:
+			self._period = 1
+		# Ciclos seguidos sin apariciones tras los que la serie ya no tiene más. El patrón se repite cada _period ciclos
+		# (el del enésimo día de la semana, con el calendario, cada 4800 meses) y cada fecha excluida quita como mucho una aparición.
+		# Así, una regla imposible como "FREQ=DAILY;INTERVAL=7;BYDAY=MO" con inicio en martes termina en lugar de buscar sin fin.
+		pattern = 4800 // gcd(interval, 4800) if nth is not None else self._period
+		self._horizon = 1 + pattern * (len(self.exdates) + 1)
+
+	@classmethod
+	def parse(cls, text):
+		"""
+		Crea una regla a partir de su texto. Lanza ValueError si el texto no es válido.
+		"""
+		fields = {}
+		for part in text.split(";"):
+			name, sep, value = part.partition("=")
+			if not sep:
+				raise ValueError("Parte de la regla sin valor: {}".format(part))
+			fields[name.strip().upper()] = value.strip()
+		freq = fields.pop("FREQ", None)
+		interval = int(fields.pop("INTERVAL", 1))
+		weekdays = month_day = nth = None
+		if "BYDAY" in fields:
+			weekdays = []
+			for code in fields.pop("BYDAY").upper().split(","):
+				if code[-2:] not in WEEKDAY_CODES:
+					raise ValueError("Día de la semana desconocido: {}".format(code))
+				weekday = WEEKDAY_CODES.index(code[-2:])
+				if code[:-2]:
+					nth = (int(code[:-2]), weekday)
+				else:
+					weekdays.append(weekday)
+			if nth is not None:
+				if weekdays:
+					raise ValueError("No se pueden mezclar días con y sin ordinal")
+				weekdays = None
+		if "BYMONTHDAY" in fields:
+			month_day = int(fields.pop("BYMONTHDAY"))
+		exdates = ()
+		if "EXDATE" in fields:
+			exdates = [datetime.strptime(value, EXDATE_FORMAT) for value in fields.pop("EXDATE").split(",") if value]
+		count = int(fields.pop("COUNT")) if "COUNT" in fields else None
+		until = datetime.strptime(fields.pop("UNTIL"), EXDATE_FORMAT) if "UNTIL" in fields else None
+		if fields:
+			raise ValueError("Partes de la regla no admitidas: {}".format(", ".join(fields)))
+		return cls(freq, interval, weekdays, month_day, nth, exdates, count, until)
+
+	def to_text(self):
+		"""
+		Devuelve el texto de la regla, que se puede volver a analizar con parse.
+		"""
+		parts = ["FREQ=" + self.freq]
+		if self.interval != 1:
+			parts.append("INTERVAL={}".format(self.interval))
+		if self.weekdays is not None:
+			parts.append("BYDAY=" + ",".join(WEEKDAY_CODES[weekday] for weekday in self.weekdays))
+		if self.nth is not None:
+			parts.append("BYDAY={}{}".format(self.nth[0], WEEKDAY_CODES[self.nth[1]]))
+		if self.month_day is not None:
+			parts.append("BYMONTHDAY={}".format(self.month_day))
+		if self.count is not None:
+			parts.append("COUNT={}".format(self.count))
+		if self.until is not None:
+			parts.append("UNTIL=" + self.until.strftime(EXDATE_FORMAT))
+		if self.exdates:
+			parts.append("EXDATE=" + ",".join(date.strftime(EXDATE_FORMAT) for date in sorted(self.exdates)))
+		return ";".join(parts)
+
+	def with_month_day(self, month_day):
+		"""
+		Devuelve una copia de la regla mensual con el día del mes fijado.
+		Sirve para que un recordatorio del día 31 vuelva al 31 después de pasar por un mes más corto.
+		"""
+		return RecurrenceRule(self.freq, self.interval, self.weekdays, month_day, self.nth, self.exdates, self.count, self.until)
+
+	def with_count(self, count):
+		"""
+		Devuelve una copia de la regla con otro número de apariciones.
+		Como la serie de un recordatorio empieza en su hora actual, al avanzarlo se descuentan las que ya llegaron.
+		"""
+		return RecurrenceRule(self.freq, self.interval, self.weekdays, self.month_day, self.nth, self.exdates, count, self.until)
+
+	def series(self, dtstart):
+		"""
+		Devuelve la serie de apariciones de la regla que empieza en dtstart.
+		"""
+		return _series(self, dtstart)
+
+
+class Recurrence:
+	"""
+	Serie de apariciones de una regla a partir de una fecha inicial.
+	Las apariciones se agrupan en ciclos (un intervalo de la regla cada uno), de forma que se puede
+	saltar directamente al ciclo de cualquier fecha sin recorrer los anteriores.
+	"""
+
+	__slots__ = ("rule", "dtstart", "_base", "_per_period", "_last_query", "_last_result")
+
+	def __init__(self, rule, dtstart):
+		self.rule = rule
+		self.dtstart = dtstart
+		if rule.freq == WEEKLY:
+			# Los ciclos semanales empiezan el lunes de la semana inicial, a la hora de dtstart.
+			self._base = dtstart - timedelta(days=dtstart.weekday())
+		else:
+			self._base = dtstart
+		self._per_period = None
+		self._last_query = None
+		self._last_result = None
+
+	def _cycle(self, k):
+		"""
+		Devuelve, ordenadas, las apariciones candidatas del ciclo k, sin aplicar dtstart ni las exclusiones.
+		"""
+		rule = self.rule
+		if rule.freq == MINUTELY:
+			return [self._base + k * rule._step]
+		if rule.freq == DAILY:
+			day = self._base + k * rule._step
+			if rule.weekdays is None or day.weekday() in rule.weekdays:
+				return [day]
+			return []
+		if rule.freq == WEEKLY:
+			start = self._base + k * rule._step
+			weekdays = rule.weekdays if rule.weekdays is not None else (self.dtstart.weekday(),)
+			return [start + timedelta(days=weekday) for weekday in weekdays]
+		month_index = self.dtstart.month - 1 + k * rule.interval
+		year, month = self.dtstart.year + month_index // 12, month_index % 12 + 1
+		first_weekday, days_in_month = calendar.monthrange(year, month)
+		if rule.nth is not None:
+			n, weekday = rule.nth
+			if n > 0:
+				day = 1 + (weekday - first_weekday) % 7 + (n - 1) * 7
+				if day > days_in_month:
+					return []
+			else:
+				last_weekday = (first_weekday + days_in_month - 1) % 7
+				day = days_in_month - (last_weekday - weekday) % 7
+		else:
+			day = min(rule.month_day or self.dtstart.day, days_in_month)
+		return [self.dtstart.replace(year=year, month=month, day=day)]
+
+	def _cycle_index(self, t):
+		"""
+		Devuelve el ciclo que contiene la fecha t (0 si es anterior al inicio).
+		"""
+		rule = self.rule
+		if rule._step is not None:
+			return max(0, (t - self._base) // rule._step)
+		months = (t.year - self.dtstart.year) * 12 + t.month - self.dtstart.month
+		return max(0, months // rule.interval)
+
+	def _is_valid(self, occurrence):
+		return occurrence >= self.dtstart and occurrence.replace(second=0, microsecond=0) not in self.rule.exdates
+
+	def occurrences(self, after=None):
+		"""
+		Generador perezoso de las apariciones de la serie, en orden. Termina si la regla ya no tiene más.
+		Args:
+			after (datetime): Si se indica, solo se generan las apariciones posteriores a esta fecha.
+		"""
+		rule = self.rule
+		remaining = None
+		if rule.count is not None:
+			remaining = rule.count - (self.count_until(after) if after is not None else 0)
+			if remaining <= 0:
+				return
+		k = self._cycle_index(after) if after is not None else 0
+		idle = 0
+		for k in itertools.count(k):
+			idle += 1
+			for occurrence in self._cycle(k):
+				if rule.until is not None and occurrence > rule.until:
+					return
+				if self._is_valid(occurrence) and (after is None or occurrence > after):
+					idle = 0
+					yield occurrence
+					if remaining is not None:
+						remaining -= 1
+						if not remaining:
+							return
+			if idle >= rule._horizon:
+				return
+
+	def next_after(self, t):
+		"""
+		Devuelve la primera aparición posterior a t, o None si la serie no tiene más. El último resultado se guarda,
+		de modo que las consultas repetidas dentro del mismo hueco entre apariciones no vuelven a calcular nada.
+		"""
+		if self._last_query is not None and self._last_query <= t and (self._last_result is None or t < self._last_result):
+			return self._last_result
+		result = next(self.occurrences(t), None)
+		self._last_query = t
+		self._last_result = result
+		return result
+
+	def count_until(self, t):
+		"""
+		Devuelve cuántas apariciones hay desde dtstart hasta t, ambas incluidas.
+		Salvo para el enésimo día de la semana del mes, el cálculo no depende de cuántos ciclos hayan pasado.
+		"""
+		rule = self.rule
+		if rule.until is not None:
+			t = min(t, rule.until)
+		if t < self.dtstart:
+			return 0
+		last = self._cycle_index(t)
+		if rule.nth is not None:
+			# Un mes puede no tener quinto lunes: se recorren los meses, que son pocos.
+			count = sum(len(self._cycle(k)) for k in range(last))
+		else:
+			if self._per_period is None:
+				self._per_period = sum(len(self._cycle(k)) for k in range(rule._period))
+			full, rest = divmod(last, rule._period)
+			count = full * self._per_period + sum(len(self._cycle(k)) for k in range(last - rest, last))
+		count += sum(1 for occurrence in self._cycle(last) if occurrence <= t)
+		# Quitamos lo anterior a dtstart en el primer ciclo y las fechas excluidas.
+		count -= sum(1 for occurrence in self._cycle(0) if occurrence < self.dtstart)
+		for exdate in rule.exdates:
+			if self.dtstart <= exdate <= t and any(occurrence.replace(second=0, microsecond=0) == exdate for occurrence in self._cycle(self._cycle_index(exdate))):
+				count -= 1
+		return count if rule.count is None else min(count, rule.count)
+
+	def count_between(self, start, end):
+		"""
+		Devuelve cuántas apariciones hay después de start y hasta end, incluida.
+		"""
+		return self.count_until(end) - self.count_until(start)
+
+
+@lru_cache(maxsize=256)
+def parse_rule(text):
+	"""
+	Analiza el texto de una regla; el resultado se guarda para no volver a analizar textos repetidos.
+	"""
+	return RecurrenceRule.parse(text)
+
+
+@lru_cache(maxsize=1024)
+def _series(rule, dtstart):
+	return Recurrence(rule, dtstart)
+
+
+def rule_for(recurrence, custom_interval=None):
+	"""
+	Devuelve la regla que corresponde a los campos guardados de un recordatorio.
+	Args:
+		recurrence (str): Valor antiguo (diario, semanal, mensual, laborables) o texto de una regla.
+		custom_interval (int): Intervalo personalizado en minutos; tiene prioridad sobre recurrence.
+	Returns:
+		RecurrenceRule: La regla, o None si el recordatorio no se repite.
+	"""
+	if custom_interval:
+		return parse_rule("FREQ=MINUTELY;INTERVAL={}".format(int(custom_interval)))
+	if not recurrence:
+		return None
+	try:
+		return parse_rule(LEGACY_RULES.get(recurrence, recurrence))
+	except ValueError:
+		# Un valor desconocido se trata como diario para no dejar el recordatorio sin reprogramar.
+		return parse_rule(LEGACY_RULES["diario"])
+
+
+def legacy_key(rule):
+	"""
+	Devuelve el valor antiguo (diario, semanal, mensual, laborables) equivalente a una regla, o None si no lo hay.
+	Una regla mensual que solo fija el día del mes equivale a "mensual": así queda un recordatorio del 29 al 31
+	mientras pasa por un mes más corto (ver ReminderManager._catch_up).
+	"""
+	if rule.count is not None or rule.until is not None:
+		return None
+	if rule.freq == MONTHLY and rule.interval == 1 and rule.weekdays is None and rule.nth is None and not rule.exdates:
+		return "mensual"
+	return LEGACY_KEYS.get(rule.to_text())
+
+
+def add_months(date, months):
+	"""
+	Añade meses a una fecha; si el día no existe en el mes de destino se usa el último día del mes.
+	"""
+	month_index = date.month - 1 + months
+	year, month = date.year + month_index // 12, month_index % 12 + 1
+	return date.replace(year=year, month=month, day=min(date.day, calendar.monthrange(year, month)[1]))
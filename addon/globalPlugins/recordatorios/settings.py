@@ -0,0 +1,61 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Ajustes del complemento ya convertidos a sus tipos.
+Se leen de la configuración de NVDA una sola vez y, cuando cambian, se sustituye la instantánea completa;
+así el planificador y el despachador pueden leerlos sin cerrojos ni conversiones en cada aviso.
+Este módulo no depende de NVDA para poder usarse y probarse por separado.
+"""
+
+
+class ReminderSettings:
+	"""
+	Instantánea inmutable de la sección remindersConfig de la configuración.
+	"""
+
+	__slots__ = ("repetitions", "interval", "storage_backend", "missed_policy", "export_metrics")
+
+	def __init__(self, repetitions=1, interval=10, storage_backend="json", missed_policy="once", export_metrics=False):
+		"""
+		Args:
+			repetitions (int): Número de veces que se anuncia cada recordatorio.
+			interval (int): Segundos entre los anuncios de un recordatorio.
+			storage_backend (str): Almacén de los recordatorios: json, binary o sqlite.
+			missed_policy (str): Qué hacer con los avisos perdidos: once, summary o skip.
+			export_metrics (bool): Si las estadísticas de rendimiento se guardan también en un archivo CSV.
+		"""
+		object.__setattr__(self, "repetitions", repetitions)
+		object.__setattr__(self, "interval", interval)
+		object.__setattr__(self, "storage_backend", storage_backend)
+		object.__setattr__(self, "missed_policy", missed_policy)
+		object.__setattr__(self, "export_metrics", export_metrics)
+
+	def __setattr__(self, name, value):
+		raise AttributeError("ReminderSettings es inmutable; crea una instantánea nueva")
+
+	@classmethod
+	def from_config(cls, section):
+		"""
+		Crea la instantánea a partir de la sección remindersConfig (o de cualquier diccionario con sus claves).
+		"""
+		return cls(
+			int(section["numberOfTimesToNotifyReminder"]),
+			int(section["notificationInterval"]),
+			str(section["storageBackend"]),
+			str(section["missedRemindersPolicy"]),
+			bool(section["exportMetrics"])
+		)
+
+	def notification_for(self, reminder):
+		"""
+		Devuelve cuántas veces y cada cuántos segundos se anuncia un recordatorio,
+		dando prioridad a los valores propios del recordatorio sobre los generales.
+		Returns:
+			tuple: (repeticiones, intervalo en segundos).
+		"""
+		repetitions = reminder.repetitions if reminder.repetitions is not None else self.repetitions
+		interval = reminder.notification_interval if reminder.notification_interval is not None else self.interval
+		return repetitions, interval
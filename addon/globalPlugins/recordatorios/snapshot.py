@@ -0,0 +1,209 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Formato binario, versionado, de la instantánea de los recordatorios.
+Las horas se guardan como minutos enteros desde 1970-01-01 (hora local, sin zona), las recurrencias y las rutas
+de sonido en tablas en las que cada valor aparece una sola vez, y los datos fijos de cada recordatorio y de cada
+tarea en bloques de registros de tamaño fijo que se leen con struct.iter_unpack. Los mensajes, por un lado, y las
+descripciones de las tareas, por otro, van seguidos en un bloque UTF-8 que se decodifica de una vez y se reparte
+por la longitud en caracteres de cada texto.
+Así, leer la instantánea no analiza ningún texto campo a campo ni convierte fechas desde cadenas.
+
+Estructura (little endian):
+	cabecera: b"RCBS", versión (H), número de recordatorios (I), número de tareas (I), CRC32 del resto (I)
+	tabla de recurrencias y tabla de sonidos: número de valores (I) y cada valor como longitud (I) y bytes UTF-8
+	recordatorios: RECORD por cada uno
+	tareas: TASK por cada una, en el orden de sus recordatorios
+	mensajes y descripciones de las tareas: dos bloques, cada uno con su longitud en bytes (I) y el texto en UTF-8
+Este módulo no depende de NVDA para poder usarse y probarse por separado.
+"""
+
+import struct
+import zlib
+from datetime import datetime, timedelta
+
+from .models import parse_time
+
+MAGIC = b"RCBS"
+VERSION = 1
+HEADER = struct.Struct("<4sHIII")
+COUNT = struct.Struct("<I")
+# Identificador, minuto, recurrencia (índice en la tabla, 0 = ninguna), sonido (ídem), intervalo personalizado,
+# repeticiones, intervalo entre avisos, longitud del mensaje en caracteres, número de tareas.
+# Los campos opcionales usan NONE cuando no tienen valor.
+RECORD = struct.Struct("<qqIIqiiII")
+# Completada y longitud de la descripción en caracteres.
+TASK = struct.Struct("<?I")
+NONE = -1
+EPOCH = datetime(1970, 1, 1)
+
+
+class SnapshotFormatError(ValueError):
+	"""
+	La instantánea no tiene el formato esperado: está dañada o es de una versión posterior.
+	"""
+
+
+def _optional(value):
+	return NONE if value is None else value
+
+
+def _text_block(text):
+	"""
+	Codifica un bloque de texto con su longitud en bytes.
+	"""
+	data = text.encode("utf-8")
+	return COUNT.pack(len(data)) + data
+
+
+def _table(values):
+	"""
+	Codifica una tabla de textos: su número de valores y cada uno con su longitud en bytes.
+	"""
+	parts = [COUNT.pack(len(values))]
+	for value in values:
+		data = value.encode("utf-8")
+		parts.append(COUNT.pack(len(data)))
+		parts.append(data)
+	return b"".join(parts)
+
+
+def encode(items):
+	"""
+	Codifica los recordatorios serializados (Reminder.to_record, o los formatos anteriores que acepta from_record).
+	Args:
+		items (list): Todos los elementos, en orden.
+	Returns:
+		bytes: La instantánea binaria.
+	"""
+	recurrences = {}
+	sounds = {}
+	records = []
+	tasks = []
+	messages = []
+	descriptions = []
+	for item in items:
+		message, time_value, recurrence, sound_file, custom_interval = item[:5]
+		item_tasks = item[5] if len(item) > 5 else []
+		reminder_id = item[6] if len(item) > 6 else None
+		repetitions, notification_interval = item[7:9] if len(item) > 8 else (None, None)
+		reminder_time = parse_time(time_value)
+		minute = (reminder_time.toordinal() - EPOCH.toordinal()) * 1440 + reminder_time.hour * 60 + reminder_time.minute
+		# Los índices empiezan en 1; el 0 indica que no hay valor.
+		recurrence_index = recurrences.setdefault(recurrence, len(recurrences) + 1) if recurrence is not None else 0
+		sound_index = sounds.setdefault(sound_file, len(sounds) + 1) if sound_file is not None else 0
+		records.append(RECORD.pack(
+			_optional(reminder_id),
+			minute,
+			recurrence_index,
+			sound_index,
+			_optional(custom_interval),
+			_optional(repetitions),
+			_optional(notification_interval),
+			len(message),
+			len(item_tasks)
+		))
+		messages.append(message)
+		for task in item_tasks:
+			tasks.append(TASK.pack(bool(task["completed"]), len(task["description"])))
+			descriptions.append(task["description"])
+	body = b"".join((
+		_table(list(recurrences)),
+		_table(list(sounds)),
+		b"".join(records),
+		b"".join(tasks),
+		_text_block("".join(messages)),
+		_text_block("".join(descriptions))
+	))
+	return HEADER.pack(MAGIC, VERSION, len(records), len(tasks), zlib.crc32(body)) + body
+
+
+def _read_table(view, offset):
+	"""
+	Lee una tabla de textos.
+	Returns:
+		tuple: La lista de valores, con None en la posición 0, y la posición siguiente a la tabla.
+	"""
+	(count,) = COUNT.unpack_from(view, offset)
+	offset += COUNT.size
+	values = [None]
+	for index in range(count):
+		(length,) = COUNT.unpack_from(view, offset)
+		offset += COUNT.size
+		values.append(str(view[offset:offset + length], "utf-8"))
+		offset += length
+	return values, offset
+
+
+def _read_text_block(view, offset):
+	"""
+	Lee un bloque de texto.
+	Returns:
+		tuple: El texto y la posición siguiente al bloque.
+	"""
+	(length,) = COUNT.unpack_from(view, offset)
+	offset += COUNT.size
+	return str(view[offset:offset + length], "utf-8"), offset + length
+
+
+def decode(data):
+	"""
+	Lee una instantánea binaria.
+	Args:
+		data (bytes): El contenido del archivo (también sirve un mmap o un memoryview).
+	Returns:
+		list: Los elementos en el formato de Reminder.to_record, con la hora ya como datetime.
+	Raises:
+		SnapshotFormatError: Si los datos están dañados o son de una versión que no se conoce.
+	"""
+	view = memoryview(data)
+	try:
+		magic, version, record_count, task_count, checksum = HEADER.unpack_from(view, 0)
+	except struct.error:
+		raise SnapshotFormatError("Instantánea incompleta")
+	if magic != MAGIC:
+		raise SnapshotFormatError("No es una instantánea de recordatorios")
+	if version > VERSION:
+		raise SnapshotFormatError("Instantánea de una versión posterior ({})".format(version))
+	body = view[HEADER.size:]
+	if zlib.crc32(body) != checksum:
+		raise SnapshotFormatError("La instantánea está dañada")
+	try:
+		recurrences, offset = _read_table(body, 0)
+		sounds, records_start = _read_table(body, offset)
+		records_end = records_start + record_count * RECORD.size
+		tasks_end = records_end + task_count * TASK.size
+		messages, offset = _read_text_block(body, tasks_end)
+		descriptions, offset = _read_text_block(body, offset)
+		records = RECORD.iter_unpack(body[records_start:records_end])
+		tasks = TASK.iter_unpack(body[records_end:tasks_end])
+	except (struct.error, UnicodeDecodeError):
+		raise SnapshotFormatError("La instantánea está dañada")
+	items = []
+	message_position = 0
+	description_position = 0
+	for reminder_id, minute, recurrence_index, sound_index, custom_interval, repetitions, notification_interval, message_length, item_task_count in records:
+		message = messages[message_position:message_position + message_length]
+		message_position += message_length
+		item_tasks = []
+		for index in range(item_task_count):
+			completed, description_length = next(tasks)
+			item_tasks.append({"description": descriptions[description_position:description_position + description_length], "completed": completed})
+			description_position += description_length
+		item = (
+			message,
+			# timedelta(días, segundos) con argumentos posicionales es bastante más rápido que con minutes=.
+			EPOCH + timedelta(0, minute * 60),
+			recurrences[recurrence_index],
+			sounds[sound_index],
+			None if custom_interval == NONE else custom_interval,
+			item_tasks,
+			None if reminder_id == NONE else reminder_id
+		)
+		if repetitions != NONE or notification_interval != NONE:
+			item += (None if repetitions == NONE else repetitions, None if notification_interval == NONE else notification_interval)
+		items.append(item)
+	return items
@@ -0,0 +1,281 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Caché de los sonidos personalizados de los recordatorios e índice de las carpetas de sonidos.
+Los archivos WAV se leen y se validan una sola vez (al elegirlos o al iniciar) y su audio
+queda en memoria, de modo que avisar de un recordatorio no tiene que esperar al disco.
+Este módulo no depende de NVDA para poder usarse y probarse por separado.
+"""
+
+import json
+import os
+import threading
+import time
+import wave
+from collections import OrderedDict
+
+# Memoria máxima, en bytes, que ocupan los sonidos guardados.
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+# Segundos que pasan antes de volver a comprobar en el disco si un sonido cambió.
+DEFAULT_CHECK_INTERVAL = 30
+
+
+class SoundAsset:
+	"""
+	Un sonido ya leído: su formato y su audio PCM.
+	"""
+
+	__slots__ = ("path", "mtime", "size", "channels", "sample_rate", "sample_width", "frames", "checked")
+
+	def __init__(self, path, mtime, size, channels, sample_rate, sample_width, frames):
+		self.path = path
+		self.mtime = mtime
+		self.size = size
+		self.channels = channels
+		self.sample_rate = sample_rate
+		self.sample_width = sample_width
+		self.frames = frames
+		# Hora (time.monotonic) de la última comprobación en el disco.
+		self.checked = time.monotonic()
+
+
+class SoundCache:
+	"""
+	Sonidos leídos, en una caché LRU limitada por la memoria que ocupan.
+	Los archivos que no existen o no son WAV PCM válidos también se recuerdan, para no volver
+	a buscarlos en cada aviso; se vuelven a comprobar pasado check_interval.
+	"""
+
+	def __init__(self, max_bytes=DEFAULT_MAX_BYTES, check_interval=DEFAULT_CHECK_INTERVAL):
+		"""
+		Args:
+			max_bytes (int): Memoria máxima que ocupan los sonidos guardados.
+			check_interval (float): Segundos entre comprobaciones de cambios en el disco.
+		"""
+		self.max_bytes = max_bytes
+		self.check_interval = check_interval
+		self._assets = OrderedDict()
+		self._bytes = 0
+		# Ruta -> hora (time.monotonic) en la que se comprobó que no se puede usar.
+		self._invalid = {}
+		self._lock = threading.Lock()
+
+	@property
+	def size_in_bytes(self):
+		"""
+		Memoria que ocupan ahora los sonidos guardados.
+		"""
+		return self._bytes
+
+	def get(self, path):
+		"""
+		Devuelve el sonido de la ruta indicada, leyéndolo solo si no está en la caché.
+		Returns:
+			SoundAsset: El sonido, o None si el archivo no existe o no es un WAV válido.
+		"""
+		with self._lock:
+			asset = self._assets.get(path)
+			if asset is not None:
+				self._assets.move_to_end(path)
+				return asset
+			failed_at = self._invalid.get(path)
+			if failed_at is not None and time.monotonic() - failed_at < self.check_interval:
+				return None
+		return self.load(path)
+
+	def load(self, path):
+		"""
+		Lee y valida un archivo WAV y lo guarda en la caché, sustituyendo la versión anterior.
+		Returns:
+			SoundAsset: El sonido, o None si el archivo no existe o no es un WAV PCM válido.
+		"""
+		try:
+			stat = os.stat(path)
+			with wave.open(path, "rb") as wave_file:
+				if wave_file.getcomptype() != "NONE":
+					raise wave.Error("Compresión no admitida")
+				asset = SoundAsset(
+					path,
+					stat.st_mtime,
+					stat.st_size,
+					wave_file.getnchannels(),
+					wave_file.getframerate(),
+					wave_file.getsampwidth(),
+					wave_file.readframes(wave_file.getnframes())
+				)
+		except (OSError, EOFError, wave.Error):
+			with self._lock:
+				self._discard(path)
+				self._invalid[path] = time.monotonic()
+			return None
+		with self._lock:
+			self._discard(path)
+			self._invalid.pop(path, None)
+			if len(asset.frames) > self.max_bytes:
+				# Demasiado grande para guardarlo; quien lo pidió puede usarlo igualmente esta vez.
+				return asset
+			self._assets[path] = asset
+			self._bytes += len(asset.frames)
+			while self._bytes > self.max_bytes:
+				_path, evicted = self._assets.popitem(last=False)
+				self._bytes -= len(evicted.frames)
+		return asset
+
+	def refresh(self, path):
+		"""
+		Comprueba, como mucho una vez cada check_interval, si el archivo cambió en el disco
+		(por su fecha de modificación y su tamaño) y en ese caso lo vuelve a leer.
+		Conviene llamarlo después de reproducir, para que la comprobación no retrase el aviso.
+		"""
+		with self._lock:
+			asset = self._assets.get(path)
+			if asset is None or time.monotonic() - asset.checked < self.check_interval:
+				return
+			asset.checked = time.monotonic()
+		try:
+			stat = os.stat(path)
+		except OSError:
+			stat = None
+		if stat is None or stat.st_mtime != asset.mtime or stat.st_size != asset.size:
+			self.load(path)
+
+	def preload(self, paths):
+		"""
+		Lee en un hilo en segundo plano los sonidos indicados que no estén ya en la caché.
+		"""
+		paths = [path for path in set(paths) if path]
+		if not paths:
+			return
+
+		def run():
+			for path in paths:
+				self.get(path)
+		threading.Thread(target=run, daemon=True).start()
+
+	def _discard(self, path):
+		"""
+		Quita un sonido de la caché. Debe llamarse con el cerrojo tomado.
+		"""
+		asset = self._assets.pop(path, None)
+		if asset is not None:
+			self._bytes -= len(asset.frames)
+
+
+class SoundLibraryIndex:
+	"""
+	Índice de los archivos WAV de las carpetas de sonidos, guardado en disco.
+	Para saber si el índice de una carpeta sigue valiendo basta con comparar la fecha de modificación
+	de cada subcarpeta recorrida (cambia al añadir, quitar o renombrar archivos), sin listar los archivos.
+	"""
+
+	def __init__(self, index_path):
+		"""
+		Args:
+			index_path (str): Archivo JSON en el que se guarda el índice.
+		"""
+		self.index_path = index_path
+		self._index = None
+		self._lock = threading.Lock()
+
+	def _load_index(self):
+		"""
+		Lee el índice guardado la primera vez que se necesita. Debe llamarse con el cerrojo tomado.
+		"""
+		if self._index is None:
+			try:
+				with open(self.index_path, "r", encoding="utf-8") as index_file:
+					self._index = json.load(index_file)
+			except (OSError, ValueError):
+				self._index = {}
+		return self._index
+
+	def _save_index(self):
+		"""
+		Guarda el índice en disco. Debe llamarse con el cerrojo tomado.
+		"""
+		tmp_path = self.index_path + ".tmp"
+		try:
+			with open(tmp_path, "w", encoding="utf-8") as index_file:
+				json.dump(self._index, index_file, ensure_ascii=False)
+			os.replace(tmp_path, self.index_path)
+		except OSError:
+			# El índice solo es una ayuda: si no se puede guardar, la próxima vez se vuelve a recorrer la carpeta.
+			pass
+
+	@staticmethod
+	def _is_fresh(folder, entry):
+		"""
+		Indica si ninguna de las carpetas recorridas cambió desde que se guardó el índice.
+		"""
+		try:
+			return all(os.stat(os.path.join(folder, relative)).st_mtime == mtime for relative, mtime in entry["dirs"].items())
+		except OSError:
+			return False
+
+	@staticmethod
+	def _walk(folder, recursive):
+		"""
+		Recorre la carpeta con os.scandir.
+		No se siguen los enlaces simbólicos a carpetas, y una carpeta ya recorrida (por ejemplo, a través de una unión
+		de Windows) no se vuelve a recorrer, para que un enlace a una carpeta superior no deje el recorrido en un bucle.
+		Returns:
+			tuple: Las rutas relativas de los archivos .wav (sin distinguir mayúsculas en la extensión)
+			y la fecha de modificación de cada carpeta recorrida.
+		"""
+		sounds = []
+		dirs = {}
+		visited = set()
+		pending = [""]
+		while pending:
+			relative = pending.pop()
+			path = os.path.join(folder, relative)
+			try:
+				info = os.stat(path)
+				if (info.st_dev, info.st_ino) in visited:
+					continue
+				visited.add((info.st_dev, info.st_ino))
+				dirs[relative] = info.st_mtime
+				with os.scandir(path) as entries:
+					for entry in entries:
+						if entry.is_dir(follow_symlinks=False):
+							if recursive:
+								pending.append(os.path.join(relative, entry.name))
+						elif entry.name.lower().endswith(".wav"):
+							sounds.append(os.path.join(relative, entry.name))
+			except OSError:
+				# Una subcarpeta sin permisos no impide listar el resto.
+				continue
+		sounds.sort(key=str.lower)
+		return sounds, dirs
+
+	def scan(self, folder, recursive=False):
+		"""
+		Devuelve los sonidos de la carpeta, desde el índice si sigue siendo válido.
+		Args:
+			folder (str): La carpeta de sonidos.
+			recursive (bool): Si se incluyen también los sonidos de las subcarpetas.
+		Returns:
+			list: Las rutas de los sonidos, relativas a la carpeta y ordenadas alfabéticamente.
+		"""
+		key = "{}|{}".format(os.path.normcase(os.path.abspath(folder)), int(recursive))
+		with self._lock:
+			entry = self._load_index().get(key)
+		if entry is not None and self._is_fresh(folder, entry):
+			return list(entry["sounds"])
+		sounds, dirs = self._walk(folder, recursive)
+		with self._lock:
+			self._load_index()[key] = {"sounds": sounds, "dirs": dirs}
+			self._save_index()
+		return list(sounds)
+
+	def scan_async(self, folder, recursive, callback):
+		"""
+		Recorre la carpeta en un hilo en segundo plano y llama a callback(folder, recursive, sounds) al terminar.
+		El callback se ejecuta en ese hilo: quien actualice la interfaz debe pasar por wx.CallAfter.
+		"""
+		def run():
+			callback(folder, recursive, self.scan(folder, recursive))
+		threading.Thread(target=run, daemon=True).start()
@@ -0,0 +1,602 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Almacenamiento de los recordatorios en disco.
+Este módulo no depende de NVDA para poder usarse y probarse por separado.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from . import snapshot
+
+# Número de registros en el diario a partir del cual conviene compactarlo en la instantánea.
+COMPACT_THRESHOLD = 200
+# Segundos durante los que se agrupan los cambios antes de escribirlos en disco.
+DEFAULT_SAVE_DELAY = 2
+# Archivos de cada almacén en la carpeta de configuración; el primero es la instantánea o la base de datos.
+STORE_FILES = {
+	"json": ("recordatorios.json", "recordatorios.journal"),
+	"binary": ("recordatorios.bin", "recordatorios.bin.journal"),
+	"sqlite": ("recordatorios.db",),
+}
+# Archivo en el que se anota el almacén usado por última vez, para saber desde cuál migrar al cambiar de opción.
+BACKEND_MARKER = "recordatorios.backend"
+
+
+class JournalStore:
+	"""
+	Almacén formado por una instantánea JSON y un diario (journal) de solo anexado.
+	La instantánea conserva el formato de siempre (una lista de recordatorios serializados).
+	Cada cambio posterior se añade al diario como una línea JSON pequeña:
+	["put", clave, elemento] para añadir o sustituir y ["del", clave] para eliminar.
+	Al cargar, se lee la instantánea y se reaplica el diario encima.
+	"""
+
+	def __init__(self, snapshot_path, journal_path, key, compact_threshold=COMPACT_THRESHOLD):
+		"""
+		Args:
+			snapshot_path (str): Ruta del archivo JSON con la instantánea.
+			journal_path (str): Ruta del archivo del diario.
+			key (callable): Función que obtiene la clave única de un elemento de la instantánea.
+			compact_threshold (int): Registros del diario que disparan la compactación.
+		"""
+		self.snapshot_path = snapshot_path
+		self.journal_path = journal_path
+		self.key = key
+		self.compact_threshold = compact_threshold
+		# Número de registros escritos en el diario desde la última compactación.
+		self.journal_records = 0
+		self._lock = threading.Lock()
+
+	@property
+	def needs_compaction(self):
+		"""
+		Indica si el diario ya creció lo suficiente como para compactarlo.
+		"""
+		return self.journal_records >= self.compact_threshold
+
+	def load(self):
+		"""
+		Lee la instantánea y reaplica el diario.
+		Returns:
+			list: Los elementos almacenados, en el orden en que se añadieron.
+		"""
+		items = {}
+		if os.path.exists(self.snapshot_path):
+			for item in self._read_snapshot():
+				items[self.key(item)] = item
+		records = 0
+		damaged = False
+		if os.path.exists(self.journal_path):
+			with open(self.journal_path, 'r', encoding='utf-8') as file:
+				for line in file:
+					try:
+						record = json.loads(line)
+					except ValueError:
+						# Una línea incompleta solo puede deberse a una escritura interrumpida al final del diario.
+						damaged = True
+						break
+					if record[0] == "put":
+						items[record[1]] = record[2]
+					elif record[0] == "del":
+						items.pop(record[1], None)
+					records += 1
+		self.journal_records = records
+		items = list(items.values())
+		if damaged:
+			# Compactamos enseguida para que los siguientes registros no queden detrás de la línea dañada.
+			self.compact(items)
+		return items
+
+	def put(self, key, item):
+		"""
+		Registra en el diario que el elemento con la clave indicada se añadió o cambió.
+		"""
+		self.append([["put", key, item]])
+
+	def delete(self, key):
+		"""
+		Registra en el diario que el elemento con la clave indicada se eliminó.
+		"""
+		self.append([["del", key]])
+
+	def append(self, records):
+		"""
+		Añade varios registros al final del diario con una sola escritura.
+		Args:
+			records (list): Registros en el formato ["put", clave, elemento] o ["del", clave].
+		"""
+		data = "".join(json.dumps(record) + "\n" for record in records)
+		with self._lock:
+			with open(self.journal_path, 'a', encoding='utf-8') as file:
+				file.write(data)
+				file.flush()
+				os.fsync(file.fileno())
+			self.journal_records += len(records)
+
+	def compact(self, items):
+		"""
+		Escribe una instantánea nueva con todos los elementos y vacía el diario.
+		Args:
+			items (list): Todos los elementos serializados, en orden.
+		"""
+		with self._lock:
+			# Escribimos en un archivo temporal y lo renombramos, para no dejar nunca una instantánea a medias.
+			temp_path = self.snapshot_path + ".tmp"
+			self._write_snapshot(temp_path, items)
+			os.replace(temp_path, self.snapshot_path)
+			# Reaplicar el diario sobre la nueva instantánea no cambiaría nada, así que basta con borrarlo.
+			if os.path.exists(self.journal_path):
+				os.remove(self.journal_path)
+			self.journal_records = 0
+
+	def _read_snapshot(self):
+		"""
+		Lee los elementos de la instantánea.
+		"""
+		with open(self.snapshot_path, 'r', encoding='utf-8') as file:
+			return json.load(file)
+
+	def _write_snapshot(self, path, items):
+		"""
+		Escribe los elementos en el archivo indicado y espera a que estén en el disco.
+		"""
+		# json.dump escribe el texto en miles de trozos; generarlo entero con json.dumps y escribirlo de una vez es varias veces más rápido.
+		data = json.dumps(items)
+		with open(path, 'w', encoding='utf-8') as file:
+			file.write(data)
+			file.flush()
+			os.fsync(file.fileno())
+
+	def close(self):
+		"""
+		No mantiene archivos abiertos; existe para compartir la interfaz con SQLiteStore.
+		"""
+
+
+class BinaryJournalStore(JournalStore):
+	"""
+	Como JournalStore, pero con la instantánea en el formato binario de snapshot.py,
+	que se lee sin analizar textos ni fechas. El diario de cambios sigue siendo JSON.
+	"""
+
+	def _read_snapshot(self):
+		with open(self.snapshot_path, 'rb') as file:
+			return snapshot.decode(file.read())
+
+	def _write_snapshot(self, path, items):
+		data = snapshot.encode(items)
+		with open(path, 'wb') as file:
+			file.write(data)
+			file.flush()
+			os.fsync(file.fileno())
+
+
+class SQLiteStore:
+	"""
+	Almacén alternativo sobre una base de datos SQLite (módulo sqlite3 de la biblioteca estándar).
+	Ofrece la misma interfaz que JournalStore, por lo que ReminderManager y PersistenceWorker lo usan igual.
+	Como con JournalStore, el gestor carga todos los recordatorios al iniciar y los busca y programa en memoria;
+	la base de datos solo guarda los cambios de uno en uno, sin reescribir el archivo completo.
+	Los elementos tienen el formato de la instantánea JSON:
+	(mensaje, "AAAA-MM-DD HH:MM", recurrencia, sonido, intervalo, tareas, identificador),
+	seguidos de las repeticiones y el intervalo entre avisos cuando el recordatorio tiene valores propios.
+	"""
+
+	SCHEMA_VERSION = 1
+
+	# SQLite no necesita compactarse; se mantienen los atributos para cumplir la interfaz del almacén.
+	journal_records = 0
+	needs_compaction = False
+
+	def __init__(self, db_path):
+		"""
+		Args:
+			db_path (str): Ruta del archivo de la base de datos. Se crea si no existe.
+		"""
+		self.db_path = db_path
+		self._lock = threading.Lock()
+		# La conexión se comparte entre el hilo de persistencia y el de la interfaz, siempre bajo self._lock.
+		self._connection = sqlite3.connect(db_path, check_same_thread=False)
+		with self._lock, self._connection:
+			self._connection.executescript("""
+				CREATE TABLE IF NOT EXISTS reminders (
+					key TEXT PRIMARY KEY,
+					position INTEGER NOT NULL,
+					message TEXT NOT NULL,
+					reminder_time TEXT NOT NULL,
+					recurrence TEXT,
+					sound_file TEXT,
+					custom_interval INTEGER,
+					reminder_id INTEGER,
+					repetitions INTEGER,
+					notification_interval INTEGER
+				);
+				CREATE TABLE IF NOT EXISTS tasks (
+					reminder_key TEXT NOT NULL,
+					position INTEGER NOT NULL,
+					description TEXT NOT NULL,
+					completed INTEGER NOT NULL,
+					PRIMARY KEY (reminder_key, position)
+				);
+				CREATE INDEX IF NOT EXISTS reminders_position ON reminders (position);
+				CREATE UNIQUE INDEX IF NOT EXISTS reminders_message ON reminders (message COLLATE NOCASE);
+			""")
+			self._connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+	def load(self):
+		"""
+		Lee todos los recordatorios en el orden en que se añadieron.
+		Returns:
+			list: Los elementos almacenados.
+		"""
+		with self._lock:
+			rows = self._connection.execute(
+				"SELECT key, message, reminder_time, recurrence, sound_file, custom_interval, reminder_id, repetitions, notification_interval FROM reminders ORDER BY position"
+			).fetchall()
+			return self._rows_to_items(rows)
+
+	def append(self, records):
+		"""
+		Aplica varios registros ["put", clave, elemento] o ["del", clave] en una sola transacción.
+		"""
+		with self._lock, self._connection:
+			for record in records:
+				if record[0] == "put":
+					self._put(record[1], record[2])
+				elif record[0] == "del":
+					self._delete(record[1])
+
+	def put(self, key, item):
+		"""
+		Añade o sustituye el elemento con la clave indicada.
+		"""
+		self.append([["put", key, item]])
+
+	def delete(self, key):
+		"""
+		Elimina el elemento con la clave indicada.
+		"""
+		self.append([["del", key]])
+
+	def compact(self, items):
+		"""
+		Sustituye todo el contenido por los elementos indicados en una sola transacción.
+		Se usa al guardar de forma síncrona y para migrar desde el almacén JSON.
+		Args:
+			items (list): Todos los elementos serializados, en orden.
+		"""
+		with self._lock, self._connection:
+			self._connection.execute("DELETE FROM tasks")
+			self._connection.execute("DELETE FROM reminders")
+			for item in items:
+				self._put(item[0].lower(), item)
+
+	def close(self):
+		"""
+		Cierra la conexión con la base de datos.
+		"""
+		with self._lock:
+			self._connection.close()
+
+	def _put(self, key, item):
+		"""
+		Inserta o actualiza una fila. Un recordatorio nuevo queda al final; uno existente conserva su posición.
+		Debe llamarse dentro de una transacción.
+		"""
+		message, time_str, recurrence, sound_file, custom_interval = item[:5]
+		tasks = item[5] if len(item) > 5 else []
+		reminder_id = item[6] if len(item) > 6 else None
+		repetitions, notification_interval = item[7:9] if len(item) > 8 else (None, None)
+		self._connection.execute(
+			"INSERT INTO reminders (key, position, message, reminder_time, recurrence, sound_file, custom_interval, reminder_id, "
+			"repetitions, notification_interval) "
+			"VALUES (?, (SELECT COALESCE(MAX(position), 0) + 1 FROM reminders), ?, ?, ?, ?, ?, ?, ?, ?) "
+			"ON CONFLICT (key) DO UPDATE SET message = excluded.message, reminder_time = excluded.reminder_time, "
+			"recurrence = excluded.recurrence, sound_file = excluded.sound_file, custom_interval = excluded.custom_interval, "
+			"reminder_id = excluded.reminder_id, repetitions = excluded.repetitions, "
+			"notification_interval = excluded.notification_interval",
+			(key, message, time_str, recurrence, sound_file, custom_interval, reminder_id, repetitions, notification_interval)
+		)
+		self._connection.execute("DELETE FROM tasks WHERE reminder_key = ?", (key,))
+		self._connection.executemany(
+			"INSERT INTO tasks (reminder_key, position, description, completed) VALUES (?, ?, ?, ?)",
+			[(key, position, task['description'], int(task['completed'])) for position, task in enumerate(tasks)]
+		)
+
+	def _delete(self, key):
+		"""
+		Elimina una fila y sus tareas. Debe llamarse dentro de una transacción.
+		"""
+		self._connection.execute("DELETE FROM tasks WHERE reminder_key = ?", (key,))
+		self._connection.execute("DELETE FROM reminders WHERE key = ?", (key,))
+
+	def _rows_to_items(self, rows):
+		"""
+		Convierte filas de la tabla reminders en elementos, añadiendo sus tareas.
+		"""
+		tasks_by_key = {}
+		if rows:
+			keys = [row[0] for row in rows]
+			# Dividimos la consulta para no superar el límite de parámetros de SQLite.
+			for start in range(0, len(keys), 500):
+				chunk = keys[start:start + 500]
+				placeholders = ",".join("?" * len(chunk))
+				for key, description, completed in self._connection.execute(
+					f"SELECT reminder_key, description, completed FROM tasks WHERE reminder_key IN ({placeholders}) "
+					"ORDER BY reminder_key, position",
+					chunk
+				):
+					tasks_by_key.setdefault(key, []).append({'description': description, 'completed': bool(completed)})
+		items = []
+		for row in rows:
+			item = list(row[1:6]) + [tasks_by_key.get(row[0], []), row[6]]
+			if row[7] is not None or row[8] is not None:
+				item += [row[7], row[8]]
+			items.append(item)
+		return items
+
+
+def _create_store(directory, key, backend):
+	"""
+	Crea el almacén indicado sobre sus archivos de la carpeta.
+	"""
+	paths = [os.path.join(directory, name) for name in STORE_FILES[backend]]
+	if backend == "sqlite":
+		return SQLiteStore(paths[0])
+	if backend == "binary":
+		return BinaryJournalStore(paths[0], paths[1], key=key)
+	return JournalStore(paths[0], paths[1], key=key)
+
+
+def _has_files(directory, backend):
+	"""
+	Indica si en la carpeta hay algún archivo del almacén indicado.
+	"""
+	return any(os.path.exists(os.path.join(directory, name)) for name in STORE_FILES[backend])
+
+
+def _with_text_times(items):
+	"""
+	Devuelve los elementos con la hora como texto ("AAAA-MM-DD HH:MM"), el formato que guardan JSON y SQLite.
+	La instantánea binaria la devuelve ya como datetime.
+	"""
+	return [
+		[item[0], item[1].isoformat(' ', 'minutes')] + list(item[2:]) if isinstance(item[1], datetime) else item
+		for item in items
+	]
+
+
+def _last_backend(directory):
+	"""
+	Devuelve el almacén que se usó por última vez en la carpeta, o None si no está anotado.
+	"""
+	try:
+		with open(os.path.join(directory, BACKEND_MARKER), 'r', encoding='utf-8') as file:
+			backend = file.read().strip()
+	except OSError:
+		return None
+	return backend if backend in STORE_FILES else None
+
+
+def _remember_backend(directory, backend):
+	"""
+	Anota el almacén en uso, sustituyendo el archivo de una vez para no dejarlo a medias.
+	"""
+	path = os.path.join(directory, BACKEND_MARKER)
+	temp_path = path + ".tmp"
+	with open(temp_path, 'w', encoding='utf-8') as file:
+		file.write(backend)
+	os.replace(temp_path, path)
+
+
+def open_store(directory, key, backend="json"):
+	"""
+	Crea el almacén de los recordatorios en la carpeta indicada.
+	Se anota qué almacén se usó por última vez. Al cambiar de opción, los recordatorios se copian desde ese,
+	que es el que tiene los últimos cambios, aunque el nuevo conserve archivos de un uso anterior.
+	Los archivos del almacén anterior se dejan como copia de seguridad.
+	Args:
+		directory (str): Carpeta en la que están los archivos (la configuración de NVDA).
+		key (callable): Devuelve la clave de cada elemento guardado, para el diario de cambios.
+		backend (str): "json" para la instantánea con diario, "binary" para la instantánea binaria con diario,
+			"sqlite" para la base de datos.
+	"""
+	if backend not in STORE_FILES:
+		backend = "json"
+	last_backend = _last_backend(directory)
+	previous = last_backend
+	if previous is None:
+		# Sin anotación, los recordatorios están en el almacén elegido si ya tiene archivos o, si no, en el JSON de siempre.
+		previous = backend if _has_files(directory, backend) else "json"
+	store = _create_store(directory, key, backend)
+	if previous != backend and _has_files(directory, previous):
+		try:
+			source = _create_store(directory, key, previous)
+			try:
+				items = source.load()
+			finally:
+				source.close()
+			store.compact(_with_text_times(items))
+		except Exception:
+			# Sin anotar el cambio: en el siguiente inicio se vuelve a intentar desde el mismo almacén.
+			# Si no había anotación se anota el de origen, porque el nuevo ya tiene archivos (vacíos) y se tomaría por el actual.
+			store.close()
+			if last_backend is None:
+				_remember_backend(directory, previous)
+			raise
+	if last_backend != backend:
+		_remember_backend(directory, backend)
+	return store
+
+
+def export_json(items, path):
+	"""
+	Escribe los elementos en un archivo JSON con el formato de la instantánea de siempre,
+	que cualquier versión del complemento puede importar sin importar el almacén que use.
+	"""
+	temp_path = path + ".tmp"
+	with open(temp_path, 'w', encoding='utf-8') as file:
+		json.dump(items, file, ensure_ascii=False, indent="\t")
+	os.replace(temp_path, path)
+
+
+def import_json(path):
+	"""
+	Lee los elementos de un archivo JSON exportado (o de una instantánea recordatorios.json).
+	Raises:
+		ValueError: Si el archivo no es JSON o no contiene una lista.
+	"""
+	with open(path, 'r', encoding='utf-8') as file:
+		items = json.load(file)
+	if not isinstance(items, list):
+		raise ValueError("El archivo no contiene una lista de recordatorios")
+	return items
+
+
+class PersistenceWorker:
+	"""
+	Hilo que escribe en segundo plano los cambios pendientes en un almacén.
+	Los cambios que llegan dentro de la misma ventana de espera se agrupan en una sola escritura,
+	y varios cambios sobre la misma clave se reducen al último.
+	"""
+
+	def __init__(self, store, snapshot_provider, delay=DEFAULT_SAVE_DELAY, on_write=None):
+		"""
+		Args:
+			store (JournalStore): El almacén en el que se escriben los cambios.
+			snapshot_provider (callable): Devuelve todos los elementos serializados, para compactar.
+			delay (float): Segundos que se esperan agrupando cambios antes de escribirlos.
+			on_write (callable): Si se indica, se llama con los segundos que tardó cada escritura en el almacén.
+		"""
+		self.store = store
+		self.snapshot_provider = snapshot_provider
+		self.delay = delay
+		self.on_write = on_write
+		# Cambios pendientes por clave, en orden de llegada. Cada valor es la lista de registros a escribir.
+		self._pending = {}
+		# Número de bloques batch abiertos; mientras haya alguno, el hilo no escribe.
+		self._batches = 0
+		self._condition = threading.Condition()
+		# Impide que el hilo y un guardado síncrono escriban a la vez.
+		self._write_lock = threading.Lock()
+		self.running = True
+		worker_thread = threading.Thread(target=self._run, daemon=True)
+		worker_thread.start()
+
+	def put(self, key, item):
+		"""
+		Programa la escritura de un elemento añadido o modificado.
+		"""
+		self._queue(key, ["put", key, item])
+
+	def delete(self, key):
+		"""
+		Programa la escritura de la eliminación de un elemento.
+		"""
+		self._queue(key, ["del", key])
+
+	@contextmanager
+	def batch(self):
+		"""
+		Agrupa en una sola escritura todos los cambios programados dentro del bloque,
+		aunque el bloque dure más que la ventana de espera.
+		"""
+		with self._condition:
+			self._batches += 1
+		try:
+			yield
+		finally:
+			with self._condition:
+				self._batches -= 1
+				self._condition.notify_all()
+
+	def _queue(self, key, record):
+		"""
+		Añade un registro a los cambios pendientes, descartando los anteriores de la misma clave.
+		"""
+		with self._condition:
+			previous = self._pending.pop(key, None)
+			if record[0] == "put" and previous and previous[0][0] == "del":
+				# Se conserva la eliminación para que el elemento vuelva a quedar al final, como en memoria.
+				self._pending[key] = [previous[0], record]
+			else:
+				self._pending[key] = [record]
+			self._condition.notify()
+
+	def _take_pending(self):
+		"""
+		Retira y devuelve los registros pendientes en orden.
+		"""
+		with self._condition:
+			pending, self._pending = self._pending, {}
+		return [record for records in pending.values() for record in records]
+
+	def _run(self):
+		"""
+		Bucle del hilo: espera el primer cambio, deja pasar la ventana de espera y escribe el lote.
+		"""
+		while True:
+			with self._condition:
+				while self.running and (not self._pending or self._batches):
+					self._condition.wait()
+				if not self.running:
+					return
+			time.sleep(self.delay)
+			with self._condition:
+				# Si durante la espera empezó un bloque batch, esperamos a que termine para escribirlo entero.
+				while self.running and self._batches:
+					self._condition.wait()
+			self.flush()
+
+	def flush(self):
+		"""
+		Escribe en el diario los cambios pendientes y compacta el almacén si hace falta.
+		Puede llamarse desde cualquier hilo; regresa cuando los datos ya están en disco.
+		"""
+		with self._write_lock:
+			start = time.perf_counter()
+			records = self._take_pending()
+			if records:
+				self.store.append(records)
+			if self.store.needs_compaction:
+				self.store.compact(self.snapshot_provider())
+			elif not records:
+				return
+			self._report_write(start)
+
+	def compact(self):
+		"""
+		Escribe de inmediato una instantánea completa, que ya incluye los cambios pendientes.
+		"""
+		with self._write_lock:
+			# Se descartan los pendientes antes de pedir la instantánea, para que ninguno quede fuera de ella.
+			start = time.perf_counter()
+			self._take_pending()
+			self.store.compact(self.snapshot_provider())
+			self._report_write(start)
+
+	def _report_write(self, start):
+		"""
+		Comunica a on_write la duración de una escritura que empezó en start (time.perf_counter).
+		"""
+		if self.on_write is not None:
+			self.on_write(time.perf_counter() - start)
+
+	def stop(self):
+		"""
+		Detiene el hilo y escribe de forma síncrona los cambios que queden pendientes.
+		"""
+		with self._condition:
+			self.running = False
+			self._condition.notify_all()
+		self.flush()
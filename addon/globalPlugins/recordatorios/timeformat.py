@@ -0,0 +1,129 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Texto del tiempo que falta para un recordatorio ("en 2 horas, 5 minutos").
+Los meses y los años se cuentan con el calendario, no como bloques de 30 o 365 días,
+y los textos ya formateados se guardan para no repetir el trabajo en cada vista.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+try:
+	import addonHandler
+	addonHandler.initTranslation()
+except ImportError:
+	# Fuera de NVDA (pruebas y mediciones) los textos se quedan sin traducir.
+	from gettext import gettext as _, ngettext
+
+from .recurrence import add_months
+
+# A partir de esta diferencia el resultado depende del calendario (duración de los meses),
+# y no solo de la diferencia, así que la clave de la caché incluye también la hora actual.
+CALENDAR_THRESHOLD = timedelta(days=28)
+# Número de textos que se guardan.
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _unit_texts(years, months, days, hours, minutes, seconds):
+	"""
+	Devuelve las partes del texto, cada una con su forma en singular o plural.
+	Las cadenas se escriben aquí de forma literal para que lleguen al catálogo de traducciones.
+	"""
+	parts = []
+	if years:
+		parts.append(ngettext("{} año", "{} años", years).format(years))
+	if months:
+		parts.append(ngettext("{} mes", "{} meses", months).format(months))
+	if days:
+		parts.append(ngettext("{} día", "{} días", days).format(days))
+	if hours:
+		parts.append(ngettext("{} hora", "{} horas", hours).format(hours))
+	if minutes:
+		parts.append(ngettext("{} minuto", "{} minutos", minutes).format(minutes))
+	if seconds and not parts: # Solo mostrar segundos si es lo único que queda
+		parts.append(ngettext("{} segundo", "{} segundos", seconds).format(seconds))
+	return parts
+
+
+class TimeRemainingFormatter:
+	"""
+	Formatea el tiempo restante hasta una fecha, guardando los resultados en una caché LRU.
+	La clave es la diferencia redondeada: al minuto cuando hay minutos que mostrar, y al segundo
+	cuando solo quedan segundos, que es la precisión que se muestra.
+	"""
+
+	def __init__(self, cache_size=DEFAULT_CACHE_SIZE):
+		self.cache_size = cache_size
+		self._cache = OrderedDict()
+		# Se formatea desde el hilo principal y desde los que añaden recordatorios.
+		self._lock = threading.Lock()
+
+	def format(self, target, now):
+		"""
+		Devuelve el texto del tiempo que falta desde now hasta target.
+		Args:
+			target (datetime): La fecha futura.
+			now (datetime): La hora actual; quien formatea varias fechas la calcula una sola vez.
+		"""
+		delta = target - now
+		if delta < timedelta(0):
+			return _("ya ha pasado")
+		total_seconds = int(delta.total_seconds())
+		if total_seconds >= 60:
+			# Los segundos no se muestran cuando hay minutos u otras unidades mayores.
+			key = total_seconds // 60 * 60
+		else:
+			key = total_seconds
+		if delta >= CALENDAR_THRESHOLD:
+			key = (key, now.replace(second=0, microsecond=0))
+		with self._lock:
+			text = self._cache.get(key)
+			if text is not None:
+				self._cache.move_to_end(key)
+				return text
+		text = self._format(target, now, delta)
+		with self._lock:
+			self._cache[key] = text
+			if len(self._cache) > self.cache_size:
+				self._cache.popitem(last=False)
+		return text
+
+	@staticmethod
+	def _format(target, now, delta):
+		"""
+		Construye el texto sin usar la caché.
+		"""
+		years = months = 0
+		if delta >= CALENDAR_THRESHOLD:
+			# Contamos meses de calendario completos desde now y descomponemos el resto.
+			total_months = (target.year - now.year) * 12 + target.month - now.month
+			if add_months(now, total_months) > target:
+				total_months -= 1
+			years, months = divmod(total_months, 12)
+			delta = target - add_months(now, total_months)
+		seconds = delta.seconds
+		parts = _unit_texts(years, months, delta.days, seconds // 3600, seconds % 3600 // 60, seconds % 60)
+		if not parts:
+			return _("en este momento")
+		return _("en {}").format(", ".join(parts))
+
+
+# Instancia compartida por la confirmación al añadir, la vista de recordatorios activos y las listas de selección.
+_formatter = TimeRemainingFormatter()
+
+
+def format_time_remaining(target, now=None):
+	"""
+	Devuelve el texto del tiempo que falta hasta target, usando la caché compartida.
+	Args:
+		target (datetime): La fecha futura.
+		now (datetime): La hora actual. Al formatear muchas fechas conviene pasarla para calcularla una sola vez.
+	"""
+	if now is None:
+		now = datetime.now()
+	return _formatter.format(target, now)
@@ -0,0 +1,173 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Rueda de temporizadores (timing wheel) jerárquica, para los recordatorios que se repiten cada pocos minutos.
+Cada nivel es una lista circular de huecos; en el nivel 0 cada hueco es un minuto y en cada nivel siguiente
+un hueco abarca una vuelta entera del anterior. Un elemento se guarda en el hueco de su minuto en el nivel más bajo
+que lo alcanza, y al empezar cada vuelta los elementos del hueco correspondiente del nivel superior bajan de nivel.
+Así, añadir, quitar y avanzar un minuto cuestan O(1), sin reordenar nada como en un montículo.
+Este módulo no depende de NVDA para poder usarse y probarse por separado.
+"""
+
+from datetime import datetime, timedelta
+
+# Huecos de cada nivel y número de niveles: con 64 y 2 la rueda alcanza 64 * 64 minutos (unas 68 horas).
+DEFAULT_SLOTS = 64
+DEFAULT_LEVELS = 2
+EPOCH = datetime(1970, 1, 1)
+RESOLUTION = timedelta(minutes=1)
+
+
+def _minute(moment):
+	"""
+	Devuelve el número de minuto (desde EPOCH) al que pertenece una hora.
+	"""
+	return (moment - EPOCH) // RESOLUTION
+
+
+class TimerWheel:
+	"""
+	Rueda de temporizadores con resolución de un minuto. Cada elemento tiene una clave única y una hora exacta:
+	el hueco solo indica el minuto, y dentro del minuto actual se entrega cuando su hora ya llegó.
+	Las horas más allá del alcance de la rueda no se admiten; quien la usa las programa por otro medio.
+	No es segura entre hilos: quien la usa debe protegerla con su propio cerrojo.
+	"""
+
+	def __init__(self, now, slots=DEFAULT_SLOTS, levels=DEFAULT_LEVELS):
+		"""
+		Args:
+			now (datetime): Hora actual; la rueda empieza en su minuto.
+			slots (int): Huecos de cada nivel.
+			levels (int): Número de niveles.
+		"""
+		self.slots = slots
+		self.levels = levels
+		# Minutos que alcanza la rueda a partir del actual.
+		self.horizon = slots ** levels
+		# Cada hueco es un diccionario clave -> (hora, elemento).
+		self._wheels = [[{} for slot in range(slots)] for level in range(levels)]
+		# Clave -> (nivel, hueco) en el que está cada elemento, para quitarlo sin buscarlo.
+		self._positions = {}
+		# Minuto actual: los elementos de los minutos anteriores ya se entregaron.
+		self._current = _minute(now)
+
+	def __len__(self):
+		return len(self._positions)
+
+	def __contains__(self, key):
+		return key in self._positions
+
+	def add(self, key, when, item):
+		"""
+		Programa un elemento, sustituyendo al que tuviera la misma clave.
+		Una hora ya pasada se entrega en el siguiente avance.
+		Returns:
+			bool: False si la hora queda fuera del alcance de la rueda; en ese caso no se añade.
+		"""
+		self.remove(key)
+		return self._place(key, when, item)
+
+	def remove(self, key):
+		"""
+		Quita un elemento programado.
+		Returns:
+			bool: True si estaba en la rueda.
+		"""
+		position = self._positions.pop(key, None)
+		if position is None:
+			return False
+		level, slot = position
+		del self._wheels[level][slot][key]
+		return True
+
+	def _place(self, key, when, item):
+		"""
+		Guarda un elemento en el hueco de su minuto, en el nivel más bajo que lo alcanza.
+		"""
+		minute = max(_minute(when), self._current)
+		delta = minute - self._current
+		span = 1
+		for level in range(self.levels):
+			if delta < span * self.slots:
+				slot = minute // span % self.slots
+				self._wheels[level][slot][key] = (when, item)
+				self._positions[key] = (level, slot)
+				return True
+			span *= self.slots
+		return False
+
+	def _cascade(self):
+		"""
+		Al empezar una vuelta de uno o varios niveles, baja de nivel los elementos de los huecos que empiezan.
+		Se recorren de arriba abajo, para que lo que baja de un nivel superior llegue antes de vaciar el siguiente.
+		"""
+		top = 1
+		span = self.slots
+		while top < self.levels and self._current % span == 0:
+			top += 1
+			span *= self.slots
+		for level in range(top - 1, 0, -1):
+			bucket = self._wheels[level][self._current // self.slots ** level % self.slots]
+			entries = list(bucket.items())
+			bucket.clear()
+			for key, (when, item) in entries:
+				self._place(key, when, item)
+
+	def pop_due(self, now):
+		"""
+		Avanza la rueda hasta now y retira los elementos cuya hora ya llegó.
+		Returns:
+			list: Los elementos vencidos, ordenados por su hora.
+		"""
+		target = _minute(now)
+		due = []
+		if target - self._current >= self.horizon:
+			# Tras una suspensión más larga que el alcance de la rueda todo ha vencido: se recoge sin recorrer minuto a minuto.
+			for level in self._wheels:
+				for bucket in level:
+					due.extend(bucket.values())
+					bucket.clear()
+			self._positions.clear()
+			self._current = target
+		while self._current < target:
+			bucket = self._wheels[0][self._current % self.slots]
+			due.extend(bucket.values())
+			for key in bucket:
+				del self._positions[key]
+			bucket.clear()
+			self._current += 1
+			self._cascade()
+		# Del minuto actual solo se entrega lo que ya llegó.
+		bucket = self._wheels[0][self._current % self.slots]
+		for key, entry in list(bucket.items()):
+			if entry[0] <= now:
+				del bucket[key]
+				del self._positions[key]
+				due.append(entry)
+		due.sort(key=lambda entry: entry[0])
+		return [item for when, item in due]
+
+	def next_due(self):
+		"""
+		Devuelve la hora del elemento más próximo, o None si la rueda está vacía.
+		En cada nivel basta con el primer hueco ocupado, pero hay que mirarlos todos: un elemento de un nivel superior
+		cuyo hueco aún no ha empezado puede llegar antes que otros que ya están en el nivel 0.
+		Cuesta como mucho un recorrido de cada nivel.
+		"""
+		if not self._positions:
+			return None
+		candidates = []
+		span = 1
+		for level in range(self.levels):
+			# En el nivel 0 el hueco actual puede tener elementos; en los superiores el actual ya bajó de nivel.
+			first = 0 if level == 0 else 1
+			for offset in range(first, first + self.slots):
+				bucket = self._wheels[level][(self._current // span + offset) % self.slots]
+				if bucket:
+					candidates.append(min(when for when, item in bucket.values()))
+					break
+			span *= self.slots
+		return min(candidates)
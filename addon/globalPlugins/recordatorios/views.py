@@ -0,0 +1,113 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+HTML de la vista de recordatorios activos.
+No depende de NVDA ni de wx, así que la vista se puede construir y medir por separado.
+"""
+
+import html
+from datetime import timedelta
+
+try:
+	import addonHandler
+	addonHandler.initTranslation()
+except ImportError:
+	# Fuera de NVDA (pruebas y mediciones) los textos se quedan sin traducir.
+	from gettext import gettext as _
+
+from .core import TASK_COMPLETED_STATUS, TASK_PENDING_STATUS, describe_recurrence
+
+# Páginas de la vista de recordatorios activos.
+ACTIVE_VIEW_SECTIONS = ("today", "week", "later")
+
+
+class ActiveRemindersView:
+	"""
+	Construye las páginas de la vista de recordatorios activos: hoy, esta semana y más adelante.
+	El HTML de cada recordatorio se guarda hasta que el recordatorio cambia (ver Reminder.revision);
+	en cada vista solo se vuelve a calcular el tiempo restante.
+	"""
+
+	def __init__(self, format_time_remaining):
+		"""
+		Args:
+			format_time_remaining (callable): Devuelve el texto del tiempo restante hasta una fecha, desde la hora actual indicada.
+		"""
+		self.format_time_remaining = format_time_remaining
+		# Identificador -> (revisión, fecha de hoy, HTML antes del tiempo restante, HTML después).
+		self._fragments = {}
+
+	@staticmethod
+	def section_of(reminder_time, today, week_end):
+		"""
+		Devuelve la página en la que se muestra un recordatorio.
+		"""
+		day = reminder_time.date()
+		if day <= today:
+			return "today"
+		if day <= week_end:
+			return "week"
+		return "later"
+
+	def _fragment(self, reminder, today):
+		"""
+		Devuelve las dos partes fijas del HTML de un recordatorio, construyéndolas solo si cambió.
+		"""
+		cached = self._fragments.get(reminder.id)
+		if cached is not None and cached[0] == reminder.revision and cached[1] == today:
+			return cached[2], cached[3]
+		reminder_time = reminder.reminder_time
+		# Verificar si el recordatorio es para hoy o para una fecha futura
+		date_text = _("hoy") if reminder_time.date() == today else reminder_time.strftime("%d/%m/%Y")
+		recurrence_text = f", recurrente {describe_recurrence(reminder.recurrence)}" if reminder.recurrence else ""
+		head = (
+			f"<h2>{html.escape(reminder.message)}</h2>"
+			f"<p>{_('Fecha')}: {date_text} {_('a las')} {reminder_time.strftime('%H:%M')}{recurrence_text}</p>"
+			f"<p>{_('Tiempo restante')}: "
+		)
+		tail = "</p>"
+		if reminder.tasks:
+			tail += f"<h3>{_('Tareas')}:</h3><ol>"
+			for task in reminder.tasks:
+				status = TASK_COMPLETED_STATUS if task.completed else TASK_PENDING_STATUS
+				tail += f"<li><strong>{status}</strong> {html.escape(task.description)}</li>"
+			tail += "</ol>"
+		self._fragments[reminder.id] = (reminder.revision, today, head, tail)
+		return head, tail
+
+	def render(self, reminders, section, now):
+		"""
+		Construye el HTML de una página de la vista.
+		Args:
+			reminders (list): Instantánea de los recordatorios.
+			section (str): La página a mostrar: today, week o later.
+			now (datetime): La hora actual.
+		Returns:
+			tuple: El HTML de la página (None si no tiene recordatorios) y cuántos recordatorios hay en cada página.
+		"""
+		today = now.date()
+		week_end = today + timedelta(days=6 - today.weekday())
+		counts = dict.fromkeys(ACTIVE_VIEW_SECTIONS, 0)
+		selected = []
+		for reminder in reminders:
+			reminder_section = self.section_of(reminder.reminder_time, today, week_end)
+			counts[reminder_section] += 1
+			if reminder_section == section:
+				selected.append(reminder)
+		if len(self._fragments) > len(reminders):
+			# Olvidamos los fragmentos de los recordatorios que ya no existen.
+			current_ids = {reminder.id for reminder in reminders}
+			self._fragments = {reminder_id: fragment for reminder_id, fragment in self._fragments.items() if reminder_id in current_ids}
+		if not selected:
+			return None, counts
+		selected.sort(key=lambda reminder: reminder.reminder_time)
+		entries = []
+		for reminder in selected:
+			head, tail = self._fragment(reminder, today)
+			entries.append(head + self.format_time_remaining(reminder.reminder_time, now) + tail)
+		#Translators: Resumen, al principio de la vista de recordatorios activos, de cuántos hay en cada página.
+		summary = _("Hoy: {today}. Esta semana: {week}. Más adelante: {later}.").format(**counts)
+		return f"<p>{summary}</p><hr>" + "<hr>".join(entries), counts # Separador entre recordatorios
@@ -0,0 +1,58 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Tiempo de importación de los módulos que se cargan al iniciar NVDA, cada muestra en un proceso nuevo.
+Además de cada módulo por separado, se compara el inicio con la carga diferida de las ventanas (lazy)
+con lo que costaría cargarlas al iniciar (eager). wx ya está cargado en NVDA cuando se inicia el complemento,
+así que se importa antes de empezar a medir y el caso eager solo suma wx.adv y dialogs.py.
+Sin wxPython no se puede importar dialogs.py y se omite la comparación entera.
+"""
+
+import importlib.util
+import subprocess
+import sys
+
+from common import bootstrap_code
+
+# Módulos que se cargan al iniciar NVDA, medidos uno por uno.
+MODULES = ("core", "adapters", "views")
+# Lo que se importa al iniciar en cada caso.
+STARTUP_IMPORTS = {
+	"lazy": tuple("recordatorios." + module for module in MODULES),
+	"eager": tuple("recordatorios." + module for module in MODULES) + ("wx.adv", "recordatorios.dialogs"),
+}
+# Lo que ya está cargado cuando NVDA inicia el complemento: wx y los nombres que dialogs.py toma del plugin global,
+# que fuera de NVDA no se ejecuta. Solo se usan al abrir las ventanas, así que basta con que existan.
+STARTUP_SETUP = (
+	"import wx\n"
+	"for name in ('NOTIFICATION_INTERVAL_CHOICES', 'NOTIFICATION_REPETITION_CHOICES', 'REMINDER_DELETED_MESSAGE', 'reminder_manager'):\n"
+	"\tsetattr(sys.modules['recordatorios'], name, None)\n"
+)
+
+
+def import_modules(modules, repeat, setup=""):
+	code = bootstrap_code() + setup + (
+		"import importlib, time\n"
+		"start = time.perf_counter()\n"
+		"for module in {!r}:\n"
+		"\timportlib.import_module(module)\n"
+		"print(time.perf_counter() - start)\n"
+	).format(modules)
+	results = []
+	for index in range(repeat):
+		output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+		results.append(float(output))
+	return results
+
+
+def cases(sizes):
+	for module in MODULES:
+		yield "import", {"module": module}, lambda repeat, module=module: import_modules(("recordatorios." + module,), repeat)
+	if importlib.util.find_spec("wx") is None:
+		print("Se omite la comparación del inicio lazy y eager: wxPython no está instalado.", file=sys.stderr)
+		return
+	for startup, modules in STARTUP_IMPORTS.items():
+		yield "import", {"startup": startup}, lambda repeat, modules=modules: import_modules(modules, repeat, STARTUP_SETUP)
@@ -0,0 +1,37 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Construcción del HTML de la vista de recordatorios activos (las tres páginas),
+la primera vez (cold) y con los fragmentos ya guardados (warm).
+"""
+
+from common import START_TIME, make_records, timed
+from recordatorios.models import Reminder
+from recordatorios.timeformat import format_time_remaining
+from recordatorios.views import ACTIVE_VIEW_SECTIONS, ActiveRemindersView
+
+
+def render(size, warm, repeat):
+	reminders = [Reminder.from_record(record) for record in make_records(size)]
+	view = ActiveRemindersView(format_time_remaining)
+
+	def run():
+		for section in ACTIVE_VIEW_SECTIONS:
+			view.render(reminders, section, START_TIME)
+	if warm:
+		run()
+	results = []
+	for index in range(repeat):
+		if not warm:
+			view = ActiveRemindersView(format_time_remaining)
+		results.append(timed(run))
+	return results
+
+
+def cases(sizes):
+	for size in sizes:
+		for warm in (False, True):
+			yield "render_active", {"size": size, "cache": "warm" if warm else "cold"}, lambda repeat, size=size, warm=warm: render(size, warm, repeat)
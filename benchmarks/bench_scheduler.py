@@ -0,0 +1,149 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Coste del planificador: ciclos sin vencimientos, ciclos que disparan un recordatorio, ciclos con muchos
+recordatorios de intervalo corto, altas con detección de duplicados y entrega de avisos al notificador de NVDA.
+Todo corre con un reloj simulado, así que las mediciones no dependen de la hora real.
+"""
+
+from datetime import timedelta
+
+from common import START_TIME, make_records, timed
+from recordatorios.adapters import NVDANotifier
+from recordatorios.core import ReminderManager
+from recordatorios.doubles import FakeClock, MemoryStore, RecordingNotifier
+from recordatorios.settings import ReminderSettings
+from recordatorios.sounds import SoundCache
+
+# Segundos de espera del hilo de persistencia: mayor que cualquier medición, para que no escriba durante ellas.
+SAVE_DELAY = 600
+# Operaciones por muestra en las mediciones de operaciones cortas.
+IDLE_TICKS = 1000
+FIRED_TICKS = 100
+DUPLICATES = 1000
+NOTIFICATIONS = 1000
+# Recordatorios de intervalo corto (de 1 a 5 minutos) que se añaden en tick_short_intervals.
+SHORT_INTERVALS = 50
+
+
+def _manager(records):
+	"""
+	Crea y abre un gestor en memoria con los recordatorios indicados y un reloj detenido en START_TIME.
+	"""
+	manager = ReminderManager(RecordingNotifier(), MemoryStore.factory(records), ReminderSettings, FakeClock(START_TIME), save_delay=SAVE_DELAY)
+	manager.open()
+	return manager
+
+
+def tick_idle(size, repeat):
+	"""
+	Ciclo del planificador cuando no ha vencido nada: lo que cuesta cada despertar.
+	"""
+	manager = _manager(make_records(size))
+	results = []
+	for index in range(repeat):
+		def run():
+			for tick in range(IDLE_TICKS):
+				manager.fire_due()
+		results.append(timed(run) / IDLE_TICKS)
+	manager.stop()
+	return results
+
+
+def tick_fire(size, repeat):
+	"""
+	Ciclo del planificador que dispara un recordatorio (aviso, reprogramación o eliminación y guardado diferido).
+	"""
+	manager = _manager(make_records(size))
+	ticks = max(1, min(FIRED_TICKS, size // repeat))
+	results = []
+	for index in range(repeat):
+		def run():
+			for tick in range(ticks):
+				manager.clock.advance(minutes=1)
+				manager.fire_due()
+		results.append(timed(run) / ticks)
+	manager.stop()
+	return results
+
+
+def tick_short_intervals(size, repeat):
+	"""
+	Ciclo de un minuto con SHORT_INTERVALS recordatorios de 1 a 5 minutos entre size recordatorios:
+	avisos agrupados y reprogramación en la rueda, sin escribir cada nueva hora.
+	"""
+	manager = _manager(make_records(size))
+	for number in range(SHORT_INTERVALS):
+		manager.add_reminder("Corto {}".format(number), START_TIME + timedelta(minutes=1), custom_interval=number % 5 + 1)
+	results = []
+	for index in range(repeat):
+		def run():
+			for tick in range(FIRED_TICKS):
+				manager.clock.advance(minutes=1)
+				manager.fire_due()
+		results.append(timed(run) / FIRED_TICKS)
+	manager.stop()
+	return results
+
+
+def add_reminder(size, repeat):
+	"""
+	Alta de size recordatorios seguidos en un gestor vacío, con su detección de duplicados y su confirmación.
+	"""
+	results = []
+	for index in range(repeat):
+		manager = _manager([])
+
+		def run():
+			for number in range(size):
+				manager.add_reminder("Recordatorio {}".format(number), START_TIME + timedelta(minutes=number + 1))
+		results.append(timed(run) / size)
+		manager.stop()
+	return results
+
+
+def add_duplicate(size, repeat):
+	"""
+	Alta rechazada de un nombre que ya existe (con otras mayúsculas) entre size recordatorios.
+	"""
+	manager = _manager(make_records(size))
+	names = ["RECORDATORIO {}".format(number * size // DUPLICATES) for number in range(DUPLICATES)]
+	reminder_time = START_TIME + timedelta(days=1)
+	results = []
+	for index in range(repeat):
+		def run():
+			for name in names:
+				manager.add_reminder(name, reminder_time)
+		results.append(timed(run) / DUPLICATES)
+	manager.stop()
+	return results
+
+
+def notify_nvda(repeat):
+	"""
+	Tiempo que el planificador pasa entregando un aviso al notificador de NVDA (con los módulos sustitutos).
+	"""
+	notifier = NVDANotifier(SoundCache())
+	notifier.start()
+	results = []
+	for index in range(repeat):
+		def run():
+			for number in range(NOTIFICATIONS):
+				notifier.notify("Recordatorio {}".format(number))
+		results.append(timed(run) / NOTIFICATIONS)
+	notifier.stop()
+	return results
+
+
+def cases(sizes):
+	for size in sizes:
+		params = {"size": size}
+		yield "tick_idle", params, lambda repeat, size=size: tick_idle(size, repeat)
+		yield "tick_fire", params, lambda repeat, size=size: tick_fire(size, repeat)
+		yield "tick_short_intervals", params, lambda repeat, size=size: tick_short_intervals(size, repeat)
+		yield "add_reminder", params, lambda repeat, size=size: add_reminder(size, repeat)
+		yield "add_reminder_duplicate", params, lambda repeat, size=size: add_duplicate(size, repeat)
+	yield "notify_nvda", {}, notify_nvda
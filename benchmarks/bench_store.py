@@ -0,0 +1,127 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Carga y guardado de los recordatorios con los almacenes reales (JSON o binario con diario, y SQLite),
+y tiempo hasta que el gestor está listo al iniciar NVDA, incluida la importación de sus módulos.
+"""
+
+import subprocess
+import sys
+
+from common import START_TIME, TemporaryFolder, bootstrap_code, make_records, timed
+from recordatorios.core import ReminderManager
+from recordatorios.doubles import FakeClock, RecordingNotifier
+from recordatorios.models import storage_key
+from recordatorios.settings import ReminderSettings
+from recordatorios.storage import open_store
+
+BACKENDS = ("json", "binary", "sqlite")
+# Segundos de espera del hilo de persistencia: mayor que cualquier medición, para que no escriba durante ellas.
+SAVE_DELAY = 600
+# Inicio del complemento en un proceso nuevo: importa y crea el gestor como __init__.py, con la carpeta y el reloj
+# de la medición, y escribe los segundos hasta que los recordatorios están cargados.
+STARTUP_CODE = """
+import datetime
+import time
+start = time.perf_counter()
+import globalVars
+from recordatorios.adapters import NVDANotifier, create_store, load_settings, sound_cache
+from recordatorios.core import ReminderManager
+from recordatorios.timeformat import format_time_remaining
+from recordatorios.views import ActiveRemindersView
+
+class StoppedClock:
+	def now(self):
+		return {start_time!r}
+
+globalVars.appArgs.configPath = {folder!r}
+manager = ReminderManager(NVDANotifier(sound_cache), create_store, load_settings, StoppedClock())
+manager.start()
+manager.loaded.wait()
+print(time.perf_counter() - start)
+manager.stop()
+"""
+
+
+def _key(item):
+	return storage_key(item[0])
+
+
+def _prepare(folder, backend, size):
+	"""
+	Deja en la carpeta un almacén con size recordatorios.
+	"""
+	store = open_store(folder, _key, backend)
+	store.compact(make_records(size))
+	store.close()
+
+
+def _manager(folder, backend):
+	"""
+	Crea un gestor sobre el almacén de la carpeta, con un reloj detenido antes del primer recordatorio.
+	"""
+	settings = ReminderSettings(storage_backend=backend)
+	return ReminderManager(
+		RecordingNotifier(),
+		lambda settings: open_store(folder, _key, settings.storage_backend),
+		lambda: settings,
+		FakeClock(START_TIME),
+		save_delay=SAVE_DELAY
+	)
+
+
+def load_reminders(backend, size, repeat):
+	"""
+	Abre el almacén y carga los recordatorios (lectura, conversión e índices).
+	"""
+	results = []
+	with TemporaryFolder() as folder:
+		_prepare(folder, backend, size)
+		for index in range(repeat):
+			manager = _manager(folder, backend)
+			results.append(timed(manager.open))
+			manager.stop()
+	return results
+
+
+def save_reminders(backend, size, repeat):
+	"""
+	Guarda una instantánea completa de los recordatorios.
+	"""
+	results = []
+	with TemporaryFolder() as folder:
+		_prepare(folder, backend, size)
+		manager = _manager(folder, backend)
+		manager.open()
+		for index in range(repeat):
+			results.append(timed(manager.save_reminders))
+		manager.stop()
+	return results
+
+
+def startup(size, repeat):
+	"""
+	Tiempo desde la importación del complemento hasta que los recordatorios están cargados, como al iniciar NVDA.
+	Cada muestra se toma en un proceso nuevo, para que los módulos no estén ya importados.
+	"""
+	results = []
+	with TemporaryFolder() as folder:
+		_prepare(folder, "json", size)
+		code = bootstrap_code() + STARTUP_CODE.format(start_time=START_TIME, folder=folder)
+		for index in range(repeat):
+			output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+			results.append(float(output))
+	return results
+
+
+def cases(sizes):
+	for backend in BACKENDS:
+		for size in sizes:
+			params = {"backend": backend, "size": size}
+			yield "load_reminders", params, lambda repeat, backend=backend, size=size: load_reminders(backend, size, repeat)
+			yield "save_reminders", params, lambda repeat, backend=backend, size=size: save_reminders(backend, size, repeat)
+	for size in sorted({0, min(sizes), max(sizes)}):
+		yield "startup", {"size": size}, lambda repeat, size=size: startup(size, repeat)
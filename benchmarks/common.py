@@ -0,0 +1,98 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Utilidades compartidas por las mediciones: carga del complemento sin NVDA y datos de ejemplo.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime, timedelta
+
+BENCHMARKS_PATH = os.path.dirname(os.path.abspath(__file__))
+ROOT_PATH = os.path.dirname(BENCHMARKS_PATH)
+PACKAGE_PATH = os.path.join(ROOT_PATH, "addon", "globalPlugins", "recordatorios")
+STUBS_PATH = os.path.join(BENCHMARKS_PATH, "stubs")
+
+# Hora fija a partir de la cual se generan los recordatorios, para que todas las ejecuciones midan lo mismo.
+START_TIME = datetime(2024, 1, 1, 8, 0)
+
+
+def bootstrap():
+	"""
+	Prepara la importación del complemento fuera de NVDA.
+	Los módulos de NVDA (ui, gui, tones, nvwave, config, globalVars y addonHandler) se sustituyen por los de stubs.
+	El paquete se registra sin ejecutar su __init__.py, que es el plugin global y necesita wx.
+	"""
+	if STUBS_PATH not in sys.path:
+		sys.path.insert(0, STUBS_PATH)
+	if "recordatorios" not in sys.modules:
+		package = types.ModuleType("recordatorios")
+		package.__path__ = [PACKAGE_PATH]
+		sys.modules["recordatorios"] = package
+
+
+def bootstrap_code():
+	"""
+	Devuelve el código que hace lo mismo que bootstrap, para ejecutarlo en un proceso nuevo.
+	"""
+	return (
+		"import sys, types\n"
+		"sys.path.insert(0, {stubs!r})\n"
+		"package = types.ModuleType('recordatorios')\n"
+		"package.__path__ = [{package!r}]\n"
+		"sys.modules['recordatorios'] = package\n"
+	).format(stubs=STUBS_PATH, package=PACKAGE_PATH)
+
+
+class TemporaryFolder:
+	"""
+	Carpeta temporal que hace de carpeta de configuración de NVDA y se borra al salir del bloque with.
+	"""
+
+	def __enter__(self):
+		self.path = tempfile.mkdtemp(prefix="recordatorios-bench-")
+		return self.path
+
+	def __exit__(self, *exc_info):
+		shutil.rmtree(self.path, ignore_errors=True)
+
+
+def make_records(count, with_tasks=True):
+	"""
+	Genera recordatorios serializados (Reminder.to_record) variados: uno por minuto a partir de START_TIME,
+	con recurrencias, sonidos, tareas y avisos propios repartidos entre ellos.
+	"""
+	recurrences = (None, None, None, "diario", "semanal", "mensual", "laborables")
+	records = []
+	for index in range(count):
+		reminder_time = START_TIME + timedelta(minutes=index + 1)
+		tasks = [{"description": "Tarea {}".format(task), "completed": task % 2 == 0} for task in range(index % 4)] if with_tasks else []
+		record = (
+			"Recordatorio {}".format(index),
+			reminder_time.isoformat(" ", "minutes"),
+			recurrences[index % len(recurrences)],
+			"C:\\sonidos\\aviso{}.wav".format(index % 8) if index % 3 == 0 else None,
+			None,
+			tasks,
+			index + 1
+		)
+		if index % 10 == 0:
+			record += (2, 20)
+		records.append(record)
+	return records
+
+
+def timed(function):
+	"""
+	Ejecuta function y devuelve los segundos que tardó.
+	"""
+	start = time.perf_counter()
+	function()
+	return time.perf_counter() - start
@@ -0,0 +1,56 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Copia de format_time_remaining tal como estaba antes de timeformat.py, para comparar con ella.
+No se usa en el complemento.
+"""
+
+from datetime import datetime
+from gettext import gettext as _
+
+
+def format_time_remaining(future_datetime):
+	"""
+	Formatea el tiempo restante hasta una fecha y hora futuras de manera legible.
+	"""
+	now = datetime.now()
+	time_diff = future_datetime - now
+
+	if time_diff.total_seconds() < 0:
+		return _("ya ha pasado")
+
+	days = time_diff.days
+	hours = time_diff.seconds // 3600
+	minutes = (time_diff.seconds % 3600) // 60
+	seconds = time_diff.seconds % 60
+
+	parts = []
+	if days > 0:
+		years = days // 365
+		remaining_days = days % 365
+		if years > 0:
+			parts.append(_(f"{years} año{'s' if years > 1 else ''}"))
+		
+		# Considerar meses si hay muchos días restantes y no hay años
+		if remaining_days > 30 and years == 0:
+			months = remaining_days // 30
+			remaining_days %= 30
+			parts.append(_(f"{months} mes{'es' if months > 1 else ''}"))
+		
+		if remaining_days > 0:
+			parts.append(_(f"{remaining_days} día{'s' if remaining_days > 1 else ''}"))
+	
+	if hours > 0:
+		parts.append(_(f"{hours} hora{'s' if hours > 1 else ''}"))
+	if minutes > 0:
+		parts.append(_(f"{minutes} minuto{'s' if minutes > 1 else ''}"))
+	if seconds > 0 and not parts: # Solo mostrar segundos si es lo único que queda
+		parts.append(_(f"{seconds} segundo{'s' if seconds > 1 else ''}"))
+
+	if not parts:
+		return _("en este momento")
+	
+	return _("en ") + ", ".join(parts)
@@ -0,0 +1,76 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Memoria que ocupan los recordatorios cargados, medida con tracemalloc.
+
+	python benchmarks/memory.py --sizes 10000 100000
+
+Para cada almacén se abre un gestor con los recordatorios de ejemplo y se informa de la memoria reservada
+durante la carga que sigue en uso (los recordatorios, sus tareas, los índices y el montículo del planificador),
+en total y por recordatorio. No forma parte de run.py porque mide bytes, no segundos.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+
+import common
+
+DEFAULT_SIZES = (10000, 100000)
+
+
+def retained_bytes(function):
+	"""
+	Ejecuta function y devuelve lo que devuelve y los bytes que reservó y siguen en uso al terminar.
+	Mientras se mide, tracemalloc hace que todo vaya bastante más lento; los tiempos de run.py no sirven con él activo.
+	"""
+	gc.collect()
+	tracemalloc.start()
+	try:
+		before = tracemalloc.get_traced_memory()[0]
+		result = function()
+		gc.collect()
+		return result, tracemalloc.get_traced_memory()[0] - before
+	finally:
+		tracemalloc.stop()
+
+
+def reminder_memory(backend, size):
+	"""
+	Carga size recordatorios con el almacén indicado.
+	Returns:
+		int: Los bytes que ocupan una vez cargados.
+	"""
+	# bench_store importa el complemento, que solo puede importarse después de common.bootstrap().
+	import bench_store
+	with common.TemporaryFolder() as folder:
+		bench_store._prepare(folder, backend, size)
+		manager = bench_store._manager(folder, backend)
+		try:
+			_result, size_in_bytes = retained_bytes(manager.open)
+		finally:
+			manager.stop()
+	return size_in_bytes
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Memoria que ocupan los recordatorios cargados.")
+	parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="cantidades de recordatorios que se miden")
+	args = parser.parse_args(argv)
+
+	common.bootstrap()
+	import bench_store
+	print("{:<8} {:>10} {:>14} {:>14}".format("almacén", "cantidad", "bytes", "por recordatorio"))
+	for backend in bench_store.BACKENDS:
+		for size in args.sizes:
+			size_in_bytes = reminder_memory(backend, size)
+			print("{:<8} {:>10} {:>14} {:>14.1f}".format(backend, size, size_in_bytes, size_in_bytes / size), flush=True)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,126 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Mediciones de rendimiento del motor de recordatorios, sin NVDA.
+
+	python benchmarks/run.py --output resultados.json
+	python benchmarks/run.py --baseline resultados.json
+
+Cada medición se repite --repeat veces y se guarda su mediana y su mínimo, en segundos por operación.
+Con --baseline se compara con unos resultados anteriores y el programa termina con código 1 si alguna
+medición es más lenta que la tolerancia, para detectar regresiones antes de generar el complemento con scons.
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import statistics
+import sys
+
+import common
+
+# Módulos con mediciones; cada uno tiene una función cases(sizes) que devuelve (nombre, parámetros, función).
+# La función recibe el número de repeticiones y devuelve los segundos de cada una.
+MODULES = ("bench_store", "bench_scheduler", "bench_render", "bench_format", "bench_import")
+DEFAULT_SIZES = (1000, 10000, 100000)
+QUICK_SIZES = (1000, 10000)
+DEFAULT_REPEAT = 5
+# Diferencia relativa a partir de la cual una medición más lenta que la de referencia cuenta como regresión.
+DEFAULT_TOLERANCE = 0.25
+# Versión del formato del archivo de resultados.
+RESULTS_VERSION = 1
+
+
+def result_key(result):
+	"""
+	Clave con la que se relaciona una medición con la misma medición de los resultados de referencia.
+	"""
+	return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+
+def run_benchmarks(sizes, repeat, name_filter=None):
+	"""
+	Ejecuta las mediciones y devuelve sus resultados.
+	"""
+	results = []
+	for module_name in MODULES:
+		module = importlib.import_module(module_name)
+		for name, params, function in module.cases(sizes):
+			if name_filter and name_filter not in name:
+				continue
+			samples = function(repeat)
+			result = {
+				"name": name,
+				"params": params,
+				"median": statistics.median(samples),
+				"min": min(samples),
+				"repeat": len(samples),
+			}
+			results.append(result)
+			print("{:<24} {:<42} {:>12.6f}".format(name, json.dumps(params, sort_keys=True), result["median"]), flush=True)
+	return results
+
+
+def compare(results, baseline, tolerance):
+	"""
+	Compara los resultados con los de referencia e imprime las diferencias.
+	Returns:
+		list: Los resultados más lentos que la referencia por encima de la tolerancia.
+	"""
+	previous = {result_key(result): result for result in baseline["results"]}
+	regressions = []
+	print()
+	print("{:<24} {:<42} {:>12} {:>12} {:>8}".format("medición", "parámetros", "referencia", "actual", "cambio"))
+	for result in results:
+		reference = previous.get(result_key(result))
+		if reference is None or not reference["median"]:
+			continue
+		ratio = result["median"] / reference["median"]
+		marker = ""
+		if ratio > 1 + tolerance:
+			regressions.append(result)
+			marker = " REGRESIÓN"
+		print("{:<24} {:<42} {:>12.6f} {:>12.6f} {:>7.2f}x{}".format(
+			result["name"], json.dumps(result["params"], sort_keys=True), reference["median"], result["median"], ratio, marker
+		))
+	return regressions
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Mediciones de rendimiento del motor de recordatorios.")
+	parser.add_argument("--quick", action="store_true", help="usar solo 1000 y 10000 recordatorios")
+	parser.add_argument("--sizes", type=int, nargs="+", help="cantidades de recordatorios que se miden")
+	parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="repeticiones de cada medición")
+	parser.add_argument("--filter", dest="name_filter", help="medir solo las mediciones cuyo nombre contiene este texto")
+	parser.add_argument("--output", help="archivo JSON en el que se guardan los resultados")
+	parser.add_argument("--baseline", help="archivo JSON de resultados anteriores con el que comparar")
+	parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="diferencia relativa que cuenta como regresión")
+	args = parser.parse_args(argv)
+	sizes = tuple(args.sizes) if args.sizes else QUICK_SIZES if args.quick else DEFAULT_SIZES
+
+	common.bootstrap()
+	results = run_benchmarks(sizes, args.repeat, args.name_filter)
+	document = {
+		"version": RESULTS_VERSION,
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"sizes": list(sizes),
+		"results": results,
+	}
+	if args.output:
+		with open(args.output, "w", encoding="utf-8") as output_file:
+			json.dump(document, output_file, indent="\t")
+	if args.baseline:
+		with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+			baseline = json.load(baseline_file)
+		if compare(results, baseline, args.tolerance):
+			return 1
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
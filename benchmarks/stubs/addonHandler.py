@@ -0,0 +1,12 @@
+# Sustituto del módulo addonHandler de NVDA para las mediciones.
+import builtins
+import gettext
+
+
+def initTranslation():
+	"""
+	Como en NVDA, deja disponibles _ y ngettext; aquí sin traducir.
+	"""
+	builtins._ = gettext.gettext
+	builtins.ngettext = gettext.ngettext
+	builtins.pgettext = lambda context, message: message
@@ -0,0 +1,12 @@
+# Sustituto del módulo config de NVDA para las mediciones, con los valores por defecto del complemento.
+
+conf = {
+	"remindersConfig": {
+		"numberOfTimesToNotifyReminder": 1,
+		"notificationInterval": 10,
+		"storageBackend": "json",
+		"missedRemindersPolicy": "once",
+		"exportMetrics": False,
+	},
+	"audio": {"outputDevice": ""},
+}
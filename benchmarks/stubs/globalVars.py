@@ -0,0 +1,6 @@
+# Sustituto del módulo globalVars de NVDA para las mediciones.
+# Las mediciones cambian configPath por una carpeta temporal antes de crear almacenes.
+import tempfile
+from types import SimpleNamespace
+
+appArgs = SimpleNamespace(configPath=tempfile.gettempdir(), secure=False)
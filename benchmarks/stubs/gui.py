@@ -0,0 +1,4 @@
+# Sustituto del módulo gui de NVDA para las mediciones.
+# dialogs.py solo usa mainFrame al abrir ventanas, así que basta con que exista.
+
+mainFrame = None
@@ -0,0 +1,20 @@
+# Sustituto del módulo nvwave de NVDA para las mediciones: no se reproduce nada.
+
+
+class WavePlayer:
+
+	def __init__(self, *args, **kwargs):
+		pass
+
+	def feed(self, data):
+		pass
+
+	def idle(self):
+		pass
+
+	def close(self):
+		pass
+
+
+def playWaveFile(fileName, asynchronous=True):
+	pass
@@ -0,0 +1,5 @@
+# Sustituto del módulo tones de NVDA para las mediciones: no suena nada.
+
+
+def beep(hz, length, left=50, right=50):
+	pass
@@ -0,0 +1,9 @@
+# Sustituto del módulo ui de NVDA para las mediciones: los mensajes se descartan.
+
+
+def message(text, *args, **kwargs):
+	pass
+
+
+def browseableMessage(message, title=None, isHtml=False, *args, **kwargs):
+	pass
@@ -0,0 +1,16 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Pruebas del motor de recordatorios, que se ejecutan sin NVDA desde la raíz del repositorio:
+
+	python -m unittest discover -s tests -t .
+
+El complemento se carga como en las mediciones, con los sustitutos de los módulos de NVDA de benchmarks/stubs.
+"""
+
+from benchmarks.common import bootstrap
+
+bootstrap()
@@ -0,0 +1,213 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Pruebas de cómo el gestor atiende los recordatorios recurrentes que vencieron.
+"""
+
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from recordatorios.core import ReminderManager, describe_recurrence
+from recordatorios.doubles import FakeClock, MemoryStore, RecordingNotifier
+from recordatorios.models import Reminder
+from recordatorios.settings import ReminderSettings
+
+# Martes.
+START_TIME = datetime(2024, 1, 2, 9, 0)
+
+
+class WaitingNotifier(RecordingNotifier):
+	"""
+	Notificador de prueba que avisa cuando llegan los avisos esperados.
+	"""
+
+	def __init__(self, expected):
+		super().__init__()
+		self.expected = expected
+		self.done = threading.Event()
+
+	def notify(self, text, sound_file=None, repetitions=1, interval=0):
+		super().notify(text, sound_file, repetitions, interval)
+		if len(self.notifications) >= self.expected:
+			self.done.set()
+
+
+def create_manager(reminders, now, notifier=None, settings=None):
+	"""
+	Crea un gestor con los recordatorios indicados y el reloj detenido en now.
+	"""
+	records = [reminder.to_record() for reminder in reminders]
+	settings = settings or ReminderSettings()
+	return ReminderManager(notifier or RecordingNotifier(), MemoryStore.factory(records), lambda: settings, FakeClock(now), save_delay=600)
+
+
+class EndedSeriesTest(unittest.TestCase):
+	"""
+	Un recordatorio cuya regla ya no tiene más apariciones se anuncia y se retira, sin afectar a los demás.
+	"""
+
+	def test_unsatisfiable_rule_is_announced_once_and_removed(self):
+		manager = create_manager([
+			Reminder(1, "Imposible", START_TIME, "FREQ=DAILY;INTERVAL=7;BYDAY=MO"),
+			Reminder(2, "Diario", START_TIME, "diario"),
+		], START_TIME)
+		manager.open()
+		manager.fire_due()
+		self.assertEqual([text for text, *rest in manager.notifier.notifications], ["Recordatorio: Imposible", "Recordatorio: Diario"])
+		self.assertEqual([reminder.message for reminder in manager.reminders], ["Diario"])
+		self.assertEqual(manager.reminders[0].reminder_time, START_TIME + timedelta(days=1))
+
+	def test_count_is_spent_across_fires(self):
+		manager = create_manager([Reminder(1, "Tres veces", START_TIME, "FREQ=DAILY;COUNT=3")], START_TIME)
+		manager.open()
+		manager.fire_due()
+		self.assertEqual(manager.reminders[0].recurrence, "FREQ=DAILY;COUNT=2")
+		# Se salta un día: vence la segunda aparición y la tercera queda como la última.
+		manager.clock.advance(days=1, hours=1)
+		manager.fire_due()
+		self.assertEqual(manager.reminders[0].recurrence, "FREQ=DAILY;COUNT=1")
+		self.assertEqual(manager.reminders[0].reminder_time, START_TIME + timedelta(days=2))
+		manager.clock.advance(days=1)
+		manager.fire_due()
+		self.assertEqual(manager.reminders, [])
+		self.assertEqual(len(manager.notifier.notifications), 3)
+
+	def test_until_ends_the_series(self):
+		manager = create_manager([Reminder(1, "Hasta el jueves", START_TIME, "FREQ=DAILY;UNTIL=20240104T0900")], START_TIME)
+		manager.open()
+		for day in range(3):
+			self.assertEqual(len(manager.fire_due()), 1)
+			manager.clock.advance(days=1)
+		self.assertEqual(manager.reminders, [])
+		self.assertEqual(len(manager.notifier.notifications), 3)
+
+	def test_rule_out_of_datetime_range_does_not_stop_the_scheduler(self):
+		last_day = datetime(9999, 12, 31, 9, 0)
+		notifier = WaitingNotifier(2)
+		manager = create_manager([
+			Reminder(1, "Fin del calendario", last_day, "diario"),
+			Reminder(2, "Semanal", last_day - timedelta(days=1), "semanal"),
+		], last_day, notifier)
+		manager.start()
+		try:
+			self.assertTrue(notifier.done.wait(10))
+			self.assertTrue(manager._thread.is_alive())
+		finally:
+			manager.stop()
+		self.assertEqual(sorted(text for text, *rest in notifier.notifications), ["Recordatorio: Fin del calendario", "Recordatorio: Semanal"])
+		self.assertEqual(manager.reminders, [])
+
+
+class MonthEndTest(unittest.TestCase):
+	"""
+	Un recordatorio mensual del 29 al 31 pasa por los meses más cortos y vuelve a su día sin dejar de ser "mensual".
+	"""
+
+	def fire(self, manager, now):
+		manager.clock.current = now
+		manager.fire_due()
+		return manager.reminders[0]
+
+	def test_day_31_returns_after_february(self):
+		manager = create_manager([Reminder(1, "Alquiler", datetime(2024, 1, 31, 9, 0), "mensual")], START_TIME)
+		manager.open()
+		reminder = self.fire(manager, datetime(2024, 1, 31, 9, 0))
+		self.assertEqual(reminder.reminder_time, datetime(2024, 2, 29, 9, 0))
+		# Mientras está en el día recortado, el día original queda en la regla, pero se sigue mostrando como mensual.
+		self.assertEqual(reminder.recurrence, "FREQ=MONTHLY;BYMONTHDAY=31")
+		self.assertEqual(describe_recurrence(reminder.recurrence), "mensual")
+		reminder = self.fire(manager, datetime(2024, 2, 29, 9, 0))
+		self.assertEqual(reminder.reminder_time, datetime(2024, 3, 31, 9, 0))
+		self.assertEqual(reminder.recurrence, "mensual")
+		reminder = self.fire(manager, datetime(2024, 3, 31, 9, 0))
+		self.assertEqual(reminder.reminder_time, datetime(2024, 4, 30, 9, 0))
+		self.assertEqual(self.fire(manager, datetime(2024, 4, 30, 9, 0)).reminder_time, datetime(2024, 5, 31, 9, 0))
+
+	def test_long_months_keep_the_legacy_key(self):
+		manager = create_manager([Reminder(1, "Factura", datetime(2024, 5, 31, 9, 0), "mensual")], START_TIME)
+		manager.open()
+		reminder = self.fire(manager, datetime(2024, 5, 31, 9, 0))
+		self.assertEqual(reminder.reminder_time, datetime(2024, 6, 30, 9, 0))
+		reminder = self.fire(manager, datetime(2024, 6, 30, 9, 0))
+		self.assertEqual((reminder.reminder_time, reminder.recurrence), (datetime(2024, 7, 31, 9, 0), "mensual"))
+		reminder = self.fire(manager, datetime(2024, 7, 31, 9, 0))
+		self.assertEqual((reminder.reminder_time, reminder.recurrence), (datetime(2024, 8, 31, 9, 0), "mensual"))
+
+
+class MissedPolicyTest(unittest.TestCase):
+	"""
+	Cada política de avisos perdidos, con un recordatorio diario que vence tres días tarde:
+	se anuncia la aparición del primer día y se perdieron las de los dos siguientes.
+	"""
+
+	def fire_late(self, policy, reminders, days=2):
+		manager = create_manager(reminders, START_TIME + timedelta(days=days, minutes=5), settings=ReminderSettings(missed_policy=policy))
+		manager.open()
+		manager.fire_due()
+		return manager
+
+	def messages(self, manager):
+		return [text for text, *rest in manager.notifier.notifications]
+
+	def test_once_announces_without_summary(self):
+		manager = self.fire_late("once", [Reminder(1, "Pastilla", START_TIME, "diario")])
+		self.assertEqual(self.messages(manager), ["Recordatorio: Pastilla"])
+		self.assertEqual(manager.reminders[0].reminder_time, START_TIME + timedelta(days=3))
+
+	def test_summary_counts_only_the_missed_occurrences(self):
+		manager = self.fire_late("summary", [Reminder(1, "Pastilla", START_TIME, "diario")])
+		self.assertEqual(self.messages(manager), [
+			"Recordatorio: Pastilla\nSe perdieron 2 avisos de este recordatorio mientras el equipo estaba apagado o suspendido."
+		])
+		manager = self.fire_late("summary", [Reminder(1, "Pastilla", START_TIME, "diario")], days=1)
+		self.assertEqual(self.messages(manager), [
+			"Recordatorio: Pastilla\nSe perdió 1 aviso de este recordatorio mientras el equipo estaba apagado o suspendido."
+		])
+
+	def test_summary_on_time_has_no_summary(self):
+		manager = self.fire_late("summary", [Reminder(1, "Pastilla", START_TIME, "diario")], days=0)
+		self.assertEqual(self.messages(manager), ["Recordatorio: Pastilla"])
+
+	def test_skip_only_announces_on_time(self):
+		manager = self.fire_late("skip", [Reminder(1, "Pastilla", START_TIME, "diario")])
+		self.assertEqual(self.messages(manager), [])
+		self.assertEqual(manager.reminders[0].reminder_time, START_TIME + timedelta(days=3))
+		manager.clock.current = manager.reminders[0].reminder_time
+		manager.fire_due()
+		self.assertEqual(self.messages(manager), ["Recordatorio: Pastilla"])
+
+	def test_count_spends_the_missed_occurrences(self):
+		manager = self.fire_late("summary", [Reminder(1, "Cinco veces", START_TIME, "FREQ=DAILY;COUNT=5")])
+		self.assertEqual(manager.reminders[0].recurrence, "FREQ=DAILY;COUNT=2")
+
+	def test_group_summary_for_short_intervals(self):
+		reminders = [
+			Reminder(1, "Agua", START_TIME, custom_interval=30),
+			Reminder(2, "Postura", START_TIME, custom_interval=60),
+		]
+		manager = create_manager(reminders, START_TIME + timedelta(minutes=65), settings=ReminderSettings(missed_policy="summary"))
+		manager.open()
+		manager.fire_due()
+		self.assertEqual(self.messages(manager), [
+			"Recordatorios: Agua, Postura"
+			"\nSe perdieron 2 avisos de Agua mientras el equipo estaba apagado o suspendido."
+			"\nSe perdió 1 aviso de Postura mientras el equipo estaba apagado o suspendido."
+		])
+
+	def test_group_skip_leaves_out_the_late_reminders(self):
+		reminders = [
+			Reminder(1, "Agua", START_TIME, custom_interval=30),
+			Reminder(2, "Postura", START_TIME + timedelta(minutes=65), custom_interval=60),
+		]
+		manager = create_manager(reminders, START_TIME + timedelta(minutes=65), settings=ReminderSettings(missed_policy="skip"))
+		manager.open()
+		manager.fire_due()
+		self.assertEqual(self.messages(manager), ["Recordatorio: Postura"])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,154 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Prueba de carga del gestor desde varios hilos a la vez: se añaden, eliminan, reprograman y atienden
+recordatorios mientras corre el hilo de verificación, y después se comprueba que la lista, el índice de nombres,
+el montículo, la rueda y el almacén siguen de acuerdo entre sí.
+"""
+
+import random
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from recordatorios.core import ReminderManager
+from recordatorios.doubles import FakeClock, MemoryStore, RecordingNotifier
+from recordatorios.models import storage_key
+from recordatorios.settings import ReminderSettings
+
+START_TIME = datetime(2024, 1, 1, 8, 0)
+# Operaciones que hace cada hilo.
+ITERATIONS = 300
+# Recurrencias de los recordatorios añadidos: sin repetición, diaria e intervalos personalizados,
+# cortos (a la rueda de temporizadores) y largos (al montículo).
+KINDS = (
+	{},
+	{"recurrence": "diario"},
+	{"custom_interval": 1},
+	{"custom_interval": 5},
+	{"custom_interval": 240},
+)
+
+
+class ConcurrentManagerTest(unittest.TestCase):
+
+	def setUp(self):
+		self.clock = FakeClock(START_TIME)
+		self.store = MemoryStore()
+		self.manager = ReminderManager(
+			RecordingNotifier(),
+			lambda settings: self.store,
+			ReminderSettings,
+			self.clock,
+			save_delay=0.01
+		)
+		self.manager.start()
+		self.manager.loaded.wait()
+		# Recordatorios añadidos por identificador, e identificadores de los eliminados.
+		self.added = {}
+		self.deleted = set()
+		self._results_lock = threading.Lock()
+		self.errors = []
+
+	def _run_threads(self, *targets):
+		threads = [threading.Thread(target=self._guarded, args=(target, seed)) for seed, target in enumerate(targets)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		self.assertEqual(self.errors, [])
+
+	def _guarded(self, target, seed):
+		try:
+			target(random.Random(seed))
+		except Exception as error:
+			self.errors.append(error)
+
+	def _adder(self, prefix):
+		def add(rng):
+			for index in range(ITERATIONS):
+				reminder = self.manager.add_reminder(
+					"{} {}".format(prefix, index),
+					self.clock.now() + timedelta(minutes=rng.randint(0, 30)),
+					**rng.choice(KINDS)
+				)
+				with self._results_lock:
+					self.added[reminder.id] = reminder
+		return add
+
+	def _deleter(self, rng):
+		for index in range(ITERATIONS):
+			reminders = self.manager.reminders
+			if reminders:
+				deleted = self.manager.delete_reminder(rng.choice(reminders).id)
+				if deleted is not None:
+					with self._results_lock:
+						self.deleted.add(deleted.id)
+
+	def _rescheduler(self, rng):
+		for index in range(ITERATIONS):
+			reminders = self.manager.reminders
+			if reminders:
+				self.manager.update_reminder(
+					rng.choice(reminders).id,
+					reminder_time=self.clock.now() + timedelta(minutes=rng.randint(0, 90))
+				)
+
+	def _firer(self, rng):
+		for index in range(ITERATIONS):
+			self.clock.advance(minutes=rng.randint(0, 3))
+			self.manager.fire_due()
+
+	def test_concurrent_mutations_keep_invariants(self):
+		self._run_threads(self._adder("Primero"), self._adder("Segundo"), self._deleter, self._rescheduler, self._firer)
+		manager = self.manager
+		# Los recordatorios sin recurrencia se retiran al anunciarse, ya sea desde fire_due o desde el hilo de verificación.
+		announced = {text for text, sound_file, repetitions, interval in manager.notifier.notifications}
+		fired_once = {
+			reminder_id for reminder_id, reminder in self.added.items()
+			if not reminder.is_recurrent and "Recordatorio: {}".format(reminder.message) in announced
+		}
+		with manager._lock:
+			reminders = dict(manager._reminders)
+			# Ningún recordatorio se pierde ni reaparece: quedan los añadidos que no se eliminaron ni se atendieron.
+			self.assertEqual(set(reminders), set(self.added) - self.deleted - fired_once)
+			for reminder_id, reminder in reminders.items():
+				self.assertEqual(reminder.id, reminder_id)
+				self.assertLess(reminder_id, manager._next_id)
+			# El índice de nombres tiene exactamente los recordatorios de la lista.
+			self.assertEqual(
+				{name: reminder.id for name, reminder in manager._names.items()},
+				{manager._normalize_name(reminder.message): reminder.id for reminder in reminders.values()}
+			)
+			# Cada recordatorio está programado una sola vez, en la rueda o en el montículo, con su hora actual.
+			in_wheel = {reminder_id for reminder_id in reminders if reminder_id in manager._wheel}
+			self.assertEqual(len(manager._wheel), len(in_wheel))
+			self.assertTrue(in_wheel.isdisjoint(manager._heap_entries))
+			self.assertEqual(in_wheel | set(manager._heap_entries), set(reminders))
+			for reminder_id, entry in manager._heap_entries.items():
+				self.assertIs(entry[2], reminders[reminder_id])
+				self.assertEqual(entry[0], entry[2].reminder_time)
+			for reminder_id in in_wheel:
+				level, slot = manager._wheel._positions[reminder_id]
+				when, reminder = manager._wheel._wheels[level][slot][reminder_id]
+				self.assertIs(reminder, reminders[reminder_id])
+				self.assertEqual(when, reminder.reminder_time)
+			# El montículo conserva su orden y solo contiene como vigentes las entradas indexadas.
+			heap = manager._heap
+			for index in range(1, len(heap)):
+				self.assertLessEqual(heap[(index - 1) // 2][:2], heap[index][:2])
+			live = [entry for entry in heap if entry[2] is not None]
+			self.assertEqual(len(live), len(manager._heap_entries))
+		# Al cerrar, el almacén guarda exactamente lo que hay en memoria, incluida la hora de los de intervalo corto.
+		manager.stop()
+		self.assertEqual(
+			{storage_key(item[0]): list(item) for item in self.store.load()},
+			{storage_key(reminder.message): list(reminder.to_record()) for reminder in reminders.values()}
+		)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,114 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Retraso de los avisos cuando vencen muchos recordatorios en el mismo minuto.
+Las repeticiones de cada aviso se programan en el despachador, así que ningún recordatorio espera
+a que terminen las repeticiones de los anteriores.
+"""
+
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from recordatorios.core import NotificationDispatcher, ReminderManager
+from recordatorios.doubles import FakeClock, MemoryStore, RecordingNotifier
+from recordatorios.models import Reminder
+from recordatorios.settings import ReminderSettings
+
+START_TIME = datetime(2024, 1, 1, 8, 0)
+# Recordatorios que vencen en el mismo minuto.
+BURST = 100
+# Retraso máximo admitido, en segundos, entre el vencimiento y el primer aviso de cada recordatorio.
+# Antes, cada recordatorio esperaba repeticiones * intervalo de los anteriores: con 4 avisos cada 60 segundos,
+# el último de 100 llegaba unas cinco horas tarde.
+WORST_CASE_DELAY = 1.0
+# Segundos entre repeticiones en la prueba del despachador, para que termine enseguida.
+REPEAT_INTERVAL = 0.05
+
+
+class TimestampNotifier(RecordingNotifier):
+	"""
+	Notificador de prueba que anota además cuándo llega cada aviso y avisa cuando llegan todos los esperados.
+	"""
+
+	def __init__(self, expected):
+		super().__init__()
+		self.expected = expected
+		self.times = []
+		self.done = threading.Event()
+
+	def notify(self, text, sound_file=None, repetitions=1, interval=0):
+		self.times.append(time.monotonic())
+		super().notify(text, sound_file, repetitions, interval)
+		if len(self.notifications) >= self.expected:
+			self.done.set()
+
+
+class RecordingDispatcher(NotificationDispatcher):
+	"""
+	Despachador real que, en lugar de anunciar, anota cuándo sale cada aviso.
+	"""
+
+	def __init__(self, expected):
+		super().__init__()
+		self.expected = expected
+		self.announced = []
+		self.done = threading.Event()
+
+	def _announce(self, message, sound_file):
+		self.announced.append((time.monotonic(), message))
+		if len(self.announced) >= self.expected:
+			self.done.set()
+
+
+class BurstLatencyTest(unittest.TestCase):
+
+	def test_scheduler_fires_burst_within_worst_case_delay(self):
+		due = START_TIME + timedelta(minutes=1)
+		records = [Reminder(index + 1, "Recordatorio {}".format(index), due).to_record() for index in range(BURST)]
+		notifier = TimestampNotifier(BURST)
+		# Los peores ajustes posibles: 4 avisos cada 60 segundos.
+		settings = ReminderSettings(repetitions=4, interval=60)
+		manager = ReminderManager(notifier, MemoryStore.factory(records), lambda: settings, FakeClock(due), save_delay=600)
+		start = time.monotonic()
+		# El hilo de verificación carga los recordatorios y atiende enseguida los que ya vencieron.
+		manager.start()
+		try:
+			self.assertTrue(notifier.done.wait(WORST_CASE_DELAY * 10))
+		finally:
+			manager.stop()
+		self.assertEqual(
+			sorted(text for text, sound_file, repetitions, interval in notifier.notifications),
+			sorted("Recordatorio: {}".format(record[0]) for record in records)
+		)
+		self.assertLessEqual(max(notifier.times) - start, WORST_CASE_DELAY)
+		# Las repeticiones se delegan al despachador en lugar de esperarlas en el planificador.
+		self.assertEqual({notification[2:] for notification in notifier.notifications}, {(4, 60)})
+
+	def test_dispatcher_interleaves_repetitions(self):
+		repetitions = 4
+		dispatcher = RecordingDispatcher(BURST * repetitions)
+		dispatcher.start()
+		start = time.monotonic()
+		try:
+			for index in range(BURST):
+				dispatcher.notify("Recordatorio {}".format(index), None, repetitions, REPEAT_INTERVAL)
+			self.assertTrue(dispatcher.done.wait(WORST_CASE_DELAY * 10))
+		finally:
+			dispatcher.stop()
+		first = {}
+		for moment, message in dispatcher.announced:
+			first.setdefault(message, moment)
+		self.assertEqual(len(first), BURST)
+		# El primer aviso de todos sale antes del retraso máximo, sin esperar las repeticiones de los demás.
+		self.assertLessEqual(max(first.values()) - start, WORST_CASE_DELAY)
+		# Y el último aviso llega cuando toca, tras sus repeticiones, no tras las de los 100 recordatorios.
+		self.assertLessEqual(dispatcher.announced[-1][0] - start, (repetitions - 1) * REPEAT_INTERVAL + WORST_CASE_DELAY)
+
+
+if __name__ == "__main__":
+	unittest.main()
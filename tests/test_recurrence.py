@@ -0,0 +1,204 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Pruebas del motor de recurrencia (recurrence.py).
+"""
+
+import itertools
+import unittest
+from datetime import datetime, timedelta
+
+from recordatorios.recurrence import RecurrenceRule, add_months, legacy_key, parse_rule, rule_for
+
+# Martes.
+START_TIME = datetime(2024, 1, 2, 9, 0)
+
+
+def series(text, dtstart=START_TIME):
+	return parse_rule(text).series(dtstart)
+
+
+def first(text, count, dtstart=START_TIME):
+	"""
+	Devuelve las primeras apariciones de una regla.
+	"""
+	return list(itertools.islice(series(text, dtstart).occurrences(), count))
+
+
+class ParseTest(unittest.TestCase):
+
+	def test_text_round_trip(self):
+		for text in (
+			"FREQ=DAILY",
+			"FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE",
+			"FREQ=MONTHLY;BYDAY=-1FR",
+			"FREQ=MONTHLY;BYMONTHDAY=31;COUNT=4",
+			"FREQ=DAILY;UNTIL=20240110T0900;EXDATE=20240104T0900",
+		):
+			self.assertEqual(parse_rule(text).to_text(), text)
+
+	def test_invalid_rules(self):
+		for text in (
+			"FREQ=YEARLY",
+			"FREQ=DAILY;INTERVAL=0",
+			"FREQ=MONTHLY;BYDAY=MO",
+			"FREQ=WEEKLY;BYMONTHDAY=3",
+			"FREQ=MONTHLY;BYMONTHDAY=32",
+			"FREQ=MONTHLY;BYDAY=6MO",
+			"FREQ=DAILY;COUNT=0",
+			"FREQ=DAILY;COUNT=2;UNTIL=20240110T0900",
+			"FREQ=DAILY;BYSETPOS=1",
+		):
+			with self.assertRaises(ValueError, msg=text):
+				RecurrenceRule.parse(text)
+
+	def test_legacy_values(self):
+		self.assertEqual(rule_for("semanal").to_text(), "FREQ=WEEKLY")
+		self.assertEqual(rule_for("laborables").to_text(), "FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR")
+		self.assertEqual(rule_for("diario", custom_interval=90).to_text(), "FREQ=MINUTELY;INTERVAL=90")
+		self.assertIsNone(rule_for(None))
+		# Un valor desconocido se trata como diario.
+		self.assertEqual(rule_for("quincenal").to_text(), "FREQ=DAILY")
+		self.assertEqual(legacy_key(parse_rule("FREQ=MONTHLY;BYMONTHDAY=30")), "mensual")
+		self.assertEqual(legacy_key(parse_rule("FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR")), "laborables")
+		self.assertIsNone(legacy_key(parse_rule("FREQ=MONTHLY;COUNT=3")))
+
+
+class ByDayTest(unittest.TestCase):
+
+	def test_weekdays_skip_the_weekend(self):
+		self.assertEqual(
+			first("FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR", 4, datetime(2024, 1, 5, 9, 0)),
+			[datetime(2024, 1, 5, 9, 0), datetime(2024, 1, 8, 9, 0), datetime(2024, 1, 9, 9, 0), datetime(2024, 1, 10, 9, 0)]
+		)
+
+	def test_weekly_days_every_other_week(self):
+		# La serie empieza el martes 2; el lunes 1 es anterior al inicio.
+		self.assertEqual(
+			first("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE", 4),
+			[datetime(2024, 1, 3, 9, 0), datetime(2024, 1, 15, 9, 0), datetime(2024, 1, 17, 9, 0), datetime(2024, 1, 29, 9, 0)]
+		)
+
+	def test_nth_and_last_weekday_of_month(self):
+		self.assertEqual(first("FREQ=MONTHLY;BYDAY=2TU", 3), [datetime(2024, 1, 9, 9, 0), datetime(2024, 2, 13, 9, 0), datetime(2024, 3, 12, 9, 0)])
+		self.assertEqual(first("FREQ=MONTHLY;BYDAY=-1FR", 3), [datetime(2024, 1, 26, 9, 0), datetime(2024, 2, 23, 9, 0), datetime(2024, 3, 29, 9, 0)])
+
+	def test_months_without_fifth_weekday_are_skipped(self):
+		self.assertEqual(first("FREQ=MONTHLY;BYDAY=5TU", 3), [datetime(2024, 1, 30, 9, 0), datetime(2024, 4, 30, 9, 0), datetime(2024, 7, 30, 9, 0)])
+
+
+class MonthDayTest(unittest.TestCase):
+
+	def test_day_31_is_clamped_in_short_months(self):
+		self.assertEqual(
+			first("FREQ=MONTHLY;BYMONTHDAY=31", 5, datetime(2023, 12, 31, 9, 0)),
+			[
+				datetime(2023, 12, 31, 9, 0), datetime(2024, 1, 31, 9, 0), datetime(2024, 2, 29, 9, 0),
+				datetime(2024, 3, 31, 9, 0), datetime(2024, 4, 30, 9, 0)
+			]
+		)
+
+	def test_day_29_in_common_and_leap_years(self):
+		self.assertEqual(
+			[occurrence.date() for occurrence in first("FREQ=MONTHLY;INTERVAL=12;BYMONTHDAY=29", 2, datetime(2023, 2, 1, 9, 0))],
+			[datetime(2023, 2, 28).date(), datetime(2024, 2, 29).date()]
+		)
+
+	def test_add_months_clamps(self):
+		self.assertEqual(add_months(datetime(2024, 1, 31, 9, 0), 1), datetime(2024, 2, 29, 9, 0))
+		self.assertEqual(add_months(datetime(2024, 3, 31, 9, 0), -1), datetime(2024, 2, 29, 9, 0))
+		self.assertEqual(add_months(datetime(2023, 11, 30, 9, 0), 3), datetime(2024, 2, 29, 9, 0))
+
+
+class IntervalTest(unittest.TestCase):
+
+	def test_daily_weekly_and_monthly_intervals(self):
+		self.assertEqual(first("FREQ=DAILY;INTERVAL=3", 3), [START_TIME, datetime(2024, 1, 5, 9, 0), datetime(2024, 1, 8, 9, 0)])
+		# Sin BYDAY, la semanal se repite el día de la semana del inicio.
+		self.assertEqual(first("FREQ=WEEKLY;INTERVAL=2", 2), [START_TIME, datetime(2024, 1, 16, 9, 0)])
+		self.assertEqual(first("FREQ=MONTHLY;INTERVAL=5", 3), [START_TIME, datetime(2024, 6, 2, 9, 0), datetime(2024, 11, 2, 9, 0)])
+		self.assertEqual(first("FREQ=MINUTELY;INTERVAL=90", 3), [START_TIME, datetime(2024, 1, 2, 10, 30), datetime(2024, 1, 2, 12, 0)])
+
+	def test_next_after_jumps_to_the_current_cycle(self):
+		recurrence = series("FREQ=DAILY;INTERVAL=3;BYDAY=MO")
+		self.assertEqual(recurrence.next_after(datetime(2030, 1, 1)), datetime(2030, 1, 21, 9, 0))
+		# Una consulta dentro del mismo hueco devuelve la respuesta guardada.
+		self.assertEqual(recurrence.next_after(datetime(2030, 1, 10)), datetime(2030, 1, 21, 9, 0))
+
+	def test_count_until_matches_the_occurrences(self):
+		end = datetime(2024, 12, 31, 23, 59)
+		for text in (
+			"FREQ=DAILY;INTERVAL=3;BYDAY=MO,FR",
+			"FREQ=WEEKLY;INTERVAL=3;BYDAY=SU,TU",
+			"FREQ=MONTHLY;INTERVAL=2;BYDAY=5WE",
+			"FREQ=MONTHLY;BYMONTHDAY=31;EXDATE=20240331T0900",
+			"FREQ=MINUTELY;INTERVAL=1440;COUNT=40",
+		):
+			recurrence = series(text)
+			expected = len(list(itertools.takewhile(lambda occurrence: occurrence <= end, recurrence.occurrences())))
+			self.assertEqual(recurrence.count_until(end), expected, text)
+
+
+class CountUntilTest(unittest.TestCase):
+
+	def test_count_limits_the_series(self):
+		recurrence = series("FREQ=DAILY;COUNT=3")
+		self.assertEqual(list(recurrence.occurrences()), [START_TIME + timedelta(days=day) for day in range(3)])
+		self.assertEqual(recurrence.next_after(START_TIME + timedelta(days=1)), START_TIME + timedelta(days=2))
+		self.assertIsNone(recurrence.next_after(START_TIME + timedelta(days=2)))
+		self.assertEqual(recurrence.count_until(datetime(2030, 1, 1)), 3)
+
+	def test_count_skips_excluded_dates(self):
+		self.assertEqual(
+			list(series("FREQ=DAILY;COUNT=2;EXDATE=20240103T0900").occurrences()),
+			[START_TIME, datetime(2024, 1, 4, 9, 0)]
+		)
+
+	def test_until_is_inclusive(self):
+		recurrence = series("FREQ=WEEKLY;UNTIL=20240116T0900")
+		self.assertEqual(list(recurrence.occurrences()), [START_TIME, datetime(2024, 1, 9, 9, 0), datetime(2024, 1, 16, 9, 0)])
+		self.assertIsNone(recurrence.next_after(datetime(2024, 1, 16, 9, 0)))
+		self.assertEqual(recurrence.count_between(START_TIME, datetime(2030, 1, 1)), 2)
+
+	def test_with_count_keeps_the_rest_of_the_rule(self):
+		self.assertEqual(parse_rule("FREQ=WEEKLY;BYDAY=MO;COUNT=5").with_count(2).to_text(), "FREQ=WEEKLY;BYDAY=MO;COUNT=2")
+
+
+class UnsatisfiableRuleTest(unittest.TestCase):
+	"""
+	Reglas que, con su fecha inicial, no tienen ninguna aparición o dejan de tenerlas.
+	"""
+
+	def test_weekday_never_reached_by_interval(self):
+		# Cada 7 días desde un martes siempre cae en martes, nunca en lunes.
+		recurrence = series("FREQ=DAILY;INTERVAL=7;BYDAY=MO")
+		self.assertIsNone(recurrence.next_after(START_TIME))
+		self.assertEqual(list(recurrence.occurrences()), [])
+		self.assertEqual(recurrence.count_until(datetime(2100, 1, 1)), 0)
+
+	def test_empty_series_answer_is_cached(self):
+		recurrence = series("FREQ=DAILY;INTERVAL=14;BYDAY=SA,SU")
+		self.assertIsNone(recurrence.next_after(START_TIME))
+		self.assertIsNone(recurrence.next_after(datetime(2030, 1, 1)))
+
+	def test_missing_fifth_weekday(self):
+		# Cada cuatro años desde febrero de 2023 nunca se llega a un febrero bisiesto, y sin él no hay quinto lunes.
+		self.assertIsNone(series("FREQ=MONTHLY;INTERVAL=48;BYDAY=5MO", datetime(2023, 2, 1, 9, 0)).next_after(START_TIME))
+
+	def test_rare_fifth_weekday_is_still_found(self):
+		# El 29 de febrero cae en lunes cada 28 años.
+		self.assertEqual(
+			series("FREQ=MONTHLY;INTERVAL=12;BYDAY=5MO", datetime(2023, 2, 1, 9, 0)).next_after(START_TIME),
+			datetime(2044, 2, 29, 9, 0)
+		)
+
+	def test_excluded_dates_do_not_end_the_series(self):
+		recurrence = series("FREQ=DAILY;INTERVAL=7;BYDAY=TU;EXDATE=20240102T0900,20240109T0900")
+		self.assertEqual(recurrence.next_after(datetime(2024, 1, 1)), datetime(2024, 1, 16, 9, 0))
+
+
+if __name__ == "__main__":
+	unittest.main()
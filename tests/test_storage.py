@@ -0,0 +1,303 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Pruebas del almacenamiento en disco (storage.py).
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from recordatorios import snapshot
+from recordatorios.doubles import MemoryStore
+from recordatorios.models import Reminder, Task, parse_time, storage_key
+from recordatorios.storage import BACKEND_MARKER, STORE_FILES, BinaryJournalStore, JournalStore, PersistenceWorker, open_store
+
+START_TIME = datetime(2024, 1, 1, 8, 0)
+
+
+def record(reminder_id, message, minutes=0, **fields):
+	"""
+	Devuelve un recordatorio serializado tal como lo guarda el gestor.
+	"""
+	return Reminder(reminder_id, message, START_TIME + timedelta(minutes=minutes), **fields).to_record()
+
+
+def as_lists(items):
+	"""
+	Devuelve los elementos como listas, que es como vuelven del JSON.
+	"""
+	return [list(item) for item in items]
+
+
+def item_key(item):
+	return storage_key(item[0])
+
+
+def with_text_times(items):
+	"""
+	Devuelve los elementos como listas y con la hora como texto, para comparar lo que devuelve cualquier almacén.
+	"""
+	return [[item[0], parse_time(item[1]).isoformat(' ', 'minutes')] + list(item[2:]) for item in items]
+
+
+# Recordatorios con todas las variantes de campos que guarda el gestor.
+SAMPLE = [
+	record(1, "Tomar la pastilla 💊", recurrence="diario", sound_file="C:\\sonidos\\campana.wav"),
+	record(2, "Llamar a Íñigo", minutes=90, recurrence="diario", tasks=[Task("Buscar el número", True), Task("Llamar")]),
+	record(3, "Estirar", minutes=-30, custom_interval=45, repetitions=2, notification_interval=15),
+	record(40, "Pagar el alquiler", minutes=60 * 24 * 30, recurrence="FREQ=MONTHLY;BYMONTHDAY=31", sound_file="C:\\sonidos\\campana.wav"),
+]
+
+
+class StoreTestCase(unittest.TestCase):
+	"""
+	Base de las pruebas que necesitan una carpeta de configuración vacía.
+	"""
+
+	def setUp(self):
+		folder = tempfile.TemporaryDirectory(prefix="recordatorios-test-")
+		self.addCleanup(folder.cleanup)
+		self.folder = folder.name
+
+	def path(self, name):
+		return os.path.join(self.folder, name)
+
+
+class JournalStoreTest(StoreTestCase):
+
+	def create_store(self, compact_threshold=200):
+		return JournalStore(self.path("recordatorios.json"), self.path("recordatorios.journal"), key=item_key, compact_threshold=compact_threshold)
+
+	def test_journal_is_replayed_over_the_snapshot(self):
+		store = self.create_store()
+		store.compact([record(1, "Uno"), record(2, "Dos")])
+		store.put("tres", record(3, "Tres"))
+		store.put("uno", record(1, "Uno", minutes=30))
+		store.delete("dos")
+		store.append([["put", "cuatro", record(4, "Cuatro")], ["del", "tres"]])
+		reopened = self.create_store()
+		self.assertEqual(reopened.load(), as_lists([record(1, "Uno", minutes=30), record(4, "Cuatro")]))
+		self.assertEqual(reopened.journal_records, 5)
+
+	def test_torn_write_keeps_the_complete_records(self):
+		store = self.create_store()
+		store.compact([record(1, "Uno")])
+		store.put("dos", record(2, "Dos", tasks=[Task("Comprar pan")]))
+		store.put("tres", record(3, "Tres"))
+		# Simulamos un corte de luz en mitad de la última escritura.
+		with open(store.journal_path, 'rb+') as file:
+			file.truncate(os.path.getsize(store.journal_path) - 15)
+		reopened = self.create_store()
+		expected = as_lists([record(1, "Uno"), record(2, "Dos", tasks=[Task("Comprar pan")])])
+		self.assertEqual(reopened.load(), expected)
+		# La carga compacta enseguida, para que lo que se escriba después no quede detrás de la línea dañada.
+		self.assertFalse(os.path.exists(store.journal_path))
+		self.assertEqual(reopened.journal_records, 0)
+		reopened.put("cuatro", record(4, "Cuatro"))
+		self.assertEqual(self.create_store().load(), expected + as_lists([record(4, "Cuatro")]))
+
+	def test_compaction_replaces_snapshot_and_journal(self):
+		store = self.create_store(compact_threshold=3)
+		store.compact([])
+		for index in range(3):
+			self.assertFalse(store.needs_compaction)
+			store.put("r{}".format(index), record(index, "R{}".format(index)))
+		self.assertTrue(store.needs_compaction)
+		items = store.load()
+		store.compact(items)
+		self.assertFalse(store.needs_compaction)
+		self.assertFalse(os.path.exists(store.journal_path))
+		self.assertFalse(os.path.exists(store.snapshot_path + ".tmp"))
+		reopened = self.create_store(compact_threshold=3)
+		self.assertEqual(reopened.load(), items)
+		self.assertEqual(reopened.journal_records, 0)
+
+	def test_missing_files_load_empty(self):
+		self.assertEqual(self.create_store().load(), [])
+
+
+class RecordingStore(MemoryStore):
+	"""
+	Almacén en memoria que anota cada escritura que recibe.
+	"""
+
+	def __init__(self, items=None):
+		super().__init__(items)
+		self.appends = []
+		self.compactions = []
+		self.compaction_due = False
+		self.written = threading.Event()
+
+	@property
+	def needs_compaction(self):
+		return self.compaction_due
+
+	def append(self, records):
+		self.appends.append(records)
+		super().append(records)
+		self.written.set()
+
+	def compact(self, items):
+		self.compactions.append(items)
+		super().compact(items)
+
+
+class PersistenceWorkerTest(unittest.TestCase):
+
+	def create_worker(self, delay=600, items=()):
+		self.store = RecordingStore()
+		worker = PersistenceWorker(self.store, lambda: list(items), delay=delay)
+		self.addCleanup(worker.stop)
+		return worker
+
+	def test_changes_to_one_key_are_reduced_to_the_last(self):
+		worker = self.create_worker()
+		worker.put("uno", record(1, "Uno"))
+		worker.put("dos", record(2, "Dos"))
+		worker.put("uno", record(1, "Uno", minutes=5))
+		worker.flush()
+		# Cada clave se escribe una vez, en el orden de su último cambio.
+		self.assertEqual(self.store.appends, [[["put", "dos", record(2, "Dos")], ["put", "uno", record(1, "Uno", minutes=5)]]])
+
+	def test_delete_then_put_keeps_both(self):
+		worker = self.create_worker()
+		worker.put("uno", record(1, "Uno"))
+		worker.delete("uno")
+		worker.put("uno", record(5, "Uno"))
+		worker.flush()
+		# Como en memoria, el recordatorio vuelve a quedar al final.
+		self.assertEqual(self.store.appends, [[["del", "uno"], ["put", "uno", record(5, "Uno")]]])
+
+	def test_changes_within_the_delay_are_written_together(self):
+		worker = self.create_worker(delay=0.05)
+		with worker.batch():
+			worker.put("uno", record(1, "Uno"))
+			# Aunque el bloque dure más que la ventana de espera, no se escribe nada hasta que termina.
+			self.assertFalse(self.store.written.wait(0.2))
+			worker.put("dos", record(2, "Dos"))
+		self.assertTrue(self.store.written.wait(5))
+		self.assertEqual(len(self.store.appends), 1)
+		self.assertEqual([change[1] for change in self.store.appends[0]], ["uno", "dos"])
+
+	def test_compacts_when_the_store_asks(self):
+		items = [record(1, "Uno")]
+		worker = self.create_worker(items=items)
+		self.store.compaction_due = True
+		worker.put("uno", items[0])
+		worker.flush()
+		self.assertEqual(len(self.store.appends), 1)
+		self.assertEqual(self.store.compactions, [items])
+
+	def test_compact_includes_the_pending_changes(self):
+		items = [record(1, "Uno"), record(2, "Dos")]
+		worker = self.create_worker(items=items)
+		worker.put("dos", items[1])
+		worker.compact()
+		worker.flush()
+		self.assertEqual(self.store.appends, [])
+		self.assertEqual(self.store.compactions, [items])
+
+	def test_stop_writes_the_pending_changes(self):
+		worker = self.create_worker()
+		worker.put("uno", record(1, "Uno"))
+		worker.stop()
+		self.assertEqual(self.store.load(), [record(1, "Uno")])
+
+
+class BinarySnapshotTest(StoreTestCase):
+
+	def test_round_trip(self):
+		# Los formatos anteriores, sin tareas o sin identificador, se leen con los valores por defecto.
+		legacy = [["Antiguo", "2023-12-31 23:59", "semanal", None, None], ["Con tareas", "2024-02-29 12:00", None, None, None, []]]
+		decoded = snapshot.decode(snapshot.encode(SAMPLE + legacy))
+		self.assertTrue(all(isinstance(item[1], datetime) for item in decoded))
+		self.assertEqual(
+			with_text_times(decoded),
+			with_text_times(SAMPLE) + [legacy[0] + [[], None], legacy[1] + [None]]
+		)
+
+	def test_damaged_data_is_rejected(self):
+		data = snapshot.encode(SAMPLE)
+		damaged = bytearray(data)
+		damaged[-3] ^= 0xFF
+		future = snapshot.HEADER.pack(snapshot.MAGIC, snapshot.VERSION + 1, 0, 0, 0)
+		for value in (bytes(damaged), data[:-10], data[:5], b"RIFF" + data[4:], future):
+			with self.assertRaises(snapshot.SnapshotFormatError):
+				snapshot.decode(value)
+
+	def test_store_round_trip_with_journal(self):
+		paths = (self.path("recordatorios.bin"), self.path("recordatorios.bin.journal"))
+		store = BinaryJournalStore(*paths, key=item_key)
+		store.compact(SAMPLE)
+		store.put("estirar", record(3, "Estirar", minutes=15, custom_interval=45))
+		store.delete(storage_key("Llamar a Íñigo"))
+		expected = [SAMPLE[0], record(3, "Estirar", minutes=15, custom_interval=45), SAMPLE[3]]
+		self.assertEqual(with_text_times(BinaryJournalStore(*paths, key=item_key).load()), with_text_times(expected))
+
+
+class OpenStoreTest(StoreTestCase):
+
+	def open(self, backend):
+		store = open_store(self.folder, item_key, backend)
+		self.addCleanup(store.close)
+		return store
+
+	def last_backend(self):
+		with open(self.path(BACKEND_MARKER), 'r', encoding='utf-8') as file:
+			return file.read()
+
+	def test_first_start_without_files(self):
+		store = self.open("sqlite")
+		self.assertEqual(store.load(), [])
+		self.assertEqual(self.last_backend(), "sqlite")
+
+	def test_unknown_backend_falls_back_to_json(self):
+		self.assertIsInstance(self.open("xml"), JournalStore)
+		self.assertEqual(self.last_backend(), "json")
+
+	def test_json_files_are_migrated_and_kept(self):
+		self.open("json").compact(SAMPLE)
+		for backend in ("binary", "sqlite"):
+			self.assertEqual(with_text_times(self.open(backend).load()), with_text_times(SAMPLE), backend)
+			self.assertEqual(self.last_backend(), backend)
+		self.assertTrue(os.path.exists(self.path(STORE_FILES["json"][0])))
+
+	def test_existing_files_without_marker(self):
+		# Instalaciones anteriores a la anotación: si el almacén elegido ya tiene archivos, se usan tal cual.
+		JournalStore(self.path("recordatorios.json"), self.path("recordatorios.journal"), key=item_key).compact(SAMPLE[:1])
+		BinaryJournalStore(self.path("recordatorios.bin"), self.path("recordatorios.bin.journal"), key=item_key).compact(SAMPLE)
+		self.assertEqual(len(self.open("binary").load()), len(SAMPLE))
+
+	def test_switching_back_copies_from_the_last_used_store(self):
+		self.open("json").compact(SAMPLE)
+		binary = self.open("binary")
+		binary.delete(storage_key(SAMPLE[0][0]))
+		binary.put("nuevo", record(9, "Nuevo"))
+		sqlite = self.open("sqlite")
+		sqlite.delete(storage_key(SAMPLE[1][0]))
+		# El JSON aún tiene los recordatorios de antes, pero los que valen son los de SQLite, el último que se usó.
+		expected = with_text_times(SAMPLE[2:] + [record(9, "Nuevo")])
+		self.assertEqual(with_text_times(self.open("json").load()), expected)
+		self.assertEqual(with_text_times(self.open("binary").load()), expected)
+
+	def test_failed_migration_is_retried(self):
+		with open(self.path("recordatorios.json"), 'w', encoding='utf-8') as file:
+			file.write("[[\"Dañado\"")
+		with self.assertRaises(ValueError):
+			open_store(self.folder, item_key, "sqlite")
+		# Queda anotado el almacén de origen, aunque el nuevo ya haya creado su archivo.
+		self.assertEqual(self.last_backend(), "json")
+		self.assertTrue(os.path.exists(self.path("recordatorios.db")))
+		# Los archivos originales siguen ahí; tras repararlos, el siguiente inicio migra desde ellos.
+		JournalStore(self.path("recordatorios.json"), self.path("recordatorios.journal"), key=item_key).compact(SAMPLE)
+		self.assertEqual(with_text_times(self.open("sqlite").load()), with_text_times(SAMPLE))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,83 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Pruebas del texto del tiempo restante (timeformat.py) y de su caché.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from recordatorios.timeformat import TimeRemainingFormatter
+
+START_TIME = datetime(2024, 1, 2, 9, 0)
+
+
+class TodayTest(unittest.TestCase):
+
+	def setUp(self):
+		self.formatter = TimeRemainingFormatter()
+
+	def test_hours_and_minutes(self):
+		self.assertEqual(self.formatter.format(START_TIME + timedelta(hours=5, minutes=30), START_TIME), "en 5 horas, 30 minutos")
+		self.assertEqual(self.formatter.format(START_TIME + timedelta(hours=1, minutes=1), START_TIME), "en 1 hora, 1 minuto")
+
+	def test_seconds_only_when_nothing_else_remains(self):
+		self.assertEqual(self.formatter.format(START_TIME + timedelta(seconds=45), START_TIME), "en 45 segundos")
+		self.assertEqual(self.formatter.format(START_TIME + timedelta(minutes=2, seconds=45), START_TIME), "en 2 minutos")
+
+	def test_now_and_past(self):
+		self.assertEqual(self.formatter.format(START_TIME, START_TIME), "en este momento")
+		self.assertEqual(self.formatter.format(START_TIME - timedelta(minutes=1), START_TIME), "ya ha pasado")
+
+
+class TomorrowTest(unittest.TestCase):
+
+	def setUp(self):
+		self.formatter = TimeRemainingFormatter()
+		self.now = START_TIME.replace(hour=23)
+
+	def test_before_a_full_day(self):
+		self.assertEqual(self.formatter.format(START_TIME + timedelta(days=1, minutes=15), self.now), "en 10 horas, 15 minutos")
+
+	def test_full_days(self):
+		self.assertEqual(self.formatter.format(self.now + timedelta(days=1), self.now), "en 1 día")
+		self.assertEqual(self.formatter.format(self.now + timedelta(days=2, hours=3), self.now), "en 2 días, 3 horas")
+
+	def test_calendar_months(self):
+		# Del 31 de enero al 29 de febrero hay un mes de calendario, aunque solo sean 29 días.
+		now = datetime(2024, 1, 31, 9, 0)
+		self.assertEqual(self.formatter.format(datetime(2024, 2, 29, 9, 0), now), "en 1 mes")
+		self.assertEqual(self.formatter.format(datetime(2025, 3, 1, 9, 0), now), "en 1 año, 1 mes, 1 día")
+
+
+class CacheTest(unittest.TestCase):
+
+	def test_short_differences_are_shared_across_midnight(self):
+		formatter = TimeRemainingFormatter()
+		before = START_TIME.replace(hour=23, minute=50)
+		self.assertEqual(formatter.format(before + timedelta(minutes=20), before), "en 20 minutos")
+		after = before + timedelta(minutes=20)
+		self.assertEqual(formatter.format(after + timedelta(minutes=20, seconds=30), after), "en 20 minutos")
+		self.assertEqual(len(formatter._cache), 1)
+
+	def test_calendar_texts_are_not_reused_after_midnight(self):
+		formatter = TimeRemainingFormatter()
+		# 28 días son un mes el 28 de febrero, pero no pasada la medianoche, ya en marzo.
+		before = datetime(2023, 2, 28, 23, 59)
+		self.assertEqual(formatter.format(before + timedelta(days=28), before), "en 1 mes")
+		after = datetime(2023, 3, 1, 0, 0)
+		self.assertEqual(formatter.format(after + timedelta(days=28), after), "en 28 días")
+		self.assertEqual(len(formatter._cache), 2)
+
+	def test_least_recently_used_text_is_dropped(self):
+		formatter = TimeRemainingFormatter(cache_size=2)
+		for minutes in (1, 2, 1, 3):
+			formatter.format(START_TIME + timedelta(minutes=minutes), START_TIME)
+		self.assertEqual(list(formatter._cache), [60, 180])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,145 @@
+# Recordatorios. complemento para NVDA.
+# Este archivo está cubierto por la Licencia Pública General GNU
+# Consulte el archivo COPYING.txt para obtener más detalles.
+# Copyright (C) 2024 Marco Leija <marcomolinaleija@hotmail.com>
+
+"""
+Pruebas de la rueda de temporizadores (timerwheel.py).
+Las ruedas pequeñas (4 huecos por nivel) obligan a bajar elementos de nivel cada pocos minutos.
+"""
+
+import heapq
+import itertools
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from recordatorios.timerwheel import TimerWheel
+
+START_TIME = datetime(2024, 1, 1, 8, 0)
+
+
+def minutes(count, seconds=0):
+	return START_TIME + timedelta(minutes=count, seconds=seconds)
+
+
+class InsertCancelTest(unittest.TestCase):
+
+	def test_add_within_and_beyond_the_horizon(self):
+		wheel = TimerWheel(START_TIME, slots=4, levels=2)
+		self.assertEqual(wheel.horizon, 16)
+		self.assertTrue(wheel.add("a", minutes(15, 59), "a"))
+		self.assertFalse(wheel.add("b", minutes(16), "b"))
+		self.assertIn("a", wheel)
+		self.assertNotIn("b", wheel)
+		self.assertEqual(len(wheel), 1)
+
+	def test_add_replaces_the_same_key(self):
+		wheel = TimerWheel(START_TIME, slots=4, levels=2)
+		wheel.add("a", minutes(10), "primero")
+		wheel.add("a", minutes(2), "segundo")
+		self.assertEqual(len(wheel), 1)
+		self.assertEqual(wheel.next_due(), minutes(2))
+		self.assertEqual(wheel.pop_due(minutes(15)), ["segundo"])
+
+	def test_past_time_is_delivered_on_the_next_pop(self):
+		wheel = TimerWheel(START_TIME, slots=4, levels=2)
+		self.assertTrue(wheel.add("a", START_TIME - timedelta(hours=3), "a"))
+		self.assertEqual(wheel.pop_due(START_TIME), ["a"])
+		self.assertEqual(len(wheel), 0)
+
+	def test_remove(self):
+		wheel = TimerWheel(START_TIME, slots=4, levels=2)
+		wheel.add("a", minutes(1), "a")
+		wheel.add("b", minutes(9), "b")
+		self.assertTrue(wheel.remove("b"))
+		self.assertFalse(wheel.remove("b"))
+		self.assertFalse(wheel.remove("c"))
+		self.assertEqual(wheel.next_due(), minutes(1))
+		self.assertEqual(wheel.pop_due(minutes(15)), ["a"])
+		self.assertIsNone(wheel.next_due())
+
+	def test_current_minute_waits_for_the_exact_time(self):
+		wheel = TimerWheel(START_TIME, slots=4, levels=2)
+		wheel.add("a", minutes(0, 30), "a")
+		self.assertEqual(wheel.pop_due(minutes(0, 29)), [])
+		self.assertEqual(wheel.pop_due(minutes(0, 30)), ["a"])
+
+
+class CascadeTest(unittest.TestCase):
+
+	def test_items_move_down_and_fire_on_their_minute(self):
+		wheel = TimerWheel(START_TIME, slots=4, levels=3)
+		wheel.add("a", minutes(37, 10), "a")
+		self.assertEqual(wheel._positions["a"][0], 2)
+		levels = []
+		for minute in range(37):
+			self.assertEqual(wheel.pop_due(minutes(minute, 59)), [])
+			levels.append(wheel._positions["a"][0])
+		# Baja al nivel 1 al empezar su vuelta de 16 minutos y al nivel 0 al empezar la de 4.
+		self.assertEqual(levels[31], 2)
+		self.assertEqual(levels[32], 1)
+		self.assertEqual(levels[36], 0)
+		self.assertEqual(wheel.pop_due(minutes(37, 9)), [])
+		self.assertEqual(wheel.pop_due(minutes(37, 10)), ["a"])
+
+	def test_next_due_sees_higher_levels(self):
+		wheel = TimerWheel(START_TIME, slots=4, levels=2)
+		# Desde el minuto 0, el 5 queda en el nivel 1; desde el 3, el 6 entra directamente en el nivel 0.
+		wheel.add("a", minutes(5), "a")
+		wheel.pop_due(minutes(3))
+		wheel.add("b", minutes(6), "b")
+		self.assertEqual((wheel._positions["a"][0], wheel._positions["b"][0]), (1, 0))
+		self.assertEqual(wheel.next_due(), minutes(5))
+
+	def test_long_jump_collects_everything(self):
+		wheel = TimerWheel(START_TIME, slots=4, levels=2)
+		for minute in range(16):
+			wheel.add(minute, minutes(15 - minute), minute)
+		self.assertEqual(wheel.pop_due(minutes(60)), list(range(15, -1, -1)))
+		self.assertEqual(len(wheel), 0)
+		self.assertTrue(wheel.add("a", minutes(70), "a"))
+
+
+class HeapOrderTest(unittest.TestCase):
+	"""
+	Con altas, bajas y avances al azar, la rueda entrega lo mismo y en el mismo orden que un montículo.
+	"""
+
+	def test_matches_a_heap(self):
+		rng = random.Random(25)
+		for slots, levels in ((4, 3), (8, 2), (64, 2)):
+			wheel = TimerWheel(START_TIME, slots=slots, levels=levels)
+			heap = []
+			live = {}
+			counter = itertools.count()
+			now = START_TIME
+			for step in range(2000):
+				action = rng.random()
+				if action < 0.5:
+					key = rng.randrange(200)
+					when = now + timedelta(seconds=rng.randrange(-120, 60 * (wheel.horizon - 2)))
+					self.assertTrue(wheel.add(key, when, (when, key)))
+					live[key] = (when, next(counter))
+					heapq.heappush(heap, (when, live[key][1], key))
+				elif action < 0.65:
+					key = rng.randrange(200)
+					self.assertEqual(wheel.remove(key), live.pop(key, None) is not None)
+				else:
+					now += timedelta(seconds=rng.randrange(0, 60 * slots))
+					expected = []
+					while heap and heap[0][0] <= now:
+						when, sequence, key = heapq.heappop(heap)
+						if live.get(key) == (when, sequence):
+							del live[key]
+							expected.append((when, key))
+					fired = wheel.pop_due(now)
+					self.assertEqual(sorted(fired), sorted(expected))
+					# Mismo orden por hora; los empates pueden salir en cualquier orden.
+					self.assertEqual([when for when, key in fired], [when for when, key in expected])
+				self.assertEqual(len(wheel), len(live))
+				self.assertEqual(wheel.next_due(), min((when for when, sequence in live.values()), default=None))
+
+
+if __name__ == "__main__":
+	unittest.main()